@@ -0,0 +1,105 @@
+"""
+Benchmark the NumPy indicator engine against stockstats.wrap on ten years of
+synthetic daily bars.
+
+Usage:
+    python -m benchmarks.indicator_engine [--bars 2520] [--repeat 20]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+from tradingagents.dataflows.indicators import compute_indicators
+
+INDICATORS = [
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+]
+
+
+def make_bars(n_bars: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_bars)))
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2015-01-02", periods=n_bars).strftime("%Y-%m-%d"),
+            "Open": close * (1 + rng.normal(0, 0.005, n_bars)),
+            "High": close * (1 + rng.uniform(0, 0.02, n_bars)),
+            "Low": close * (1 - rng.uniform(0, 0.02, n_bars)),
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 10_000_000, n_bars),
+        }
+    )
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=2520, help="number of daily bars")
+    parser.add_argument("--repeat", type=int, default=20, help="timing repetitions")
+    args = parser.parse_args()
+
+    data = make_bars(args.bars)
+    close = data["Close"].to_numpy(dtype=np.float64)
+    high = data["High"].to_numpy(dtype=np.float64)
+    low = data["Low"].to_numpy(dtype=np.float64)
+    volume = data["Volume"].to_numpy(dtype=np.float64)
+
+    print(f"{args.bars} bars, best of {args.repeat} runs\n")
+    print(f"{'indicator':<14}{'stockstats ms':>15}{'numpy ms':>12}{'speedup':>10}{'max rel err':>14}")
+
+    total_ref = total_new = 0.0
+    for indicator in INDICATORS:
+        # stockstats: every tool call wraps a fresh frame and computes the column
+        ref_time = best_of(lambda: wrap(data.copy())[indicator], args.repeat)
+        new_time = best_of(
+            lambda: compute_indicators([indicator], close, high, low, volume),
+            args.repeat,
+        )
+
+        expected = wrap(data.copy())[indicator].to_numpy(dtype=np.float64)
+        actual = compute_indicators([indicator], close, high, low, volume)[indicator]
+        err = np.nanmax(np.abs(expected - actual) / np.maximum(1.0, np.abs(expected)))
+
+        total_ref += ref_time
+        total_new += new_time
+        print(
+            f"{indicator:<14}{ref_time * 1e3:>15.3f}{new_time * 1e3:>12.3f}"
+            f"{ref_time / new_time:>9.1f}x{err:>14.2e}"
+        )
+
+    batch_time = best_of(
+        lambda: compute_indicators(INDICATORS, close, high, low, volume), args.repeat
+    )
+    print(
+        f"\n{'all (sum)':<14}{total_ref * 1e3:>15.3f}{total_new * 1e3:>12.3f}"
+        f"{total_ref / total_new:>9.1f}x"
+    )
+    print(f"{'all (batched)':<14}{'':>15}{batch_time * 1e3:>12.3f}{total_ref / batch_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark scanning a Reddit category with one process against a process pool,
+on a synthetic multi-GB corpus of subreddit JSONL files.
+
+Three timings per worker count:
+- spawn: starting the pool's worker processes, paid once per process
+- cold: first window fetch, which decodes every line to build the date indexes
+- warm: the same fetch again, reading only the window's lines
+
+Usage:
+    python -m benchmarks.reddit_scan [--size-gb 2] [--files 16] [--days 30] [--workers 1 2 4 8]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from tradingagents.dataflows import reddit_index
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.reddit_utils import _get_pool, fetch_top_from_category_window
+
+CATEGORY = "global_news"
+FIRST_POST = 1704067200  # 2024-01-01 UTC
+SPAN_SECONDS = 365 * 24 * 3600
+WORDS = (
+    "market stock rally crash fed rates earnings inflation growth recession "
+    "bond yield oil dollar china europe jobs housing tech energy bank"
+).split()
+
+
+def make_corpus(category_dir: str, size_gb: float, n_files: int, seed: int = 0) -> int:
+    """Write ``n_files`` subreddit files totalling about ``size_gb``. Returns the post count."""
+    rng = random.Random(seed)
+    os.makedirs(category_dir, exist_ok=True)
+    bodies = [" ".join(rng.choices(WORDS, k=rng.randint(20, 300))) for _ in range(1000)]
+    bytes_per_file = size_gb * 1024**3 / n_files
+
+    n_posts = 0
+    for i in range(n_files):
+        path = os.path.join(category_dir, f"subreddit{i:02d}.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            written, j = 0, 0
+            # posts spread evenly over one year, in posting order
+            step = SPAN_SECONDS / max(1, int(bytes_per_file / 1200))
+            while written < bytes_per_file:
+                line = json.dumps(
+                    {
+                        "created_utc": int(FIRST_POST + j * step),
+                        "id": f"s{i}p{j}",
+                        "title": " ".join(rng.choices(WORDS, k=8)).title(),
+                        "selftext": rng.choice(bodies),
+                        "url": f"https://reddit.com/r/subreddit{i:02d}/{j}",
+                        "ups": rng.randint(0, 10000),
+                    }
+                )
+                f.write(line + "\n")
+                written += len(line) + 1
+                j += 1
+        n_posts += j
+    return n_posts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-gb", type=float, default=2.0, help="corpus size")
+    parser.add_argument("--files", type=int, default=16, help="subreddit files")
+    parser.add_argument("--days", type=int, default=30, help="days in the fetched window")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--corpus-dir", default=None, help="reuse or keep the corpus here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = args.corpus_dir or os.path.join(tmp, "reddit_data")
+        category_dir = os.path.join(data_path, CATEGORY)
+        if not os.path.isdir(category_dir):
+            start = time.perf_counter()
+            n_posts = make_corpus(category_dir, args.size_gb, args.files)
+            print(f"wrote {n_posts} posts in {time.perf_counter() - start:.1f} s")
+
+        size = sum(entry.stat().st_size for entry in os.scandir(category_dir))
+        n_files = len(os.listdir(category_dir))
+        print(f"{size / 1024**3:.2f} GB in {n_files} files, {os.cpu_count()} CPUs\n")
+
+        first_day = datetime(2024, 6, 1)
+        start_date = first_day.strftime("%Y-%m-%d")
+        end_date = (first_day + timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+
+        results, baseline = [], None
+        for workers in args.workers:
+            # a fresh cache and no loaded indexes, so the cold fetch builds every
+            # index again (each worker count gets its own newly spawned pool)
+            set_config({"data_cache_dir": os.path.join(tmp, f"cache-{workers}")})
+            reddit_index._indexes.clear()
+
+            start = time.perf_counter()
+            if workers > 1:
+                list(_get_pool(workers).map(abs, range(4 * workers)))
+            spawn = time.perf_counter() - start
+
+            start = time.perf_counter()
+            fetch_top_from_category_window(
+                CATEGORY, start_date, end_date, 10 * n_files, data_path=data_path, workers=workers
+            )
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            top = fetch_top_from_category_window(
+                CATEGORY, start_date, end_date, 10 * n_files, data_path=data_path, workers=workers
+            )
+            warm = time.perf_counter() - start
+            # the merged top posts must not depend on how the files were spread
+            baseline = baseline or top
+            assert top == baseline, f"{workers} workers returned different posts"
+            results.append(
+                (workers, spawn, cold, warm, sum(len(posts) for posts in top.values()))
+            )
+
+    print(f"{'workers':>8}{'spawn s':>9}{'cold s':>10}{'speedup':>9}{'warm ms':>10}{'posts':>8}")
+    for workers, spawn, cold, warm, n_top in results:
+        print(
+            f"{workers:>8}{spawn:>9.2f}{cold:>10.2f}{results[0][2] / cold:>8.1f}x"
+            f"{warm * 1e3:>10.1f}{n_top:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark point-in-time SimFin lookups for many (ticker, date) pairs: the
+per-call path against the batched as-of merge of the per-ticker store.
+
+A synthetic bulk file is written to a temporary data directory. Three paths
+are timed:
+- legacy: read the bulk CSV and filter with Publish Date <= date / idxmax, per query
+- per-call: get_latest_simfin_statement on the per-ticker store, per query
+- batched: get_latest_simfin_statements_batch for all queries at once
+
+Usage:
+    python -m benchmarks.simfin_asof [--tickers 500] [--quarters 40] [--queries 2000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.simfin_store import (
+    get_latest_simfin_statement,
+    get_latest_simfin_statements_batch,
+    get_simfin_csv_path,
+)
+
+STATEMENT = "income_statements"
+FREQ = "quarterly"
+
+
+def make_bulk_file(path: str, n_tickers: int, n_quarters: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    tickers = [f"T{i:04d}" for i in range(n_tickers)]
+    report = pd.date_range("2014-03-31", periods=n_quarters, freq="QE")
+
+    ticker_col = np.repeat(tickers, n_quarters)
+    report_col = pd.DatetimeIndex(np.tile(report, n_tickers))
+    publish_col = report_col + pd.to_timedelta(rng.integers(20, 60, len(report_col)), unit="D")
+    data = pd.DataFrame(
+        {
+            "Ticker": ticker_col,
+            "SimFinId": np.repeat(np.arange(n_tickers), n_quarters),
+            "Currency": "USD",
+            "Fiscal Year": report_col.year,
+            "Report Date": report_col.strftime("%Y-%m-%d"),
+            "Publish Date": publish_col.strftime("%Y-%m-%d"),
+        }
+    )
+    for column in ("Revenue", "Gross Profit", "Operating Income (Loss)", "Net Income"):
+        data[column] = rng.normal(1e9, 1e8, len(data))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data.sample(frac=1.0, random_state=seed).to_csv(path, sep=";", index=False)
+    return tickers
+
+
+def legacy_lookup(csv_path: str, ticker: str, curr_date: str):
+    """The original per-call implementation of the SimFin tools."""
+    df = pd.read_csv(csv_path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    if filtered_df.empty:
+        return None
+    return filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, default=500, help="companies in the bulk file")
+    parser.add_argument("--quarters", type=int, default=40, help="statements per company")
+    parser.add_argument("--queries", type=int, default=2000, help="(ticker, date) pairs")
+    parser.add_argument("--legacy-queries", type=int, default=5, help="queries timed on the legacy path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "data")
+        set_config({"data_dir": data_dir, "data_cache_dir": os.path.join(tmp, "cache")})
+        csv_path = get_simfin_csv_path(data_dir, STATEMENT, FREQ)
+        tickers = make_bulk_file(csv_path, args.tickers, args.quarters)
+
+        rng = np.random.default_rng(1)
+        query_tickers = list(rng.choice(tickers, args.queries))
+        query_dates = list(
+            (pd.Timestamp("2014-01-01") + pd.to_timedelta(rng.integers(0, 3650, args.queries), unit="D"))
+            .strftime("%Y-%m-%d")
+        )
+
+        start = time.perf_counter()
+        get_latest_simfin_statement(data_dir, STATEMENT, FREQ, tickers[0], "2020-01-01")
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for ticker, date in zip(query_tickers[: args.legacy_queries], query_dates):
+            legacy_lookup(csv_path, ticker, date)
+        legacy_time = (time.perf_counter() - start) / args.legacy_queries
+
+        start = time.perf_counter()
+        expected = [
+            get_latest_simfin_statement(data_dir, STATEMENT, FREQ, ticker, date)
+            for ticker, date in zip(query_tickers, query_dates)
+        ]
+        per_call_time = (time.perf_counter() - start) / args.queries
+
+        start = time.perf_counter()
+        batch = get_latest_simfin_statements_batch(
+            data_dir, STATEMENT, FREQ, query_tickers, query_dates
+        )
+        batch_time = (time.perf_counter() - start) / args.queries
+
+        mismatches = sum(
+            (row is None) != pd.isna(batch["Publish Date"].iloc[i])
+            or (row is not None and row["Publish Date"] != batch["Publish Date"].iloc[i])
+            for i, row in enumerate(expected)
+        )
+
+    print(f"{args.tickers} tickers x {args.quarters} statements, {args.queries} queries")
+    print(f"store build (one-time): {build_time * 1e3:10.1f} ms\n")
+    print(f"{'path':<10}{'us / query':>14}{'speedup':>10}")
+    for name, per_query in (
+        ("legacy", legacy_time),
+        ("per-call", per_call_time),
+        ("batched", batch_time),
+    ):
+        print(f"{name:<10}{per_query * 1e6:>14.1f}{legacy_time / per_query:>9.1f}x")
+    print(f"\nmismatches between per-call and batched results: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 import datetime
+import os
 import typer
 from pathlib import Path
 from functools import wraps
@@ -22,6 +23,9 @@ from rich.rule import Rule
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.indicator_cube import build_indicator_cube
+from tradingagents.dataflows.finnhub_store import import_finnhub_data
 from cli.models import AnalystType
 from cli.utils import *
 
@@ -1096,10 +1100,77 @@ def run_analysis():
         update_display(layout)
 
 
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    # `python -m cli.main` without a subcommand runs the analysis, as before
+    # the maintenance subcommands were added
+    if ctx.invoked_subcommand is None:
+        run_analysis()
+
+
 @app.command()
 def analyze():
     run_analysis()
 
 
+@app.command("build-cube")
+def build_cube(
+    tickers: Optional[List[str]] = typer.Argument(
+        None, help="Tickers to build (default: every ticker with offline price data)"
+    ),
+    data_dir: Optional[str] = typer.Option(
+        None, "--data-dir", help="Offline data directory (default: config data_dir)"
+    ),
+):
+    """Build or incrementally refresh the precomputed indicator cube for backtests."""
+    config = DEFAULT_CONFIG.copy()
+    if data_dir:
+        config["data_dir"] = data_dir
+    set_config(config)
+
+    with console.status("[bold green]Building indicator cube..."):
+        statuses = build_indicator_cube(
+            os.path.join(config["data_dir"], "market_data", "price_data"),
+            tickers or None,
+        )
+
+    table = Table(title="Indicator Cube", box=box.ROUNDED)
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Status")
+    colors = {"added": "green", "updated": "yellow", "unchanged": "dim", "missing": "red"}
+    for ticker, status in statuses.items():
+        table.add_row(ticker, f"[{colors[status]}]{status}[/{colors[status]}]")
+    console.print(table)
+
+
+@app.command("import-finnhub")
+def import_finnhub(
+    tickers: Optional[List[str]] = typer.Argument(
+        None, help="Tickers to import (default: every ticker with Finnhub data)"
+    ),
+    data_dir: Optional[str] = typer.Option(
+        None, "--data-dir", help="Offline data directory (default: config data_dir)"
+    ),
+):
+    """Import the Finnhub JSON files into the SQLite store used by the offline tools."""
+    config = DEFAULT_CONFIG.copy()
+    if data_dir:
+        config["data_dir"] = data_dir
+    set_config(config)
+
+    with console.status("[bold green]Importing Finnhub data..."):
+        statuses = import_finnhub_data(config["data_dir"], tickers or None)
+
+    table = Table(title="Finnhub Store", box=box.ROUNDED)
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Data Type")
+    table.add_column("Status")
+    colors = {"added": "green", "updated": "yellow", "unchanged": "dim"}
+    for (ticker, data_type, period), status in statuses.items():
+        kind = f"{data_type} ({period})" if period else data_type
+        table.add_row(ticker, kind, f"[{colors[status]}]{status}[/{colors[status]}]")
+    console.print(table)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,14 @@
+import pytest
+
+from tradingagents.dataflows.config import get_config, set_config
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Point data_dir and data_cache_dir at a fresh directory for one test."""
+    previous = get_config()
+    data = tmp_path / "data"
+    data.mkdir()
+    set_config({"data_dir": str(data), "data_cache_dir": str(tmp_path / "cache")})
+    yield str(data)
+    set_config(previous)
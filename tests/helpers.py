@@ -0,0 +1,158 @@
+"""Synthetic data in the layouts the offline tools read."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+PRICE_FILE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+
+
+def make_price_frame(n_bars: int = 400, seed: int = 0, start: str = "2023-01-02") -> pd.DataFrame:
+    """Random-walk daily bars with the columns of a YFin CSV, one per business day."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n_bars))
+    spread = rng.uniform(0.2, 2.0, n_bars)
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range(start, periods=n_bars).strftime("%Y-%m-%d"),
+            "Open": close + rng.normal(0, 0.5, n_bars),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Adj Close": close * 0.98,
+            "Volume": rng.integers(100_000, 1_000_000, n_bars),
+        }
+    )
+
+
+def write_price_csv(data_dir: str, symbol: str, frame: pd.DataFrame) -> str:
+    """Write ``frame`` as the offline YFin CSV of ``symbol``. Returns its path."""
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    os.makedirs(price_dir, exist_ok=True)
+    path = os.path.join(price_dir, PRICE_FILE.format(symbol=symbol))
+    frame.to_csv(path, index=False)
+    return path
+
+
+SIMFIN_FILES = {"balance_sheet": "balance", "cash_flow": "cashflow", "income_statements": "income"}
+
+
+def make_simfin_frame(tickers=("AAA", "BBB"), n_periods: int = 12, seed: int = 0, freq: str = "quarterly") -> pd.DataFrame:
+    """
+    SimFin-style statements of ``tickers``, one per period, published 20-60 days
+    after the report date, with the columns the ratio and statement tools read.
+    """
+    rng = np.random.default_rng(seed)
+    months = 3 if freq == "quarterly" else 12
+    rows = []
+    for ticker in tickers:
+        for i in range(n_periods):
+            report = pd.Timestamp("2018-03-31") + pd.offsets.MonthEnd(months * i)
+            publish = report + pd.Timedelta(days=int(rng.integers(20, 60)))
+            rows.append(
+                {
+                    "Ticker": ticker,
+                    "SimFinId": sum(map(ord, ticker)),
+                    "Currency": "USD",
+                    "Fiscal Year": report.year,
+                    "Fiscal Period": f"Q{(report.month - 1) // 3 + 1}" if freq == "quarterly" else "FY",
+                    "Report Date": report.strftime("%Y-%m-%d"),
+                    "Publish Date": publish.strftime("%Y-%m-%d"),
+                    "Restated Date": publish.strftime("%Y-%m-%d"),
+                    "Shares (Basic)": int(rng.integers(90, 110)) * 1_000_000,
+                    "Revenue": rng.normal(1e9, 1e8),
+                    "Gross Profit": rng.normal(4e8, 5e7),
+                    "Operating Income (Loss)": rng.normal(2e8, 5e7),
+                    "Net Income": rng.normal(1e8, 5e7),
+                    "Total Assets": rng.normal(5e9, 1e8),
+                    "Total Liabilities": rng.normal(3e9, 1e8),
+                    "Total Equity": rng.normal(2e9, 1e8),
+                    "Total Current Assets": rng.normal(2e9, 1e8),
+                    "Total Current Liabilities": rng.normal(1e9, 1e8),
+                    "Long Term Debt": rng.normal(1e9, 1e8),
+                    "Cash, Cash Equivalents & Short Term Investments": rng.normal(1e9, 1e8),
+                    "Net Cash from Operating Activities": rng.normal(2e8, 5e7),
+                    "Change in Fixed Assets & Intangibles": -abs(rng.normal(5e7, 1e7)),
+                    "Dividends Paid": -abs(rng.normal(1e7, 1e6)),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def write_simfin_csv(data_dir: str, statement: str, freq: str, frame: pd.DataFrame) -> str:
+    """Write ``frame`` as a SimFin bulk file, rows shuffled as in the download. Returns its path."""
+    directory = os.path.join(data_dir, "fundamental_data", "simfin_data_all", statement, "companies", "us")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"us-{SIMFIN_FILES[statement]}-{freq}.csv")
+    frame.sample(frac=1, random_state=1).to_csv(path, sep=";", index=False)
+    return path
+
+
+def make_finnhub_days(start: str = "2023-01-01", end: str = "2023-12-31", seed: int = 0) -> dict:
+    """Formatted Finnhub insider transactions: date -> entries, many days empty, keys unsorted."""
+    rng = np.random.default_rng(seed)
+    days = list(pd.date_range(start, end).strftime("%Y-%m-%d"))
+    rng.shuffle(days)
+    names = ["Jane Doe", "John Roe", "Ann Poe"]
+    data = {}
+    for day in days:
+        entries = [
+            {
+                "filingDate": day,
+                "name": names[int(rng.integers(len(names)))],
+                "change": int(rng.integers(-5000, 5000)),
+                "share": int(rng.integers(10_000, 100_000)),
+                "transactionPrice": round(float(rng.uniform(10, 200)), 2),
+                "transactionCode": str(rng.choice(["S", "P", "M"])),
+            }
+            for _ in range(int(rng.integers(0, 3)))
+        ]
+        # the formatted files repeat a filing on the days around it
+        data[day] = entries + entries[:1]
+    return data
+
+
+def write_finnhub_json(data_dir: str, ticker: str, data_type: str, data: dict, period: str = None) -> str:
+    """Write ``data`` as a formatted Finnhub file. Returns its path."""
+    directory = os.path.join(data_dir, "finnhub_data", data_type)
+    os.makedirs(directory, exist_ok=True)
+    name = f"{ticker}_{period}_data_formatted.json" if period else f"{ticker}_data_formatted.json"
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return path
+
+
+REDDIT_WORDS = (
+    "market stock apple microsoft nvidia rally crash fed rates earnings tesla google "
+    "amazon meta intel growth inflation square squarespace visa $V $VOO $X xbox"
+).split()
+
+
+def write_reddit_jsonl(path: str, n_posts: int = 600, seed: int = 0, start: int = 1704067200) -> str:
+    """
+    Subreddit dump of ``n_posts`` posts a few minutes apart from ``start`` (UTC
+    seconds), with some posts out of order and some blank lines. Returns its path.
+    """
+    rng = np.random.default_rng(seed)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    created = start
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n_posts):
+            created += int(rng.integers(0, 1800))
+            late = int(rng.integers(0, 200_000)) if rng.random() < 0.05 else 0
+            post = {
+                "created_utc": created - late,
+                "id": f"p{i}",
+                "title": " ".join(rng.choice(REDDIT_WORDS, 6)).title(),
+                "selftext": " ".join(rng.choice(REDDIT_WORDS, int(rng.integers(0, 20)))),
+                "url": f"https://reddit.com/{i}",
+                # few distinct scores, so ties between posts are common
+                "ups": int(rng.integers(0, 50)),
+            }
+            f.write(json.dumps(post) + "\n")
+            if rng.random() < 0.02:
+                f.write("\n")
+    return path
@@ -0,0 +1,50 @@
+import os
+
+from tradingagents.dataflows.data_manifest import get_data_manifest
+from tests.helpers import make_price_frame, write_price_csv
+
+
+def test_price_files_are_indexed_with_their_range(data_dir):
+    path = write_price_csv(data_dir, "AAA", make_price_frame(20))
+    entry = get_data_manifest(data_dir).lookup("AAA", "price")
+    assert entry.path == path
+    assert entry.covered_range() == ("2015-01-01", "2025-03-25")
+    assert get_data_manifest(data_dir).lookup("BBB", "price") is None
+
+
+def test_unnamed_range_is_read_from_the_csv(data_dir):
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    os.makedirs(price_dir)
+    frame = make_price_frame(20)
+    frame.to_csv(os.path.join(price_dir, "AAA-YFin-data.csv"), index=False)
+
+    entry = get_data_manifest(data_dir).lookup("AAA", "price")
+    assert entry.covered_range() == (frame["Date"].iloc[0], frame["Date"].iloc[-1])
+
+
+def test_new_files_are_picked_up(data_dir):
+    write_price_csv(data_dir, "AAA", make_price_frame(20))
+    assert get_data_manifest(data_dir).tickers("price") == ["AAA"]
+
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    newer = os.path.join(price_dir, "AAA-YFin-data-2015-01-01-2026-01-30.csv")
+    make_price_frame(30).to_csv(newer, index=False)
+    write_price_csv(data_dir, "BBB", make_price_frame(20))
+    os.utime(price_dir, (0, os.stat(price_dir).st_mtime + 10))
+
+    manifest = get_data_manifest(data_dir)
+    assert manifest.tickers("price") == ["AAA", "BBB"]
+    assert manifest.path("AAA", "price") == newer
+
+
+def test_finnhub_files_are_indexed_by_directory(data_dir):
+    insider_dir = os.path.join(data_dir, "finnhub_data", "insider_trans")
+    os.makedirs(insider_dir)
+    for name in ("AAA_data_formatted.json", "AAA_annual_data_formatted.json"):
+        open(os.path.join(insider_dir, name), "w").close()
+
+    manifest = get_data_manifest(data_dir)
+    assert manifest.path("AAA", "insider_trans").endswith("AAA_data_formatted.json")
+    assert manifest.path("AAA", "insider_trans", "annual").endswith(
+        "AAA_annual_data_formatted.json"
+    )
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from tradingagents.dataflows.finnhub_store import (
+    get_finnhub_store_path,
+    import_finnhub_data,
+    query_finnhub_store,
+)
+from tradingagents.dataflows.finnhub_utils import get_data_in_range
+from tests.helpers import make_finnhub_days, write_finnhub_json
+from tests.test_finnhub_utils import RANGES, baseline_range
+
+
+@pytest.fixture
+def imported(data_dir):
+    paths = {
+        "AAA": write_finnhub_json(data_dir, "AAA", "insider_trans", make_finnhub_days(seed=5)),
+        "BBB": write_finnhub_json(data_dir, "BBB", "insider_trans", make_finnhub_days(seed=6)),
+    }
+    statuses = import_finnhub_data(data_dir)
+    assert statuses == {
+        ("AAA", "insider_trans", None): "added",
+        ("BBB", "insider_trans", None): "added",
+    }
+    return paths
+
+
+@pytest.mark.parametrize("start_date, end_date", RANGES)
+def test_store_matches_full_scan(data_dir, imported, start_date, end_date):
+    for ticker, path in imported.items():
+        stored = query_finnhub_store(
+            get_finnhub_store_path(), ticker, "insider_trans", start_date, end_date
+        )
+        expected = baseline_range(path, start_date, end_date)
+        assert stored == expected
+        assert list(stored) == sorted(expected)
+        assert get_data_in_range(ticker, start_date, end_date, "insider_trans", data_dir) == expected
+
+
+def test_reimport_skips_unchanged_files(data_dir, imported):
+    path = write_finnhub_json(data_dir, "AAA", "insider_trans", make_finnhub_days(seed=7))
+    os.utime(path, (0, os.stat(path).st_mtime + 10))
+    assert import_finnhub_data(data_dir) == {
+        ("AAA", "insider_trans", None): "updated",
+        ("BBB", "insider_trans", None): "unchanged",
+    }
+    stored = query_finnhub_store(get_finnhub_store_path(), "AAA", "insider_trans", "2023-01-01", "2023-12-31")
+    assert stored == baseline_range(path, "2023-01-01", "2023-12-31")
+
+
+def test_file_changed_after_import_is_read_from_disk(data_dir, imported):
+    path = write_finnhub_json(data_dir, "AAA", "insider_trans", make_finnhub_days(seed=8))
+    os.utime(path, (0, os.stat(path).st_mtime + 10))
+
+    store_path = get_finnhub_store_path()
+    mtime = os.path.getmtime(path)
+    assert query_finnhub_store(store_path, "AAA", "insider_trans", "2023-01-01", "2023-12-31", None, mtime) is None
+    data = get_data_in_range("AAA", "2023-01-01", "2023-12-31", "insider_trans", data_dir)
+    assert data == baseline_range(path, "2023-01-01", "2023-12-31")
+
+
+def test_store_answers_after_the_file_is_removed(data_dir, imported):
+    expected = baseline_range(imported["BBB"], "2023-02-01", "2023-02-28")
+    os.remove(imported["BBB"])
+    assert get_data_in_range("BBB", "2023-02-01", "2023-02-28", "insider_trans", data_dir) == expected
+
+
+def test_unknown_ticker_is_not_in_the_store(data_dir, imported):
+    assert query_finnhub_store(get_finnhub_store_path(), "ZZZ", "insider_trans", "2023-01-01", "2023-12-31") is None
@@ -0,0 +1,59 @@
+import json
+import os
+
+import pytest
+
+from tradingagents.dataflows.finnhub_utils import get_data_in_range
+from tests.helpers import make_finnhub_days, write_finnhub_json
+
+RANGES = [
+    ("2023-01-01", "2023-12-31"),
+    ("2023-03-05", "2023-03-19"),
+    ("2022-12-01", "2023-01-03"),
+    ("2023-06-10", "2023-06-10"),
+    ("2024-01-01", "2024-02-01"),
+    ("2023-05-01", "2023-04-01"),
+]
+
+
+def baseline_range(data_path, start_date, end_date):
+    """get_data_in_range before the cache: scan every key of the JSON file."""
+    with open(data_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        key: value
+        for key, value in data.items()
+        if start_date <= key <= end_date and len(value) > 0
+    }
+
+
+@pytest.mark.parametrize("start_date, end_date", RANGES)
+def test_range_matches_full_scan(data_dir, start_date, end_date):
+    path = write_finnhub_json(data_dir, "AAA", "insider_trans", make_finnhub_days())
+    data = get_data_in_range("AAA", start_date, end_date, "insider_trans", data_dir)
+
+    expected = baseline_range(path, start_date, end_date)
+    assert data == expected
+    assert list(data) == sorted(expected)
+
+
+def test_period_files_are_separate(data_dir):
+    write_finnhub_json(data_dir, "AAA", "fin_as_reported", make_finnhub_days(seed=1), "annual")
+    path = write_finnhub_json(data_dir, "AAA", "fin_as_reported", make_finnhub_days(seed=2), "quarterly")
+    data = get_data_in_range("AAA", "2023-01-01", "2023-06-30", "fin_as_reported", data_dir, "quarterly")
+    assert data == baseline_range(path, "2023-01-01", "2023-06-30")
+
+
+def test_changed_file_is_read_again(data_dir):
+    path = write_finnhub_json(data_dir, "AAA", "insider_trans", make_finnhub_days(seed=3))
+    get_data_in_range("AAA", "2023-01-01", "2023-12-31", "insider_trans", data_dir)
+
+    write_finnhub_json(data_dir, "AAA", "insider_trans", make_finnhub_days(seed=4))
+    os.utime(path, (0, os.stat(path).st_mtime + 10))
+    data = get_data_in_range("AAA", "2023-01-01", "2023-12-31", "insider_trans", data_dir)
+    assert data == baseline_range(path, "2023-01-01", "2023-12-31")
+
+
+def test_missing_file_raises(data_dir):
+    with pytest.raises(FileNotFoundError):
+        get_data_in_range("ZZZ", "2023-01-01", "2023-12-31", "insider_trans", data_dir)
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+
+from tradingagents.dataflows.frame_cache import FrameCache
+from tradingagents.dataflows.price_store import _read_price_frame, append_price_records, records_from_frame
+from tests.helpers import make_price_frame
+
+
+def write_store(tmp_path, name, frame):
+    path = str(tmp_path / f"{name}.npy")
+    append_price_records(path, records_from_frame(frame))
+    return path
+
+
+def test_cached_frame_matches_a_fresh_read(tmp_path):
+    path = write_store(tmp_path, "AAA", make_price_frame(50))
+    cache = FrameCache()
+    first = cache.get(path, _read_price_frame)
+    assert cache.get(path, _read_price_frame) is first
+    pd.testing.assert_frame_equal(first, _read_price_frame(path))
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_rewritten_file_is_read_again(tmp_path):
+    frame = make_price_frame(60)
+    path = write_store(tmp_path, "AAA", frame.iloc[:50])
+    cache = FrameCache()
+    cache.get(path, _read_price_frame)
+
+    append_price_records(path, records_from_frame(frame.iloc[50:]))
+    mtime = os.path.getmtime(path)
+    os.utime(path, (mtime + 10, mtime + 10))
+    assert len(cache.get(path, _read_price_frame)) == 60
+    # the stale version was dropped rather than kept alongside
+    assert cache.stats()["entries"] == 1
+
+
+def test_least_recently_used_frame_is_evicted(tmp_path):
+    paths = [write_store(tmp_path, name, make_price_frame(50)) for name in ("A", "B", "C")]
+    one = int(_read_price_frame(paths[0]).memory_usage(index=True, deep=True).sum())
+    cache = FrameCache(max_bytes=2 * one)
+
+    cache.get(paths[0], _read_price_frame)
+    cache.get(paths[1], _read_price_frame)
+    cache.get(paths[0], _read_price_frame)
+    cache.get(paths[2], _read_price_frame)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["entries"] == 2
+    assert stats["bytes"] <= cache.max_bytes
+    cache.get(paths[0], _read_price_frame)
+    assert cache.stats()["hits"] == 2
+
+
+def test_frame_larger_than_the_budget_is_not_kept(tmp_path):
+    path = write_store(tmp_path, "AAA", make_price_frame(50))
+    cache = FrameCache(max_bytes=10)
+    assert len(cache.get(path, _read_price_frame)) == 50
+    assert cache.stats()["entries"] == 0
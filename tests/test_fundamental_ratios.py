@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.fundamental_ratios import _split_ratios, compute_fundamental_ratios
+from tests.helpers import make_price_frame, make_simfin_frame, write_price_csv, write_simfin_csv
+
+DATES = ["2018-01-15", "2019-07-01", "2020-06-30", "2021-05-10", "2021-10-01", "2022-12-30", "2023-10-02"]
+
+# a restatement of FY2021 and, after FY2022 is out, one of FY2020
+RESTATEMENTS = [("2021-03-31", "2021-09-01", 1.2), ("2020-03-31", "2022-09-01", 0.8)]
+
+
+def annual_frame():
+    frame = make_simfin_frame(("AAA", "BBB"), n_periods=6, seed=2, freq="annual")
+    restated = []
+    for report, publish, scale in RESTATEMENTS:
+        row = frame[(frame["Ticker"] == "AAA") & (frame["Report Date"] == report)].copy()
+        row["Publish Date"] = publish
+        for name in ("Revenue", "Net Income", "Net Cash from Operating Activities"):
+            row[name] *= scale
+        restated.append(row)
+    return pd.concat([frame] + restated, ignore_index=True)
+
+
+@pytest.fixture
+def ratio_data(data_dir):
+    annual = annual_frame()
+    quarterly = make_simfin_frame(("AAA", "BBB"), n_periods=24, seed=3)
+    write_simfin_csv(data_dir, "income_statements", "annual", annual)
+    write_simfin_csv(data_dir, "cash_flow", "annual", annual)
+    write_simfin_csv(data_dir, "balance_sheet", "quarterly", quarterly)
+    prices = {
+        symbol: make_price_frame(1500, seed=seed, start="2018-01-01")
+        for seed, symbol in enumerate(("AAA", "BBB"))
+    }
+    for symbol, frame in prices.items():
+        write_price_csv(data_dir, symbol, frame)
+    return data_dir, annual, quarterly, prices
+
+
+def as_of(rows, curr_date):
+    rows = rows.assign(
+        **{
+            "Report Date": pd.to_datetime(rows["Report Date"]),
+            "Publish Date": pd.to_datetime(rows["Publish Date"]),
+        }
+    )
+    return rows[rows["Publish Date"] <= pd.Timestamp(curr_date)]
+
+
+def period(rows, before=None):
+    """Latest version of the latest period (reported before ``before``), or None."""
+    if before is not None:
+        rows = rows[rows["Report Date"] < before]
+    if rows.empty:
+        return None
+    rows = rows[rows["Report Date"] == rows["Report Date"].max()]
+    return rows.loc[rows["Publish Date"].idxmax()]
+
+
+def reference(annual, quarterly, prices, ticker, curr_date):
+    """The ratios computed row by row with pandas, without splits in the share counts."""
+    income = period(as_of(annual[annual["Ticker"] == ticker], curr_date))
+    known = as_of(quarterly[quarterly["Ticker"] == ticker], curr_date)
+    balance = known.loc[known["Publish Date"].idxmax()] if not known.empty else None
+    closes = prices[ticker][prices[ticker]["Date"] <= curr_date]["Close"]
+    price = closes.iloc[-1] if len(closes) else np.nan
+
+    out = {"Price": price}
+    if balance is not None:
+        out["Market Cap"] = price * balance["Shares (Basic)"]
+        debt = balance["Long Term Debt"]
+        out["Debt/Equity"] = debt / balance["Total Equity"]
+        out["Current Ratio"] = balance["Total Current Assets"] / balance["Total Current Liabilities"]
+    if income is not None:
+        out["Gross Margin"] = income["Gross Profit"] / income["Revenue"]
+        out["Net Margin"] = income["Net Income"] / income["Revenue"]
+        if balance is not None:
+            out["P/E"] = out["Market Cap"] / income["Net Income"]
+        prev = period(as_of(annual[annual["Ticker"] == ticker], curr_date), income["Report Date"])
+        if prev is not None:
+            for name, column in (
+                ("Revenue Growth", "Revenue"),
+                ("Net Income Growth", "Net Income"),
+                ("Operating Cash Flow Growth", "Net Cash from Operating Activities"),
+            ):
+                out[name] = (income[column] - prev[column]) / abs(prev[column])
+    return out
+
+
+def test_ratios_match_row_by_row_reference(ratio_data):
+    data_dir, annual, quarterly, prices = ratio_data
+    tickers = [ticker for ticker in ("AAA", "BBB", "ZZZ") for _ in DATES]
+    dates = DATES * 3
+    ratios = compute_fundamental_ratios(data_dir, tickers, dates)
+
+    assert list(ratios.index.get_level_values("Ticker")) == tickers
+    for (ticker, _), row, curr_date in zip(ratios.index, ratios.to_dict("records"), dates):
+        expected = reference(annual, quarterly, prices, ticker, curr_date) if ticker != "ZZZ" else {}
+        for name in ("Price", "Market Cap", "P/E", "Gross Margin", "Net Margin", "Revenue Growth",
+                     "Net Income Growth", "Operating Cash Flow Growth", "Debt/Equity", "Current Ratio"):
+            if name in expected and not np.isnan(expected[name]):
+                assert row[name] == pytest.approx(expected[name], rel=1e-9), (ticker, curr_date, name)
+            else:
+                assert np.isnan(row[name]), (ticker, curr_date, name)
+
+
+def test_restatement_is_compared_with_the_period_before(ratio_data):
+    data_dir, annual, _, _ = ratio_data
+    rows = annual[annual["Ticker"] == "AAA"].set_index(["Report Date", "Publish Date"])["Revenue"]
+    fy2020 = rows.loc["2020-03-31"].iloc[0]
+    fy2021_restated = rows.loc[("2021-03-31", "2021-09-01")]
+
+    ratios = compute_fundamental_ratios(data_dir, ["AAA"], ["2021-10-01"]).iloc[0]
+    assert ratios["Revenue Growth"] == pytest.approx((fy2021_restated - fy2020) / abs(fy2020))
+    assert ratios["Fiscal Year"] == 2021
+
+
+def test_restating_an_older_period_keeps_the_latest_period(ratio_data):
+    data_dir, annual, _, _ = ratio_data
+    rows = annual[annual["Ticker"] == "AAA"].set_index(["Report Date", "Publish Date"])["Revenue"]
+    fy2022 = rows.loc["2022-03-31"].iloc[0]
+    fy2021_restated = rows.loc[("2021-03-31", "2021-09-01")]
+
+    ratios = compute_fundamental_ratios(data_dir, ["AAA"], ["2022-12-30"]).iloc[0]
+    assert ratios["Fiscal Year"] == 2022
+    assert ratios["Revenue Growth"] == pytest.approx((fy2022 - fy2021_restated) / abs(fy2021_restated))
+
+
+def test_split_ratios_ignore_issuance():
+    shares = np.array([100.0, 101.0, 151.5, 303.0, 101.0, 100.0])
+    np.testing.assert_allclose(_split_ratios(shares), [1.0, 1.0, 1.0, 2.0, 1 / 3, 1.0])
+
+
+def test_market_cap_uses_split_adjusted_share_counts(data_dir):
+    quarterly = make_simfin_frame(("AAA",), n_periods=8, seed=4)
+    quarterly["Shares (Basic)"] = [100e6, 100e6, 150e6, 150e6, 300e6, 300e6, 300e6, 300e6]
+    write_simfin_csv(data_dir, "balance_sheet", "quarterly", quarterly)
+    annual = make_simfin_frame(("AAA",), 2, freq="annual")
+    write_simfin_csv(data_dir, "income_statements", "annual", annual)
+    write_simfin_csv(data_dir, "cash_flow", "annual", annual)
+    write_price_csv(data_dir, "AAA", make_price_frame(600, start="2018-01-01"))
+
+    # before the 2:1 split the count is doubled; the 1.5x issuance is kept as is
+    first, issued = quarterly["Publish Date"].iloc[[0, 2]]
+    ratios = compute_fundamental_ratios(data_dir, ["AAA", "AAA"], [first, issued])
+    np.testing.assert_allclose(ratios["Market Cap"] / ratios["Price"], [200e6, 300e6])
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.fundamentals_trend import statement_trend
+from tradingagents.dataflows.simfin_store import get_simfin_statement_history
+from tests.helpers import make_simfin_frame, write_simfin_csv
+
+ITEMS = ["Revenue", "Net Income"]
+
+
+def history(frame):
+    frame = frame.assign(**{"Report Date": pd.to_datetime(frame["Report Date"], utc=True)})
+    return frame.sort_values("Report Date").reset_index(drop=True)
+
+
+def reference_change(values, lag):
+    previous = values.shift(lag)
+    return (values - previous) / previous.abs()
+
+
+def test_quarterly_changes_match_shifted_periods():
+    quarters = history(make_simfin_frame(("AAA",), n_periods=12, seed=5))
+    trend = statement_trend(quarters, ITEMS, "quarterly")
+
+    for item in ITEMS:
+        np.testing.assert_allclose(trend[f"{item} QoQ"], reference_change(quarters[item], 1))
+        np.testing.assert_allclose(trend[f"{item} YoY"], reference_change(quarters[item], 4))
+    assert list(trend.index[:2]) == ["2018 Q1", "2018 Q2"]
+
+
+def test_gaps_in_the_filings_give_no_change():
+    quarters = history(make_simfin_frame(("AAA",), n_periods=12, seed=5))
+    gapped = quarters.drop(index=5).reset_index(drop=True)
+    trend = statement_trend(gapped, ITEMS, "quarterly")
+
+    # the quarter after the gap has no QoQ, and the quarter a year after it no YoY
+    after_gap = trend.index.get_loc("2019 Q3")
+    assert np.isnan(trend["Revenue QoQ"].iloc[after_gap])
+    assert np.isnan(trend["Revenue YoY"].loc["2020 Q2"])
+    expected = reference_change(quarters["Revenue"], 4).iloc[10]
+    assert trend["Revenue YoY"].loc["2020 Q3"] == pytest.approx(expected)
+
+
+def test_annual_statements_only_show_yoy():
+    years = history(make_simfin_frame(("AAA",), n_periods=5, seed=6, freq="annual"))
+    trend = statement_trend(years, ITEMS, "annual", periods=3)
+
+    assert list(trend.index) == ["FY2020", "FY2021", "FY2022"]
+    assert "Revenue QoQ" not in trend.columns
+    np.testing.assert_allclose(trend["Revenue YoY"], reference_change(years["Revenue"], 1).iloc[-3:])
+
+
+def test_tool_reads_history_known_on_the_date(data_dir, monkeypatch):
+    monkeypatch.setattr(interface, "DATA_DIR", data_dir)
+    frame = make_simfin_frame(("AAA",), n_periods=12, seed=7)
+    write_simfin_csv(data_dir, "income_statements", "quarterly", frame)
+
+    curr_date = frame["Publish Date"].iloc[9]
+    report = interface.get_simfin_statement_trend("AAA", "income_statements", "quarterly", curr_date, 4)
+    known = get_simfin_statement_history(data_dir, "income_statements", "quarterly", "AAA", curr_date, 8)
+
+    assert report.startswith(f"## quarterly income statement trend for AAA, last 4 periods released by {curr_date}")
+    table = report.splitlines()[2:]
+    assert len(table) == 2 + 4
+    assert table[-1].startswith(f"| 2020 Q2 | {known['Report Date'].iloc[-1]:%Y-%m-%d} |")
+    assert "Unknown statement" in interface.get_simfin_statement_trend("AAA", "other", "quarterly", curr_date)
+    assert interface.get_simfin_statement_trend("AAA", "income_statements", "quarterly", "2017-01-01") == ""
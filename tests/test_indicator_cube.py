@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+import pytest
+
+from tradingagents.dataflows.indicator_cube import (
+    CUBE_INDICATORS,
+    build_indicator_cube,
+    get_indicator_cube_dir,
+    load_indicator_cube,
+)
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+from tests.helpers import make_price_frame, write_price_csv
+
+
+@pytest.fixture
+def price_dir(data_dir):
+    # the two tickers trade on different days, so the cube's date axis is a union
+    write_price_csv(data_dir, "AAA", make_price_frame(260, seed=11))
+    write_price_csv(data_dir, "BBB", make_price_frame(200, seed=12, start="2023-03-01"))
+    return os.path.join(data_dir, "market_data", "price_data")
+
+
+def test_loading_without_a_cube_creates_nothing(data_dir):
+    assert load_indicator_cube() is None
+    assert not os.path.exists(get_indicator_cube_dir())
+
+
+@pytest.mark.parametrize("indicator", CUBE_INDICATORS)
+def test_cube_window_matches_stockstats_window(price_dir, indicator):
+    assert build_indicator_cube(price_dir) == {"AAA": "added", "BBB": "added"}
+    cube = load_indicator_cube()
+
+    for symbol in ("AAA", "BBB"):
+        assert cube.covers(symbol, indicator, price_dir)
+        window = cube.window(symbol, indicator, "2023-02-15", "2023-07-15")
+        expected = StockstatsUtils.get_stock_stats_window(
+            symbol, indicator, "2023-02-15", "2023-07-15", price_dir
+        )
+        assert list(window.index) == list(expected.index)
+        np.testing.assert_allclose(
+            window.to_numpy(dtype=np.float64),
+            expected.to_numpy(dtype=np.float64),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+
+def test_rebuild_recomputes_only_changed_tickers(data_dir, price_dir):
+    build_indicator_cube(price_dir)
+    assert build_indicator_cube(price_dir) == {"AAA": "unchanged", "BBB": "unchanged"}
+
+    csv_path = write_price_csv(data_dir, "BBB", make_price_frame(220, seed=13, start="2023-03-01"))
+    assert not load_indicator_cube().covers("BBB", "rsi", price_dir)
+    os.utime(csv_path, (0, os.stat(csv_path).st_mtime + 10))
+
+    assert build_indicator_cube(price_dir, ["BBB", "CCC"]) == {"BBB": "updated", "CCC": "missing"}
+    cube = load_indicator_cube()
+    assert cube.covers("AAA", "rsi", price_dir) and cube.covers("BBB", "rsi", price_dir)
+    window = cube.window("BBB", "rsi", "2023-12-01", "2023-12-31")
+    expected = StockstatsUtils.get_stock_stats_window("BBB", "rsi", "2023-12-01", "2023-12-31", price_dir)
+    np.testing.assert_allclose(window.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64))
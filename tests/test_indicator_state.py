@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from tradingagents.dataflows.indicator_state import (
+    IndicatorState,
+    get_state_path,
+    load_indicator_state,
+)
+from tradingagents.dataflows.indicators import compute_indicators
+from tradingagents.dataflows.price_store import append_price_records, records_from_frame
+from tests.helpers import make_price_frame
+
+
+def full_recompute(records):
+    values = compute_indicators(
+        list(IndicatorState.INDICATORS),
+        records["Close"],
+        records["High"],
+        records["Low"],
+        records["Volume"],
+        records["Open"],
+    )
+    return {indicator: series[-1] for indicator, series in values.items()}
+
+
+def assert_matches(state, records):
+    for indicator, expected in full_recompute(records).items():
+        assert state.values[indicator] == pytest.approx(expected, rel=1e-9, abs=1e-9), indicator
+
+
+def test_incremental_updates_match_full_recompute():
+    records = records_from_frame(make_price_frame(450, seed=7))
+    state = IndicatorState.from_records(records[:300])
+    for end in (301, 350, 450):
+        state.update_records(records[state.n_bars : end])
+        assert_matches(state, records[:end])
+
+
+def test_state_survives_a_round_trip():
+    records = records_from_frame(make_price_frame(260, seed=8))
+    state = IndicatorState.from_records(records[:250])
+    restored = IndicatorState.from_dict(state.to_dict())
+    restored.update_records(records[250:])
+    assert_matches(restored, records)
+
+
+def test_appends_advance_the_persisted_state(tmp_path):
+    frame = make_price_frame(320, seed=9)
+    path = str(tmp_path / "AAA.npy")
+    append_price_records(path, records_from_frame(frame.iloc[:300]))
+    records = append_price_records(path, records_from_frame(frame.iloc[300:]))
+
+    state = load_indicator_state(get_state_path(path))
+    assert state.n_bars == 320
+    assert_matches(state, np.array(records))
+
+
+@pytest.mark.parametrize("revise", ["last_consumed", "earlier"])
+def test_revised_bars_reseed_the_state(tmp_path, revise):
+    frame = make_price_frame(502, seed=10)
+    path = str(tmp_path / "AAA.npy")
+    append_price_records(path, records_from_frame(frame.iloc[:500]))
+
+    # an overlapping fetch revises bars the state already consumed
+    first = 499 if revise == "last_consumed" else 480
+    revised = frame.iloc[first:501].copy()
+    revised.loc[revised.index[0], ["High", "Low", "Close"]] *= 1.05
+    append_price_records(path, records_from_frame(revised))
+    records = append_price_records(path, records_from_frame(frame.iloc[501:]))
+
+    assert_matches(load_indicator_state(get_state_path(path)), np.array(records))
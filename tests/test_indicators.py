@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from stockstats import wrap
+
+from tradingagents.dataflows.indicator_state import IndicatorState
+from tradingagents.dataflows.indicators import compute_indicator, compute_indicators
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+from tests.helpers import make_price_frame, write_price_csv
+
+INDICATORS = list(IndicatorState.INDICATORS) + ["close_5_ema", "open_10_sma", "volume_20_sma"]
+
+
+def columns(frame):
+    return [frame[name].to_numpy(dtype=np.float64) for name in ("Close", "High", "Low", "Volume", "Open")]
+
+
+def baseline_value(csv_path, indicator, curr_date):
+    """StockstatsUtils.get_stock_stats before the NumPy engine (offline)."""
+    df = wrap(pd.read_csv(csv_path))
+    df[indicator]
+    rows = df[df["Date"].str.startswith(curr_date)]
+    if rows.empty:
+        return "N/A: Not a trading day (weekend or holiday)"
+    return rows[indicator].values[0]
+
+
+@pytest.mark.parametrize("indicator", INDICATORS)
+def test_engine_matches_stockstats(indicator):
+    frame = make_price_frame(300, seed=3)
+    expected = wrap(frame.copy())[indicator].to_numpy(dtype=np.float64)
+    np.testing.assert_allclose(
+        compute_indicator(indicator, *columns(frame)), expected, rtol=1e-9, atol=1e-9
+    )
+
+
+def test_batch_matches_single_indicators():
+    frame = make_price_frame(120, seed=4)
+    values = compute_indicators(INDICATORS, *columns(frame))
+    for indicator in INDICATORS:
+        np.testing.assert_array_equal(
+            values[indicator], compute_indicator(indicator, *columns(frame))
+        )
+
+
+@pytest.mark.parametrize("indicator", ["rsi", "macd", "boll_ub", "close_50_sma", "mfi", "kdjk"])
+def test_get_stock_stats_matches_baseline(data_dir, indicator):
+    frame = make_price_frame(260, seed=5)
+    csv_path = write_price_csv(data_dir, "AAA", frame)
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+
+    # a mid-history day, the latest bar (served from the incremental state) and a Saturday
+    for curr_date in [frame["Date"][100], frame["Date"].iloc[-1], "2023-06-10"]:
+        value = StockstatsUtils.get_stock_stats("AAA", indicator, curr_date, price_dir)
+        expected = baseline_value(csv_path, indicator, curr_date)
+        if isinstance(expected, str):
+            assert value == expected
+        else:
+            assert value == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_window_matches_per_day_baseline(data_dir):
+    frame = make_price_frame(200, seed=6)
+    csv_path = write_price_csv(data_dir, "AAA", frame)
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+
+    window = StockstatsUtils.get_stock_stats_window(
+        "AAA", "rsi", "2023-05-01", "2023-05-31", price_dir
+    )
+    trading_days = [d for d in frame["Date"] if "2023-05-01" <= d <= "2023-05-31"]
+    assert list(window.index) == trading_days
+    for day, value in window.items():
+        assert value == pytest.approx(baseline_value(csv_path, "rsi", day), rel=1e-9)
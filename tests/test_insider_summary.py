@@ -0,0 +1,76 @@
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.finnhub_utils import get_data_in_range, unique_entries
+from tradingagents.dataflows.insider_summary import (
+    summarize_insider_sentiment,
+    summarize_insider_transactions,
+)
+from tests.helpers import make_finnhub_days, write_finnhub_json
+
+
+def baseline_unique(data):
+    """The dedupe of the insider tools before hashing: scan the entries already seen."""
+    seen_dicts = []
+    for entries in data.values():
+        for entry in entries:
+            if entry not in seen_dicts:
+                seen_dicts.append(entry)
+    return seen_dicts
+
+
+def baseline_transactions(data, ticker, before, curr_date):
+    result_str = "".join(
+        f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+        for entry in baseline_unique(data)
+    )
+    return f"## {ticker} insider transactions from {before} to {curr_date}:\n" + result_str
+
+
+def test_unique_entries_match_list_scan():
+    data = make_finnhub_days(seed=9)
+    # equal values in another key order or numeric type are still repeats
+    data["2023-01-01"] = [
+        {"a": 1, "b": {"x": [1, 2]}},
+        {"b": {"x": [1, 2]}, "a": 1.0},
+        {"a": 1, "b": {"x": [2, 1]}},
+    ]
+    assert unique_entries(data) == baseline_unique(data)
+
+
+def test_transactions_tool_matches_baseline(data_dir, monkeypatch):
+    monkeypatch.setattr(interface, "DATA_DIR", data_dir)
+    write_finnhub_json(data_dir, "AAA", "insider_trans", make_finnhub_days(seed=10))
+
+    report = interface.get_finnhub_company_insider_transactions("AAA", "2023-06-30", 30)
+    data = get_data_in_range("AAA", "2023-05-31", "2023-06-30", "insider_trans", data_dir)
+    assert report.startswith(baseline_transactions(data, "AAA", "2023-05-31", "2023-06-30"))
+    assert "### Summary" not in report
+    assert "### Summary" in interface.get_finnhub_company_insider_transactions("AAA", "2023-06-30", 30, True)
+
+
+def test_transaction_summary_totals():
+    entries = baseline_unique(make_finnhub_days(seed=11))
+    summary = summarize_insider_transactions(entries)
+
+    net_shares = sum(entry["change"] for entry in entries)
+    net_value = sum(entry["change"] * entry["transactionPrice"] for entry in entries)
+    assert summary.splitlines()[0] == (
+        f"- Total: {len(entries)} filings, net shares {net_shares:+,.0f}, net value {net_value:+,.2f}"
+    )
+    for name in {entry["name"] for entry in entries}:
+        assert name in summary
+    assert summarize_insider_transactions([]) == "No insider transactions to summarize."
+
+
+def test_sentiment_summary_statistics():
+    entries = [
+        {"year": 2023, "month": month, "change": change, "mspr": mspr}
+        for month, change, mspr in [(1, 100, 0.5), (2, -300, -20.0), (3, 50, 10.0)]
+    ]
+    lines = summarize_insider_sentiment(entries).splitlines()
+    assert lines == [
+        "- Months: 3 (2023-1 to 2023-3)",
+        "- Net change: -150 (2 months net buying, 1 months net selling)",
+        "- MSPR: mean -3.17, min -20.00, max +10.00, latest +10.00",
+    ]
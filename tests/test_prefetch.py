@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from tradingagents.dataflows import yfin_cache as yc
+from tests.helpers import make_price_frame, write_price_csv
+
+HISTORY = {"AAA": make_price_frame(300, seed=5), "BBB": make_price_frame(300, seed=6)}
+
+
+class FakeBatch:
+    """Batched downloader over fixed histories that logs each call."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    def __call__(self, symbols, start_date, end_date):
+        self.calls.append((list(symbols), start_date, end_date))
+        out = {}
+        for symbol in symbols:
+            frame = self.frames.get(symbol)
+            if frame is not None:
+                dates = frame["Date"]
+                out[symbol] = frame[(dates >= start_date) & (dates <= end_date)]
+        return out
+
+
+@pytest.fixture
+def batch(data_dir, monkeypatch):
+    monkeypatch.setattr(yc, "last_completed_session", lambda: "2030-01-01")
+    return FakeBatch(dict(HISTORY))
+
+
+def covered(symbol):
+    return yc.load_covered_range(yc.get_online_store_path(symbol))
+
+
+def test_prefetch_fills_every_ticker_with_one_download(batch):
+    cached = yc.prefetch_prices(["aaa", "BBB", "AAA"], "2023-02-01", "2023-06-30", batch)
+
+    assert len(batch.calls) == 1
+    assert sorted(batch.calls[0][0]) == ["AAA", "BBB"]
+    for symbol in ("AAA", "BBB"):
+        dates = HISTORY[symbol]["Date"]
+        assert cached[symbol] == dates.between("2023-02-01", "2023-06-30").sum()
+        assert covered(symbol) == {"start": "2023-02-01", "end": "2023-06-30"}
+
+
+def test_prefetch_skips_covered_tickers(batch):
+    yc.prefetch_prices(["AAA"], "2023-02-01", "2023-06-30", batch)
+    yc.prefetch_prices(["AAA", "BBB"], "2023-02-01", "2023-06-30", batch)
+    assert batch.calls[-1][0] == ["BBB"]
+
+    yc.prefetch_prices(["AAA", "BBB"], "2023-02-01", "2023-06-30", batch)
+    assert len(batch.calls) == 2
+
+
+def test_prefetched_bars_match_a_direct_fetch(batch, monkeypatch):
+    yc.prefetch_prices(["AAA"], "2023-02-01", "2023-06-30", batch)
+    monkeypatch.setattr(
+        yc, "download_price_frame", lambda *args: pytest.fail("served from the cache")
+    )
+    records = yc.get_cached_price_records("AAA", "2023-03-01", "2023-05-31")
+    expected = HISTORY["AAA"][HISTORY["AAA"]["Date"].between("2023-02-01", "2023-06-30")]
+    np.testing.assert_allclose(records["Close"], expected["Close"])
+
+
+def test_ticker_missing_from_the_batch_keeps_its_covered_range(batch):
+    yc.prefetch_prices(["AAA", "BBB"], "2023-02-01", "2023-06-30", batch)
+    del batch.frames["BBB"]
+
+    cached = yc.prefetch_prices(["AAA", "BBB"], "2023-02-01", "2023-09-29", batch)
+    assert covered("AAA") == {"start": "2023-02-01", "end": "2023-09-29"}
+    assert covered("BBB") == {"start": "2023-02-01", "end": "2023-06-30"}
+    assert cached["BBB"] == HISTORY["BBB"]["Date"].between("2023-02-01", "2023-06-30").sum()
+
+    # the next prefetch asks for the missing tail again
+    batch.frames["BBB"] = HISTORY["BBB"]
+    yc.prefetch_prices(["AAA", "BBB"], "2023-02-01", "2023-09-29", batch)
+    assert batch.calls[-1][0] == ["BBB"]
+    assert covered("BBB") == {"start": "2023-02-01", "end": "2023-09-29"}
+
+
+def test_unknown_ticker_is_not_cached(batch):
+    cached = yc.prefetch_prices(["AAA", "ZZZZ"], "2023-02-01", "2023-06-30", batch)
+    assert cached["ZZZZ"] == 0
+    assert covered("ZZZZ") is None
+
+
+def test_csv_downloader_matches_the_offline_files(data_dir):
+    price_dir = f"{data_dir}/market_data/price_data"
+    for symbol, frame in HISTORY.items():
+        write_price_csv(data_dir, symbol, frame)
+
+    frames = yc.make_csv_downloader(price_dir)(["AAA", "BBB", "ZZZZ"], "2023-02-01", "2023-06-30")
+    assert sorted(frames) == ["AAA", "BBB"]
+    for symbol, frame in frames.items():
+        expected = HISTORY[symbol][HISTORY[symbol]["Date"].between("2023-02-01", "2023-06-30")]
+        assert list(frame["Date"].dt.strftime("%Y-%m-%d")) == list(expected["Date"])
+        np.testing.assert_allclose(frame["Close"], expected["Close"])
+
+
+def test_prefetch_from_csv_files(data_dir, monkeypatch):
+    monkeypatch.setattr(yc, "last_completed_session", lambda: "2030-01-01")
+    price_dir = f"{data_dir}/market_data/price_data"
+    write_price_csv(data_dir, "AAA", HISTORY["AAA"])
+
+    cached = yc.prefetch_prices(
+        ["AAA"], "2023-02-01", "2023-06-30", yc.make_csv_downloader(price_dir)
+    )
+    assert cached["AAA"] == HISTORY["AAA"]["Date"].between("2023-02-01", "2023-06-30").sum()
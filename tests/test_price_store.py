@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.price_store import (
+    append_price_records,
+    ensure_price_store,
+    get_price_frame,
+    get_price_records,
+    merge_price_records,
+    records_from_frame,
+)
+from tests.helpers import make_price_frame, write_price_csv
+
+
+def baseline_filter(csv_path, start_date, end_date):
+    """get_YFin_data before the price store: filter the CSV on its date strings."""
+    data = pd.read_csv(csv_path)
+    data["DateOnly"] = data["Date"].str[:10]
+    filtered = data[(data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)]
+    return filtered.drop("DateOnly", axis=1).reset_index(drop=True)
+
+
+def test_price_frame_matches_csv_filter(data_dir):
+    csv_path = write_price_csv(data_dir, "AAA", make_price_frame())
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+
+    for start, end in [("2023-01-01", "2024-12-31"), ("2023-03-04", "2023-03-20"), ("2023-06-10", "2023-06-11")]:
+        pd.testing.assert_frame_equal(
+            get_price_frame("AAA", price_dir, start, end), baseline_filter(csv_path, start, end)
+        )
+
+
+def test_records_keep_last_bar_of_duplicate_dates():
+    frame = make_price_frame(5)
+    duplicated = pd.concat([frame, frame.iloc[[2]].assign(Close=1.0)])
+    records = records_from_frame(duplicated)
+
+    assert len(records) == 5
+    assert records["Close"][2] == 1.0
+    assert np.all(np.diff(records["Date"].astype(np.int64)) > 0)
+
+
+def test_store_is_rebuilt_when_csv_changes(data_dir):
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    csv_path = write_price_csv(data_dir, "AAA", make_price_frame(50))
+    assert len(get_price_records("AAA", price_dir)) == 50
+
+    write_price_csv(data_dir, "AAA", make_price_frame(80))
+    stat = os.stat(ensure_price_store("AAA", price_dir))
+    os.utime(csv_path, (stat.st_atime, stat.st_mtime + 10))
+    assert len(get_price_records("AAA", price_dir)) == 80
+
+
+def test_store_is_rebuilt_when_csv_is_replaced_by_an_older_file(data_dir):
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    csv_path = write_price_csv(data_dir, "AAA", make_price_frame(50))
+    store_path = ensure_price_store("AAA", price_dir)
+
+    # a longer history copied in with its original, older mtime
+    write_price_csv(data_dir, "AAA", make_price_frame(80))
+    old = os.stat(store_path).st_mtime - 3600
+    os.utime(csv_path, (old, old))
+    assert len(get_price_records("AAA", price_dir)) == 80
+
+
+def test_store_is_rebuilt_when_csv_moves(data_dir):
+    price_dir = os.path.join(data_dir, "market_data", "price_data")
+    csv_path = write_price_csv(data_dir, "AAA", make_price_frame(50))
+    assert len(get_price_records("AAA", price_dir)) == 50
+
+    moved = csv_path.replace("2025-03-25", "2025-06-30")
+    make_price_frame(60).to_csv(moved, index=False)
+    os.utime(moved, (0, os.stat(csv_path).st_mtime))
+    os.remove(csv_path)
+    assert len(get_price_records("AAA", price_dir)) == 60
+
+
+def test_merge_prefers_new_bars():
+    frame = make_price_frame(10)
+    existing = records_from_frame(frame.iloc[:6])
+    new = records_from_frame(frame.iloc[5:].assign(Close=-1.0))
+    merged = merge_price_records(existing, new)
+
+    assert len(merged) == 10
+    np.testing.assert_array_equal(merged["Close"][:5], existing["Close"][:5])
+    assert np.all(merged["Close"][5:] == -1.0)
+
+
+def test_append_writes_merged_store(data_dir, tmp_path):
+    frame = make_price_frame(30)
+    path = str(tmp_path / "AAA.npy")
+    append_price_records(path, records_from_frame(frame.iloc[:20]))
+    records = append_price_records(path, records_from_frame(frame.iloc[15:]))
+
+    expected = records_from_frame(frame)
+    assert len(records) == 30
+    np.testing.assert_array_equal(records["Date"], expected["Date"])
+    np.testing.assert_allclose(records["Close"], expected["Close"])
@@ -0,0 +1,91 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from tradingagents.dataflows import reddit_index
+from tradingagents.dataflows.reddit_index import (
+    get_reddit_index_path,
+    iter_posts_on,
+    load_reddit_index,
+)
+from tradingagents.dataflows.reddit_utils import fetch_top_from_category
+from tests.helpers import write_reddit_jsonl
+
+DATES = ["2024-01-01", "2024-01-03", "2024-01-05", "2024-01-07", "2024-02-01"]
+
+
+def day_of(post):
+    return datetime.utcfromtimestamp(post["created_utc"]).strftime("%Y-%m-%d")
+
+
+def baseline_posts_on(data_file, date):
+    with open(data_file, "rb") as f:
+        posts = [json.loads(line) for line in f if line.strip()]
+    return [post for post in posts if day_of(post) == date]
+
+
+def baseline_top(category_dir, date, max_limit):
+    """fetch_top_from_category before the index, for a category without a query."""
+    files = os.listdir(category_dir)
+    limit_per_subreddit = max_limit // len(files)
+    all_content = []
+    for data_file in files:
+        if not data_file.endswith(".jsonl"):
+            continue
+        posts = [
+            {
+                "title": post["title"],
+                "content": post["selftext"],
+                "url": post["url"],
+                "upvotes": post["ups"],
+                "posted_date": date,
+            }
+            for post in baseline_posts_on(os.path.join(category_dir, data_file), date)
+        ]
+        posts.sort(key=lambda x: x["upvotes"], reverse=True)
+        all_content.extend(posts[:limit_per_subreddit])
+    return all_content
+
+
+@pytest.fixture
+def reddit_dir(data_dir):
+    root = os.path.join(data_dir, "reddit_data")
+    for seed, name in enumerate(("worldnews", "economics", "news")):
+        write_reddit_jsonl(os.path.join(root, "global_news", f"{name}.jsonl"), seed=seed)
+    reddit_index._indexes.clear()
+    return root
+
+
+@pytest.mark.parametrize("date", DATES)
+def test_posts_on_a_day_match_full_scan(reddit_dir, date):
+    path = os.path.join(reddit_dir, "global_news", "news.jsonl")
+    assert list(iter_posts_on(path, date)) == baseline_posts_on(path, date)
+
+
+@pytest.mark.parametrize("date", DATES)
+def test_top_posts_match_full_scan(reddit_dir, date):
+    category_dir = os.path.join(reddit_dir, "global_news")
+    expected = baseline_top(category_dir, date, 15)
+    assert fetch_top_from_category("global_news", date, 15, data_path=reddit_dir) == expected
+
+
+def test_index_is_reused_from_disk(reddit_dir):
+    path = os.path.join(reddit_dir, "global_news", "news.jsonl")
+    index = load_reddit_index(path)
+    index_path = get_reddit_index_path(path)
+    mtime = os.path.getmtime(index_path)
+
+    reddit_index._indexes.clear()
+    assert load_reddit_index(path).dates == index.dates
+    assert os.path.getmtime(index_path) == mtime
+
+
+def test_index_is_rebuilt_when_the_file_grows(reddit_dir):
+    path = os.path.join(reddit_dir, "global_news", "news.jsonl")
+    load_reddit_index(path)
+    with open(path, "a", encoding="utf-8") as f:
+        post = {"created_utc": 1706745600, "title": "t", "selftext": "", "url": "u", "ups": 1}
+        f.write(json.dumps(post) + "\n")
+    assert list(iter_posts_on(path, "2024-02-01")) == baseline_posts_on(path, "2024-02-01")
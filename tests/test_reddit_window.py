@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from tradingagents.dataflows import reddit_index
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.reddit_utils import fetch_top_from_category_window
+from tests.helpers import write_reddit_jsonl
+from tests.test_reddit_index import baseline_top
+
+
+@pytest.fixture
+def reddit_dir(data_dir):
+    root = os.path.join(data_dir, "reddit_data")
+    for seed, name in enumerate(("worldnews", "economics", "news", "finance")):
+        write_reddit_jsonl(os.path.join(root, "global_news", f"{name}.jsonl"), seed=seed + 10)
+    reddit_index._indexes.clear()
+    return root
+
+
+@pytest.mark.parametrize("max_limit", [4, 10, 40])
+def test_window_matches_one_fetch_per_day(reddit_dir, max_limit):
+    window = fetch_top_from_category_window(
+        "global_news", "2023-12-30", "2024-01-08", max_limit, data_path=reddit_dir
+    )
+    category_dir = os.path.join(reddit_dir, "global_news")
+    assert list(window) == [f"2023-12-{day}" for day in (30, 31)] + [
+        f"2024-01-0{day}" for day in range(1, 9)
+    ]
+    for date, posts in window.items():
+        assert posts == baseline_top(category_dir, date, max_limit)
+
+
+def test_limit_below_the_file_count_raises(reddit_dir):
+    with pytest.raises(ValueError):
+        fetch_top_from_category_window("global_news", "2024-01-01", "2024-01-02", 3, data_path=reddit_dir)
+
+
+def test_pool_returns_the_in_process_result(reddit_dir, data_dir):
+    serial = fetch_top_from_category_window(
+        "global_news", "2024-01-01", "2024-01-06", 12, data_path=reddit_dir
+    )
+    # workers get the caller's config with every file and index into its cache
+    set_config({"data_cache_dir": os.path.join(data_dir, "pool-cache")})
+    reddit_index._indexes.clear()
+    pooled = fetch_top_from_category_window(
+        "global_news", "2024-01-01", "2024-01-06", 12, data_path=reddit_dir, workers=2
+    )
+    assert pooled == serial
+    assert len(os.listdir(os.path.join(data_dir, "pool-cache", "reddit_index", "global_news"))) == 4
@@ -0,0 +1,122 @@
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.simfin_store import (
+    get_latest_simfin_statement,
+    get_latest_simfin_statements_batch,
+    get_simfin_statement_history,
+)
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tests.helpers import make_simfin_frame, write_simfin_csv
+
+DATES = ["2017-01-01", "2018-05-01", "2019-02-14", "2020-08-01", "2020-08-15", "2030-01-01"]
+
+
+def simfin_frame():
+    frame = make_simfin_frame(("AAA", "BBB", "BRK.B"), n_periods=12, seed=1)
+    # two statements of AAA published on the same day, and a restatement of BBB
+    frame.loc[(frame["Ticker"] == "AAA") & (frame["Fiscal Year"] == 2020), "Publish Date"] = "2020-08-01"
+    restated = frame[(frame["Ticker"] == "BBB")].iloc[[4]].assign(
+        **{"Publish Date": "2020-08-10", "Revenue": 1.0}
+    )
+    return pd.concat([frame, restated], ignore_index=True)
+
+
+@pytest.fixture
+def simfin(data_dir, monkeypatch):
+    monkeypatch.setattr(interface, "DATA_DIR", data_dir)
+    frame = simfin_frame()
+    write_simfin_csv(data_dir, "balance_sheet", "quarterly", frame)
+    return data_dir
+
+
+def baseline_latest(csv_path, ticker, curr_date):
+    """get_simfin_balance_sheet before the store: filter the bulk file, idxmax."""
+    df = pd.read_csv(csv_path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    if filtered_df.empty:
+        return None
+    return filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+
+
+def csv_path(data_dir):
+    return os.path.join(
+        data_dir, "fundamental_data", "simfin_data_all", "balance_sheet", "companies", "us",
+        "us-balance-quarterly.csv",
+    )
+
+
+@pytest.mark.parametrize("ticker", ["AAA", "BBB", "BRK.B", "ZZZ"])
+@pytest.mark.parametrize("curr_date", DATES)
+def test_latest_statement_matches_baseline(simfin, ticker, curr_date):
+    expected = baseline_latest(csv_path(simfin), ticker, curr_date)
+    latest = get_latest_simfin_statement(simfin, "balance_sheet", "quarterly", ticker, curr_date)
+    if expected is None:
+        assert latest is None
+    else:
+        pd.testing.assert_series_equal(latest, expected)
+
+
+def test_tool_output_matches_baseline(simfin):
+    expected = baseline_latest(csv_path(simfin), "AAA", "2020-08-15").drop("SimFinId")
+    report = interface.get_simfin_balance_sheet("AAA", "quarterly", "2020-08-15")
+    assert report.startswith(
+        f"## quarterly balance sheet for AAA released on 2020-08-01: \n{expected}\n\n"
+    )
+    assert interface.get_simfin_balance_sheet("AAA", "quarterly", "2017-01-01") == ""
+
+
+def test_batch_matches_per_call_lookups(simfin):
+    tickers = [t for t in ("AAA", "BBB", "BRK.B", "ZZZ") for _ in DATES]
+    dates = DATES * 4
+    batch = get_latest_simfin_statements_batch(simfin, "balance_sheet", "quarterly", tickers, dates)
+
+    assert list(batch.index.get_level_values("Query Ticker")) == tickers
+    for (ticker, _), (_, row), curr_date in zip(batch.index, batch.iterrows(), dates):
+        expected = baseline_latest(csv_path(simfin), ticker, curr_date)
+        if expected is None:
+            assert row.isna().all()
+        else:
+            assert row["Publish Date"] == expected["Publish Date"]
+            assert row["Revenue"] == expected["Revenue"]
+
+
+def test_prefetch_resolves_the_watchlist_for_every_trading_day(simfin):
+    # the offline graph prefetch, without building the graph and its LLM clients
+    graph = SimpleNamespace(config={"online_tools": False, "data_dir": simfin})
+    resolved = TradingAgentsGraph.prefetch(graph, ["AAA", "BBB"], "2020-08-03", "2020-08-14")
+
+    # only the quarterly balance sheet exists in this data directory
+    assert list(resolved) == [("balance_sheet", "quarterly")]
+    table = resolved[("balance_sheet", "quarterly")]
+    assert len(table) == 2 * 10
+    for (ticker, as_of), row in table.iterrows():
+        expected = baseline_latest(csv_path(simfin), ticker, as_of.strftime("%Y-%m-%d"))
+        assert row["Publish Date"] == expected["Publish Date"]
+
+
+def test_history_keeps_the_latest_restatement(simfin):
+    history = get_simfin_statement_history(simfin, "balance_sheet", "quarterly", "BBB", "2020-08-15", 20)
+    assert history["Report Date"].is_unique and history["Report Date"].is_monotonic_increasing
+    restated = history[history["Report Date"] == pd.Timestamp("2019-03-31", tz="UTC")]
+    assert restated["Revenue"].item() == 1.0
+
+    before = get_simfin_statement_history(simfin, "balance_sheet", "quarterly", "BBB", "2020-08-09", 20)
+    assert before[before["Report Date"] == pd.Timestamp("2019-03-31", tz="UTC")]["Revenue"].item() != 1.0
+
+
+def test_store_is_rebuilt_when_the_bulk_file_changes(simfin):
+    assert get_latest_simfin_statement(simfin, "balance_sheet", "quarterly", "CCC", DATES[-1]) is None
+
+    path = write_simfin_csv(simfin, "balance_sheet", "quarterly", make_simfin_frame(("CCC",)))
+    os.utime(path, (0, os.stat(path).st_mtime + 10))
+    latest = get_latest_simfin_statement(simfin, "balance_sheet", "quarterly", "CCC", DATES[-1])
+    pd.testing.assert_series_equal(latest, baseline_latest(path, "CCC", DATES[-1]))
+    assert get_latest_simfin_statement(simfin, "balance_sheet", "quarterly", "AAA", DATES[-1]) is None
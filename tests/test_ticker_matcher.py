@@ -0,0 +1,115 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from tradingagents.dataflows import reddit_index
+from tradingagents.dataflows.reddit_utils import (
+    fetch_top_from_category_window,
+    get_ticker_matcher,
+    ticker_to_company,
+)
+from tradingagents.dataflows.ticker_matcher import (
+    ALIAS_FILE,
+    AliasMatcher,
+    aliases_from_company_names,
+)
+from tests.helpers import REDDIT_WORDS, write_reddit_jsonl
+from tests.test_reddit_index import baseline_posts_on
+
+ALIASES = aliases_from_company_names(ticker_to_company)
+
+
+def reference_tickers(aliases, *texts):
+    """One case-insensitive search per alias, short aliases only as whole cashtags."""
+    found = set()
+    for ticker, names in aliases.items():
+        for name in names:
+            term = name if len(name.strip()) >= 3 or name.startswith("$") else "$" + name.strip()
+            if not term.strip():
+                continue
+            for text in texts:
+                lower, start = text.lower(), text.lower().find(term.lower())
+                while start != -1:
+                    end = start + len(term)
+                    if not (term.startswith("$") and text[end : end + 1].isalpha()):
+                        found.add(ticker)
+                        break
+                    start = lower.find(term.lower(), start + 1)
+    return found
+
+
+def random_texts(n, seed=0):
+    rng = np.random.default_rng(seed)
+    vocabulary = REDDIT_WORDS + [
+        name for names in ALIASES.values() for name in names
+    ] + ["JP MORGAN", "snap inc.", "$v.", "$spot", "Visa's", "ASML"]
+    return [" ".join(rng.choice(vocabulary, int(rng.integers(0, 12)))) for _ in range(n)]
+
+
+def test_matches_one_search_per_alias():
+    matcher = AliasMatcher(ALIASES)
+    for title, body in zip(random_texts(400, seed=1), random_texts(400, seed=2)):
+        assert matcher.tickers_in(title, body) == reference_tickers(ALIASES, title, body), (title, body)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Squarespace earnings", {"SQSP", "SQ"}),
+        ("bought $V today", {"V"}),
+        ("bought $VOO today", set()),
+        ("V and X are letters", set()),
+        ("Twitter is X now", {"X"}),
+        ("$X.", {"X"}),
+    ],
+)
+def test_overlapping_and_short_aliases(text, expected):
+    assert AliasMatcher(ALIASES).tickers_in(text) == expected
+
+
+def test_alias_file_extends_the_table(tmp_path):
+    with open(tmp_path / ALIAS_FILE, "w", encoding="utf-8") as f:
+        json.dump({"AAPL": ["iPhone maker"], "XYZ": ["Xyzzy Corp"]}, f)
+    matcher = get_ticker_matcher(str(tmp_path))
+    assert matcher.tickers_in("the iPhone maker and Xyzzy Corp") == {"AAPL", "XYZ"}
+
+
+def baseline_company_top(category_dir, date, max_limit, ticker):
+    """Per-day company news by brute force over every post, with the reference matcher."""
+    aliases = ALIASES if ticker in ALIASES else {ticker: [ticker]}
+    files = os.listdir(category_dir)
+    limit = max_limit // len(files)
+    out = []
+    for data_file in files:
+        posts = [
+            {
+                "title": post["title"],
+                "content": post["selftext"],
+                "url": post["url"],
+                "upvotes": post["ups"],
+                "posted_date": date,
+            }
+            for post in baseline_posts_on(os.path.join(category_dir, data_file), date)
+            if ticker in reference_tickers(aliases, post["title"], post["selftext"])
+        ]
+        posts.sort(key=lambda x: x["upvotes"], reverse=True)
+        out.extend(posts[:limit])
+    return out
+
+
+@pytest.mark.parametrize("ticker", ["AAPL", "SQ", "V", "XBOX"])
+def test_company_news_matches_brute_force(data_dir, ticker):
+    root = os.path.join(data_dir, "reddit_data")
+    for seed, name in enumerate(("stocks", "investing")):
+        write_reddit_jsonl(os.path.join(root, "company_news", f"{name}.jsonl"), seed=seed + 20)
+    reddit_index._indexes.clear()
+
+    window = fetch_top_from_category_window(
+        "company_news", "2024-01-01", "2024-01-06", 10, ticker, data_path=root
+    )
+    category_dir = os.path.join(root, "company_news")
+    for date, posts in window.items():
+        assert posts == baseline_company_top(category_dir, date, 10, ticker)
+    assert any(window.values())
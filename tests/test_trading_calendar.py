@@ -0,0 +1,64 @@
+import os
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.price_store import append_price_records, records_from_frame
+from tradingagents.dataflows.trading_calendar import TradingCalendar, get_trading_calendar
+from tests.helpers import make_price_frame
+
+FRAME = make_price_frame(120, seed=4)
+DATES = pd.to_datetime(FRAME["Date"])
+
+
+@pytest.fixture
+def calendar():
+    return TradingCalendar(DATES.values)
+
+
+@pytest.mark.parametrize(
+    "value", ["2023-01-02", "2023-01-07", "2023-03-15", FRAME["Date"].iloc[-1], "2030-01-01"]
+)
+def test_index_of_matches_date_lookup(calendar, value):
+    matches = np.flatnonzero(FRAME["Date"].values == value)
+    expected = int(matches[0]) if len(matches) else None
+    assert calendar.index_of(value) == expected
+
+
+def test_index_of_accepts_date_like_values(calendar):
+    idx = calendar.index_of("2023-03-15")
+    assert calendar.index_of(date(2023, 3, 15)) == idx
+    assert calendar.index_of(datetime(2023, 3, 15, 16, 30)) == idx
+    assert calendar.index_of(np.datetime64("2023-03-15")) == idx
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ("2023-01-01", "2023-01-31"),
+        ("2023-02-04", "2023-02-05"),
+        ("2023-03-10", "2023-03-01"),
+        ("2022-01-01", "2030-01-01"),
+    ],
+)
+def test_trading_days_match_pandas_filter(calendar, start, end):
+    expected = FRAME["Date"][(DATES >= start) & (DATES <= end)].tolist()
+    assert calendar.trading_days(start, end) == expected
+    lo, hi = calendar.slice_indices(start, end)
+    assert FRAME["Date"].iloc[lo:hi].tolist() == expected
+
+
+def test_calendar_is_rebuilt_when_the_store_changes(tmp_path):
+    path = str(tmp_path / "AAA.npy")
+    append_price_records(path, records_from_frame(FRAME.iloc[:100]))
+    first = get_trading_calendar(path)
+    assert get_trading_calendar(path) is first
+
+    append_price_records(path, records_from_frame(FRAME.iloc[100:]))
+    mtime = os.path.getmtime(path)
+    os.utime(path, (mtime + 10, mtime + 10))
+    second = get_trading_calendar(path)
+    assert second is not first
+    assert len(second) == len(FRAME)
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows import yfin_cache as yc
+from tests.helpers import make_price_frame
+
+HISTORY = make_price_frame(300, seed=3)
+
+
+class FakeYahoo:
+    """Serves ``download_price_frame`` from a fixed history and logs each call."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    def __call__(self, symbol, start_date, end_date):
+        self.calls.append((symbol, start_date, end_date))
+        frame = self.frames.get(symbol)
+        if frame is None:
+            return pd.DataFrame()
+        dates = frame["Date"]
+        return frame[(dates >= start_date) & (dates <= end_date)].reset_index(drop=True)
+
+
+@pytest.fixture
+def yahoo(data_dir, monkeypatch):
+    fake = FakeYahoo({"AAA": HISTORY})
+    monkeypatch.setattr(yc, "download_price_frame", fake)
+    monkeypatch.setattr(yc, "last_completed_session", lambda: "2030-01-01")
+    yc._partial_refreshed.clear()
+    return fake
+
+
+def cached_dates(records):
+    return list(np.datetime_as_string(records["Date"], unit="D"))
+
+
+def expected_dates(start_date, end_date):
+    dates = HISTORY["Date"]
+    return list(dates[(dates >= start_date) & (dates <= end_date)])
+
+
+def test_first_fetch_downloads_the_range(yahoo):
+    records = yc.get_cached_price_records("AAA", "2023-02-01", "2023-06-30")
+    assert cached_dates(records) == expected_dates("2023-02-01", "2023-06-30")
+    assert yahoo.calls == [("AAA", "2023-02-01", "2023-06-30")]
+
+
+def test_covered_range_is_served_from_the_cache(yahoo):
+    yc.get_cached_price_records("AAA", "2023-02-01", "2023-06-30")
+    records = yc.get_cached_price_records("AAA", "2023-03-01", "2023-05-31")
+    assert len(yahoo.calls) == 1
+    assert cached_dates(records) == expected_dates("2023-02-01", "2023-06-30")
+
+
+def test_only_the_missing_tail_is_downloaded(yahoo):
+    yc.get_cached_price_records("AAA", "2023-02-01", "2023-06-30")
+    records = yc.get_cached_price_records("AAA", "2023-02-01", "2023-09-29")
+
+    # the tail overlaps the cache by its last bar
+    last_cached = expected_dates("2023-02-01", "2023-06-30")[-1]
+    assert yahoo.calls[1] == ("AAA", last_cached, "2023-09-29")
+    assert cached_dates(records) == expected_dates("2023-02-01", "2023-09-29")
+
+
+def test_readjusted_history_is_downloaded_again(yahoo):
+    yc.get_cached_price_records("AAA", "2023-02-01", "2023-06-30")
+    adjusted = HISTORY.copy()
+    adjusted[["Open", "High", "Low", "Close", "Adj Close"]] *= 0.5
+    yahoo.frames["AAA"] = adjusted
+
+    records = yc.get_cached_price_records("AAA", "2023-02-01", "2023-09-29")
+    assert yahoo.calls[-1] == ("AAA", "2023-02-01", "2023-09-29")
+    expected = adjusted[adjusted["Date"].between("2023-02-01", "2023-09-29")]
+    np.testing.assert_allclose(records["Close"], expected["Close"])
+
+
+def test_unknown_ticker_returns_none(yahoo):
+    assert yc.get_cached_price_records("ZZZZ", "2023-02-01", "2023-06-30") is None
+    assert yc.load_covered_range(yc.get_online_store_path("ZZZZ")) is None
+
+
+def test_empty_download_leaves_the_covered_range_alone(yahoo):
+    yc.get_cached_price_records("AAA", "2023-02-01", "2023-06-30")
+    store_path = yc.get_online_store_path("AAA")
+    yahoo.frames["AAA"] = None
+
+    records = yc.get_cached_price_records("AAA", "2023-02-01", "2023-09-29")
+    assert cached_dates(records) == expected_dates("2023-02-01", "2023-06-30")
+    assert yc.load_covered_range(store_path) == {"start": "2023-02-01", "end": "2023-06-30"}
+
+
+def test_partial_session_is_not_marked_as_covered(yahoo, monkeypatch):
+    monkeypatch.setattr(yc, "last_completed_session", lambda: "2023-06-15")
+    yc.get_cached_price_records("AAA", "2023-02-01", "2023-06-30")
+    covered = yc.load_covered_range(yc.get_online_store_path("AAA"))
+    assert covered == {"start": "2023-02-01", "end": "2023-06-15"}
+
+
+def test_online_tools_report_unknown_tickers(yahoo):
+    assert interface.get_YFin_data_online("ZZZZ", "2023-02-01", "2023-06-30").startswith(
+        "No data found for symbol 'ZZZZ'"
+    )
+    assert interface.get_YFin_data_summary("ZZZZ", "2023-06-30", 30, True).startswith(
+        "No data found for symbol 'ZZZZ'"
+    )
+
+
+def test_online_data_matches_the_download(yahoo):
+    report = interface.get_YFin_data_online("AAA", "2023-02-01", "2023-07-01")
+    assert "# Total records: %d" % len(expected_dates("2023-02-01", "2023-06-30")) in report
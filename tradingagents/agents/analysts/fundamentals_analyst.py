@@ -11,17 +11,23 @@ def create_fundamentals_analyst(llm, toolkit):
 
         if toolkit.config["online_tools"]:
             tools = [toolkit.get_fundamentals_openai]
+            tool_guidance = ""
         else:
             tools = [
                 toolkit.get_finnhub_company_insider_sentiment,
                 toolkit.get_finnhub_company_insider_transactions,
+                toolkit.get_fundamental_ratios,
+                toolkit.get_simfin_financial_statements,
+                toolkit.get_simfin_statement_trend,
                 toolkit.get_simfin_balance_sheet,
                 toolkit.get_simfin_cashflow,
                 toolkit.get_simfin_income_stmt,
             ]
+            tool_guidance = " To read the financial statements, prefer get_simfin_financial_statements, which returns the balance sheet, cash flow statement and income statement in one call, and use get_fundamental_ratios for valuation, margin, growth and leverage ratios instead of computing them yourself. Use get_simfin_statement_trend to see how line items developed over the last reporting periods."
 
         system_message = (
             "You are a researcher tasked with analyzing fundamental information over the past week about a company. Please write a comprehensive report of the company's fundamental information such as financial documents, company profile, basic company financials, company financial history, insider sentiment and insider transactions to gain a full view of the company's fundamental information to inform traders. Make sure to include as much detail as possible. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."
+            + tool_guidance
             + " Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read.",
         )
 
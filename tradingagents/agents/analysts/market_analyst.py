@@ -13,12 +13,16 @@ def create_market_analyst(llm, toolkit):
         if toolkit.config["online_tools"]:
             tools = [
                 toolkit.get_YFin_data_online,
+                toolkit.get_YFin_data_summary_online,
                 toolkit.get_stockstats_indicators_report_online,
+                toolkit.get_stockstats_indicators_batch_report_online,
             ]
         else:
             tools = [
                 toolkit.get_YFin_data,
+                toolkit.get_YFin_data_summary,
                 toolkit.get_stockstats_indicators_report,
+                toolkit.get_stockstats_indicators_batch_report,
             ]
 
         system_message = (
@@ -46,7 +50,7 @@ Volatility Indicators:
 Volume-Based Indicators:
 - vwma: VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses.
 
-- Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_YFin_data first to retrieve the CSV that is needed to generate indicators. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
+- Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_YFin_data first to retrieve the CSV that is needed to generate indicators. For long look-back periods, use the price summary tool to review returns, volatility, drawdowns, gaps and volume instead of reading every daily bar. Once you have chosen your indicators, retrieve all of them together with a single call to the batch indicators report tool instead of calling the single-indicator report tool once per indicator. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
             + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
         )
 
@@ -161,6 +161,56 @@ class Toolkit:
 
         return result_data
 
+    @staticmethod
+    @tool
+    def get_YFin_data_summary(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 90,
+    ) -> str:
+        """
+        Retrieve a compact summary of the stock price history for a given ticker symbol from Yahoo Finance: period returns, realized volatility, max drawdown, price gaps, volume z-scores and a downsampled OHLCV table.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 90
+        Returns:
+            str: A short report summarizing the price action of the specified ticker symbol over the look-back window.
+        """
+
+        result_data = interface.get_YFin_data_summary(
+            symbol, curr_date, look_back_days, False
+        )
+
+        return result_data
+
+    @staticmethod
+    @tool
+    def get_YFin_data_summary_online(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 90,
+    ) -> str:
+        """
+        Retrieve a compact summary of the stock price history for a given ticker symbol from Yahoo Finance: period returns, realized volatility, max drawdown, price gaps, volume z-scores and a downsampled OHLCV table.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 90
+        Returns:
+            str: A short report summarizing the price action of the specified ticker symbol over the look-back window.
+        """
+
+        result_data = interface.get_YFin_data_summary(
+            symbol, curr_date, look_back_days, True
+        )
+
+        return result_data
+
     @staticmethod
     @tool
     def get_stockstats_indicators_report(
@@ -219,6 +269,64 @@ class Toolkit:
 
         return result_stockstats
 
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in a single call.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A date-by-indicator table with the values of all requested indicators for the specified ticker symbol.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_batch(
+            symbol, indicators, curr_date, look_back_days, False
+        )
+
+        return result_stockstats
+
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report_online(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in a single call.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A date-by-indicator table with the values of all requested indicators for the specified ticker symbol.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_batch(
+            symbol, indicators, curr_date, look_back_days, True
+        )
+
+        return result_stockstats
+
     @staticmethod
     @tool
     def get_finnhub_company_insider_sentiment(
@@ -227,18 +335,20 @@ class Toolkit:
             str,
             "current date of you are trading at, yyyy-mm-dd",
         ],
+        summary: Annotated[bool, "append an aggregated numeric summary"] = False,
     ):
         """
         Retrieve insider sentiment information about a company (retrieved from public SEC information) for the past 30 days
         Args:
             ticker (str): ticker symbol of the company
             curr_date (str): current date you are trading at, yyyy-mm-dd
+            summary (bool): whether to append the total net change and monthly share purchase ratio statistics
         Returns:
             str: a report of the sentiment in the past 30 days starting at curr_date
         """
 
         data_sentiment = interface.get_finnhub_company_insider_sentiment(
-            ticker, curr_date, 30
+            ticker, curr_date, 30, summary
         )
 
         return data_sentiment
@@ -251,18 +361,20 @@ class Toolkit:
             str,
             "current date you are trading at, yyyy-mm-dd",
         ],
+        summary: Annotated[bool, "append an aggregated numeric summary"] = False,
     ):
         """
         Retrieve insider transaction information about a company (retrieved from public SEC information) for the past 30 days
         Args:
             ticker (str): ticker symbol of the company
             curr_date (str): current date you are trading at, yyyy-mm-dd
+            summary (bool): whether to append net shares and traded value by insider and by transaction code
         Returns:
             str: a report of the company's insider transactions/trading information in the past 30 days
         """
 
         data_trans = interface.get_finnhub_company_insider_transactions(
-            ticker, curr_date, 30
+            ticker, curr_date, 30, summary
         )
 
         return data_trans
@@ -341,6 +453,85 @@ class Toolkit:
 
         return data_income_stmt
 
+    @staticmethod
+    @tool
+    def get_simfin_financial_statements(
+        ticker: Annotated[str, "ticker symbol"],
+        freq: Annotated[
+            str,
+            "reporting frequency of the company's financial history: annual/quarterly",
+        ],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ):
+        """
+        Retrieve the most recent balance sheet, cash flow statement and income statement of a company in one call
+        Args:
+            ticker (str): ticker symbol of the company
+            freq (str): reporting frequency of the company's financial history: annual / quarterly
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+        Returns:
+                str: a report of the company's three most recent financial statements
+        """
+
+        data_statements = interface.get_simfin_financial_statements(
+            ticker, freq, curr_date
+        )
+
+        return data_statements
+
+    @staticmethod
+    @tool
+    def get_simfin_statement_trend(
+        ticker: Annotated[str, "ticker symbol"],
+        statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+        freq: Annotated[
+            str,
+            "reporting frequency of the company's financial history: annual/quarterly",
+        ],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+        periods: Annotated[int, "number of trailing reporting periods"] = 8,
+        items: Annotated[
+            List[str], "line items to show, defaults to the key items of the statement"
+        ] = None,
+    ):
+        """
+        Retrieve the trend of a company's financial statement over its last reporting periods, with quarter-over-quarter and year-over-year changes of each line item
+        Args:
+            ticker (str): ticker symbol of the company
+            statement (str): balance_sheet, cash_flow or income_statements
+            freq (str): reporting frequency of the company's financial history: annual / quarterly
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+            periods (int): number of trailing reporting periods, 8 by default
+            items (List[str]): line items to show, e.g. ["Revenue", "Net Income"]
+        Returns:
+                str: a table of the line items over the last reporting periods with their QoQ/YoY changes
+        """
+
+        data_trend = interface.get_simfin_statement_trend(
+            ticker, statement, freq, curr_date, periods, items
+        )
+
+        return data_trend
+
+    @staticmethod
+    @tool
+    def get_fundamental_ratios(
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ):
+        """
+        Retrieve a table of valuation (P/E, P/S, P/B, P/FCF, EV/EBIT), margin, growth, leverage and cash flow ratios of a company, computed locally from its financial statements and price history
+        Args:
+            ticker (str): ticker symbol of the company
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+        Returns:
+                str: a Markdown table of the company's fundamental ratios as known on the current date
+        """
+
+        data_ratios = interface.get_fundamental_ratios(ticker, curr_date)
+
+        return data_ratios
+
     @staticmethod
     @tool
     def get_google_news(
@@ -3,6 +3,9 @@ from .googlenews_utils import getNewsData
 from .yfin_utils import YFinanceUtils
 from .reddit_utils import fetch_top_from_category
 from .stockstats_utils import StockstatsUtils
+from .frame_cache import get_frame_cache
+from .simfin_store import get_latest_simfin_statements_batch, prefetch_simfin_statements
+from .fundamental_ratios import compute_fundamental_ratios
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -17,12 +20,19 @@ from .interface import (
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
+    get_simfin_financial_statements,
+    get_simfin_statement_trend,
+    get_fundamental_ratios,
     # Technical analysis functions
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_batch,
     get_stockstats_indicator,
+    get_stockstats_indicator_window,
     # Market data functions
     get_YFin_data_window,
     get_YFin_data,
+    get_YFin_data_summary,
+    prefetch_prices,
 )
 
 __all__ = [
@@ -37,10 +47,17 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_simfin_financial_statements",
+    "get_simfin_statement_trend",
+    "get_fundamental_ratios",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
+    "get_stock_stats_indicators_batch",
     "get_stockstats_indicator",
+    "get_stockstats_indicator_window",
     # Market data functions
     "get_YFin_data_window",
     "get_YFin_data",
+    "get_YFin_data_summary",
+    "prefetch_prices",
 ]
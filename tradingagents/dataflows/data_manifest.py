@@ -0,0 +1,174 @@
+"""
+Manifest of the offline data files under ``DATA_DIR``.
+
+Instead of hardcoding file names such as
+``{symbol}-YFin-data-2015-01-01-2025-03-25.csv``, the data directories are
+scanned once and every recognised file is indexed by (ticker, data type,
+period) together with the date range it covers. The scan is redone only when
+one of the scanned directories changes (mtime), so dropping in a longer price
+history or a new ticker needs no code change.
+"""
+
+import glob
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+_DATE = r"\d{4}-\d{2}-\d{2}"
+
+# {symbol}-YFin-data[-{start}-{end}].csv
+PRICE_FILE_PATTERN = rf"^(?P<ticker>.+?)-YFin-data(?:-(?P<start>{_DATE})-(?P<end>{_DATE}))?\.csv$"
+# {ticker}[_{period}]_data_formatted.json
+FINNHUB_FILE_PATTERN = r"^(?P<ticker>[^_]+)(?:_(?P<period>annual|quarterly))?_data_formatted\.json$"
+
+# (directory relative to the root, may contain a glob; file name pattern;
+#  data type, where "{dir}" is replaced by the directory name)
+DEFAULT_LAYOUT = (
+    (os.path.join("market_data", "price_data"), PRICE_FILE_PATTERN, "price"),
+    (os.path.join("finnhub_data", "*"), FINNHUB_FILE_PATTERN, "{dir}"),
+)
+# layout of a directory that directly holds the YFin CSV files
+PRICE_LAYOUT = ((".", PRICE_FILE_PATTERN, "price"),)
+
+
+def _csv_date_range(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """First and last date of a date-sorted CSV whose first column is the date."""
+    with open(path, "rb") as f:
+        f.readline()  # header
+        first = f.readline()
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 4096))
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    if not first.strip() or not lines:
+        return None, None
+    return (
+        first.split(b",")[0].decode()[:10],
+        lines[-1].split(b",")[0].decode()[:10],
+    )
+
+
+class ManifestEntry:
+    """A data file and the (inclusive) date range it covers."""
+
+    __slots__ = ("path", "start", "end", "_named_range", "_mtime")
+
+    def __init__(self, path: str, start: Optional[str] = None, end: Optional[str] = None):
+        self.path = path
+        self.start = start
+        self.end = end
+        self._named_range = start is not None
+        self._mtime = None
+
+    def covered_range(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Date range of the file. Taken from the file name when it carries one,
+        otherwise read from the first and last rows of a CSV (re-read when the
+        file changes).
+        """
+        if self._named_range or not self.path.endswith(".csv"):
+            return self.start, self.end
+
+        mtime = os.path.getmtime(self.path)
+        if mtime != self._mtime:
+            self.start, self.end = _csv_date_range(self.path)
+            self._mtime = mtime
+        return self.start, self.end
+
+    def __repr__(self) -> str:
+        return f"ManifestEntry({self.path!r}, {self.start!r}, {self.end!r})"
+
+
+class DataManifest:
+    """Index of (ticker, data type, period) -> ManifestEntry for one data root."""
+
+    def __init__(self, root: str, layout=DEFAULT_LAYOUT):
+        self.root = root
+        self.layout = layout
+        self._entries: Dict[Tuple[str, str, Optional[str]], ManifestEntry] = {}
+        self._dir_mtimes: Dict[str, Optional[float]] = {}
+        self.scan()
+
+    def _watched_dirs(self):
+        """Directories whose mtime decides whether the manifest is stale."""
+        dirs = set()
+        for subdir, _, _ in self.layout:
+            # the fixed part of a globbed subdirectory notices new data types
+            dirs.add(os.path.normpath(os.path.join(self.root, subdir.split("*")[0])))
+            dirs.update(
+                os.path.normpath(path)
+                for path in glob.glob(os.path.join(self.root, subdir))
+                if os.path.isdir(path)
+            )
+        return dirs
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[float]:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def scan(self) -> None:
+        """Rebuild the index with one listing per data directory."""
+        entries = {}
+        for subdir, pattern, data_type in self.layout:
+            regex = re.compile(pattern)
+            for directory in sorted(glob.glob(os.path.join(self.root, subdir))):
+                if not os.path.isdir(directory):
+                    continue
+                kind = data_type.format(dir=os.path.basename(os.path.normpath(directory)))
+                for name in os.listdir(directory):
+                    match = regex.match(name)
+                    if match is None:
+                        continue
+                    groups = match.groupdict()
+                    key = (groups["ticker"], kind, groups.get("period"))
+                    entry = ManifestEntry(
+                        os.path.join(directory, name), groups.get("start"), groups.get("end")
+                    )
+                    # when a ticker has several files, keep the most recent history
+                    current = entries.get(key)
+                    if current is None or (entry.end or "", name) > (current.end or "", os.path.basename(current.path)):
+                        entries[key] = entry
+
+        self._entries = entries
+        self._dir_mtimes = {path: self._mtime(path) for path in self._watched_dirs()}
+
+    def is_stale(self) -> bool:
+        return any(self._mtime(path) != mtime for path, mtime in self._dir_mtimes.items())
+
+    def lookup(
+        self, ticker: str, data_type: str, period: Optional[str] = None
+    ) -> Optional[ManifestEntry]:
+        return self._entries.get((ticker, data_type, period))
+
+    def path(self, ticker: str, data_type: str, period: Optional[str] = None) -> Optional[str]:
+        entry = self.lookup(ticker, data_type, period)
+        return entry.path if entry is not None else None
+
+    def items(self):
+        """(ticker, data type, period) and entry of every indexed file."""
+        return sorted(self._entries.items(), key=lambda item: tuple(part or "" for part in item[0]))
+
+    def tickers(self, data_type: str):
+        return sorted({ticker for ticker, kind, _ in self._entries if kind == data_type})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_manifests: Dict[Tuple[str, tuple], DataManifest] = {}
+
+
+def get_data_manifest(root: str, layout=DEFAULT_LAYOUT) -> DataManifest:
+    """
+    Shared manifest of ``root``. It is built on first use and rescanned only
+    when a scanned directory's mtime changes.
+    """
+    key = (os.path.abspath(root), layout)
+    manifest = _manifests.get(key)
+    if manifest is None:
+        manifest = _manifests[key] = DataManifest(root, layout)
+    elif manifest.is_stale():
+        manifest.scan()
+    return manifest
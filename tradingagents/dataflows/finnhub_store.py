@@ -0,0 +1,160 @@
+"""
+SQLite store of the formatted Finnhub data.
+
+``import_finnhub_data`` loads every ``finnhub_data/<data_type>/*.json`` file
+found by the data manifest into ``data_cache_dir/finnhub_store.sqlite``, one
+row per (ticker, data type, period, date) holding that day's entries as JSON.
+The rows are clustered on that key, so a date range of one ticker is a single
+indexed range scan no matter how much history the store holds, and nothing
+has to be parsed or kept in memory up front. Re-importing only reloads the
+files whose mtime changed.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Annotated, Dict, List, Optional, Tuple
+
+from .config import get_config
+from .data_manifest import get_data_manifest
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS finnhub_entries (
+    ticker TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    period TEXT NOT NULL,
+    date TEXT NOT NULL,
+    entries TEXT NOT NULL,
+    PRIMARY KEY (ticker, data_type, period, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS finnhub_sources (
+    ticker TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    period TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    PRIMARY KEY (ticker, data_type, period)
+) WITHOUT ROWID;
+"""
+
+_local = threading.local()
+
+
+def get_finnhub_store_path() -> str:
+    """Path of the SQLite Finnhub store inside the data cache."""
+    return os.path.join(get_config()["data_cache_dir"], "finnhub_store.sqlite")
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Connection to ``db_path`` reused within the calling thread."""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    connection = connections.get(db_path)
+    if connection is None:
+        connection = connections[db_path] = sqlite3.connect(db_path)
+    return connection
+
+
+def import_finnhub_data(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    tickers: Annotated[
+        List[str], "tickers to import, defaults to every ticker with Finnhub data"
+    ] = None,
+    db_path: Annotated[str, "SQLite file, defaults to the data cache"] = None,
+) -> Dict[Tuple[str, str, Optional[str]], str]:
+    """
+    Import the formatted Finnhub files into the SQLite store. Files whose mtime
+    is unchanged since their last import are skipped.
+
+    Returns the status of every (ticker, data type, period) file: "added",
+    "updated" or "unchanged".
+    """
+    db_path = db_path or get_finnhub_store_path()
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    wanted = set(tickers) if tickers else None
+
+    connection = _connect(db_path)
+    connection.executescript(SCHEMA)
+    imported = {
+        (ticker, data_type, period): mtime
+        for ticker, data_type, period, mtime in connection.execute(
+            "SELECT ticker, data_type, period, mtime FROM finnhub_sources"
+        )
+    }
+
+    statuses = {}
+    for (ticker, data_type, period), entry in get_data_manifest(data_dir).items():
+        if data_type == "price" or (wanted is not None and ticker not in wanted):
+            continue
+        key = (ticker, data_type, period or "")
+        mtime = os.path.getmtime(entry.path)
+        if imported.get(key) == mtime:
+            statuses[(ticker, data_type, period)] = "unchanged"
+            continue
+
+        with open(entry.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # one transaction per file, so a reader never sees it half imported
+        with connection:
+            connection.execute(
+                "DELETE FROM finnhub_entries WHERE ticker = ? AND data_type = ? AND period = ?",
+                key,
+            )
+            # days without any entry are never returned, so they are not stored
+            connection.executemany(
+                "INSERT INTO finnhub_entries VALUES (?, ?, ?, ?, ?)",
+                (
+                    (*key, date, json.dumps(value))
+                    for date, value in data.items()
+                    if len(value) > 0
+                ),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO finnhub_sources VALUES (?, ?, ?, ?, ?)",
+                (*key, entry.path, mtime),
+            )
+        statuses[(ticker, data_type, period)] = "updated" if key in imported else "added"
+    return statuses
+
+
+def query_finnhub_store(
+    db_path: Annotated[str, "SQLite file written by import_finnhub_data"],
+    ticker: Annotated[str, "ticker symbol"],
+    data_type: Annotated[str, "Finnhub data type, e.g. news_data"],
+    start_date: Annotated[str, "Start date in YYYY-MM-DD format"],
+    end_date: Annotated[str, "End date in YYYY-MM-DD format"],
+    period: Annotated[Optional[str], "annual / quarterly, if the data type has one"] = None,
+    source_mtime: Annotated[
+        Optional[float], "mtime of the JSON file on disk, if it still exists"
+    ] = None,
+) -> Optional[Dict[str, list]]:
+    """
+    The non-empty days of [start_date, end_date] in date order, or None if the
+    file was never imported or changed on disk after its import.
+    """
+    if not os.path.exists(db_path):
+        return None
+    connection = _connect(db_path)
+    key = (ticker, data_type, period or "")
+
+    try:
+        source = connection.execute(
+            "SELECT mtime FROM finnhub_sources WHERE ticker = ? AND data_type = ? AND period = ?",
+            key,
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # the store exists but nothing was imported into it yet
+        return None
+    if source is None or (source_mtime is not None and source[0] != source_mtime):
+        return None
+
+    rows = connection.execute(
+        "SELECT date, entries FROM finnhub_entries"
+        " WHERE ticker = ? AND data_type = ? AND period = ? AND date BETWEEN ? AND ?"
+        " ORDER BY date",
+        (*key, start_date, end_date),
+    )
+    return {date: json.loads(entries) for date, entries in rows}
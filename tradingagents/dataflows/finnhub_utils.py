@@ -1,5 +1,30 @@
 import json
 import os
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+from .data_manifest import get_data_manifest
+from .finnhub_store import get_finnhub_store_path, query_finnhub_store
+
+# path -> (mtime, sorted date keys with data, their entries), shared by all callers
+_finnhub_files: Dict[str, Tuple[float, List[str], List[list]]] = {}
+
+
+def _load_finnhub_file(data_path: str) -> Tuple[List[str], List[list]]:
+    """Parse a formatted Finnhub file once per mtime, keeping its date keys sorted."""
+    mtime = os.path.getmtime(data_path)
+    cached = _finnhub_files.get(data_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    with open(data_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    # days without any entry are never returned, so they are not kept
+    keys = sorted(key for key, value in data.items() if len(value) > 0)
+    values = [data[key] for key in keys]
+    _finnhub_files[data_path] = (mtime, keys, values)
+    return keys, values
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -11,26 +36,58 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         data_type (str): Type of data from finnhub to fetch. Can be insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported.
         data_dir (str): Directory where the data is saved.
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
+    Returns:
+        dict: the non-empty days in [start_date, end_date] in date order, read
+        from the SQLite store when the file was imported into it, otherwise from
+        the in-process cache of the JSON file (whose entries must not be modified).
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
+    # resolve the file through the data manifest instead of probing the path
+    data_path = get_data_manifest(data_dir).path(ticker, data_type, period)
+
+    # an up-to-date import in the SQLite store answers with an indexed range scan
+    stored = query_finnhub_store(
+        get_finnhub_store_path(),
+        ticker,
+        data_type,
+        start_date,
+        end_date,
+        period,
+        os.path.getmtime(data_path) if data_path is not None else None,
+    )
+    if stored is not None:
+        return stored
+
+    if data_path is None:
+        raise FileNotFoundError(
+            f"No {data_type} data found for {ticker} in {os.path.join(data_dir, 'finnhub_data')}"
         )
 
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    keys, values = _load_finnhub_file(data_path)
+
+    # keys (date, str in format YYYY-MM-DD) are sorted, so the range is a slice
+    lo = bisect_left(keys, start_date)
+    hi = bisect_right(keys, end_date, lo)
+    return dict(zip(keys[lo:hi], values[lo:hi]))
+
+
+def _canonical(value):
+    """Hashable form of a JSON value that is equal exactly when the values are."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _canonical(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_canonical(item) for item in value)
+    return value
+
 
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+def unique_entries(data: Dict[str, list]) -> List[dict]:
+    """Entries of every day of ``data``, in order, without repeats."""
+    seen = set()
+    entries = []
+    for day_entries in data.values():
+        for entry in day_entries:
+            key = _canonical(entry)
+            if key not in seen:
+                seen.add(key)
+                entries.append(entry)
+    return entries
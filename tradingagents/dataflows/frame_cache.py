@@ -0,0 +1,100 @@
+"""
+Process-wide LRU cache of parsed, date-indexed price frames.
+
+Frames are keyed by (path, mtime), so a rewritten file is re-read on its next
+use, and evicted least-recently-used once their total size exceeds the
+configured byte budget. Cached frames are shared between callers and must be
+treated as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .config import get_config
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class FrameCache:
+    """Bounded LRU mapping (path, mtime) -> DataFrame with hit/miss counters."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[Tuple[str, float], Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._latest: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: str, loader: Callable[[str], pd.DataFrame]) -> pd.DataFrame:
+        """Return the frame of ``path``, parsing it with ``loader`` on a miss."""
+        path = os.path.abspath(path)
+        key = (path, os.path.getmtime(path))
+        with self._lock:
+            item = self._frames.get(key)
+            if item is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return item[0]
+            self.misses += 1
+
+        frame = loader(path)
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+
+        with self._lock:
+            # an older version of the same file can never be hit again
+            self._discard(self._latest.pop(path, None))
+            if nbytes <= self.max_bytes:
+                self._frames[key] = (frame, nbytes)
+                self._latest[path] = key
+                self.bytes += nbytes
+                while self.bytes > self.max_bytes:
+                    old_key, (_, old_bytes) = self._frames.popitem(last=False)
+                    self._latest.pop(old_key[0], None)
+                    self.bytes -= old_bytes
+                    self.evictions += 1
+        return frame
+
+    def _discard(self, key: Optional[Tuple[str, float]]) -> None:
+        item = self._frames.pop(key, None) if key is not None else None
+        if item is not None:
+            self.bytes -= item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._latest.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for tuning the byte budget."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._frames),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_frame_cache: Optional[FrameCache] = None
+
+
+def get_frame_cache() -> FrameCache:
+    """The shared cache, sized by the ``price_frame_cache_bytes`` config entry."""
+    global _frame_cache
+    if _frame_cache is None:
+        _frame_cache = FrameCache(
+            get_config().get("price_frame_cache_bytes", DEFAULT_MAX_BYTES)
+        )
+    return _frame_cache
@@ -0,0 +1,333 @@
+"""
+Fundamental ratios computed locally from the SimFin statements and the price store.
+
+``compute_fundamental_ratios`` resolves the point-in-time statements of many
+(ticker, date) pairs from the SimFin store, takes the last close on or before
+each date from the price store and evaluates every ratio as a column-wise
+NumPy expression. Flow figures (revenue, earnings, cash flow) come from the
+annual statements of the latest reporting period known on the date, balances
+and share counts from the latest quarterly balance sheet (one batched as-of
+lookup), and growth compares the latest annual period with the one before it.
+Each period is read in the latest version published by the query date, so a
+restatement is never compared with the original filing of the same period.
+
+The price store holds split-adjusted closes while SimFin reports share counts
+as they were at the time, so the share count is first put on the price basis:
+splits are detected as jumps of the quarterly share count by a whole split
+ratio, and the count is multiplied by every split reported after it.
+"""
+
+import os
+from typing import Annotated, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .price_store import get_price_records
+from .simfin_store import get_latest_simfin_statements_batch, load_simfin_statements
+
+# ratio -> group it is reported under
+RATIO_GROUPS = {
+    "valuation": [
+        "Price",
+        "Market Cap",
+        "P/E",
+        "P/S",
+        "P/B",
+        "P/FCF",
+        "EV/EBIT",
+        "Earnings Yield",
+        "FCF Yield",
+        "Dividend Yield",
+    ],
+    "margins": ["Gross Margin", "Operating Margin", "Net Margin", "FCF Margin"],
+    "growth": ["Revenue Growth", "Net Income Growth", "Operating Cash Flow Growth"],
+    "leverage": ["Debt/Equity", "Net Debt/Equity", "Liabilities/Assets", "Current Ratio"],
+    "cash_flow": ["Operating Cash Flow", "Free Cash Flow", "Cash Conversion"],
+}
+RATIOS = [ratio for ratios in RATIO_GROUPS.values() for ratio in ratios]
+
+# ratios shown as percentages, and absolute amounts, by format_fundamental_ratios
+PERCENT_RATIOS = {
+    "Earnings Yield",
+    "FCF Yield",
+    "Dividend Yield",
+    "Gross Margin",
+    "Operating Margin",
+    "Net Margin",
+    "FCF Margin",
+    "Revenue Growth",
+    "Net Income Growth",
+    "Operating Cash Flow Growth",
+}
+AMOUNT_RATIOS = {"Market Cap", "Operating Cash Flow", "Free Cash Flow"}
+
+# forward split ratios recognised in the share counts (their inverses are
+# reverse splits), and how far a quarter-over-quarter jump may be off one.
+# Fractional ratios such as 3:2 are left out: the closes are already
+# split-adjusted, so nothing tells such a split apart from a share issuance
+SPLIT_RATIOS = np.array([2, 3, 4, 5, 6, 7, 8, 10, 15, 20, 25, 30, 50, 100])
+SPLIT_TOLERANCE = 0.03
+
+
+def _column(statements: pd.DataFrame, name: str) -> np.ndarray:
+    """A statement column as float64, all-NaN if this dataset does not have it."""
+    if name not in statements.columns:
+        return np.full(len(statements), np.nan)
+    return pd.to_numeric(statements[name], errors="coerce").to_numpy(dtype=np.float64)
+
+
+def _sum(*columns: np.ndarray) -> np.ndarray:
+    """Element-wise sum treating NaN as 0, NaN only where every term is NaN."""
+    stacked = np.vstack(columns)
+    return np.where(np.isnan(stacked).all(axis=0), np.nan, np.nansum(stacked, axis=0))
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise division, NaN where the denominator is zero or missing."""
+    out = np.full(np.broadcast(numerator, denominator).shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=(denominator != 0) & ~np.isnan(denominator))
+    return out
+
+
+def _growth(latest: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    # relative to the magnitude, so a loss shrinking is positive growth
+    return _ratio(latest - previous, np.abs(previous))
+
+
+def _split_ratios(shares: np.ndarray) -> np.ndarray:
+    """
+    Split ratio implied by each change of a share count series, 1.0 where
+    the change is ordinary issuance or buybacks.
+    """
+    change = np.full(len(shares), 1.0)
+    if len(shares) < 2:
+        return change
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jumps = shares[1:] / shares[:-1]
+    forward = np.where(jumps >= 1, jumps, 1 / jumps)
+    nearest = SPLIT_RATIOS[np.abs(forward[:, None] / SPLIT_RATIOS - 1).argmin(axis=1)]
+    is_split = np.abs(forward / nearest - 1) <= SPLIT_TOLERANCE
+    change[1:] = np.where(is_split, np.where(jumps >= 1, nearest, 1 / nearest), 1.0)
+    return change
+
+
+def _annual_periods(
+    data_dir: str,
+    statement: str,
+    tickers: List[str],
+    as_of: pd.DatetimeIndex,
+    before: pd.Series = None,
+) -> pd.DataFrame:
+    """
+    Annual statement of the latest reporting period known on each query date,
+    in its latest version published by then. With ``before``, only periods
+    reported before each query's date in it are considered, which gives the
+    period preceding another one. Queries without one get an all-NaN row.
+    """
+    tickers = np.asarray(tickers, dtype=object)
+    days = as_of.values
+    if before is None:
+        bounds = np.full(len(tickers), np.datetime64("2262-01-01", "ns"))
+    else:
+        bounds = pd.DatetimeIndex(pd.to_datetime(before, utc=True)).values
+
+    found = []
+    for ticker in pd.unique(tickers):
+        rows = load_simfin_statements(data_dir, statement, "annual", ticker)
+        queries = np.flatnonzero((tickers == ticker) & ~np.isnat(bounds))
+        if rows is None or not len(queries):
+            continue
+        # by report date, each period's versions still in publish order
+        rows = rows.sort_values("Report Date", kind="stable")
+        reported = rows["Report Date"].to_numpy(dtype="datetime64[ns]")
+        published = rows["Publish Date"].to_numpy(dtype="datetime64[ns]")
+
+        known = (published[None, :] <= days[queries, None]) & (
+            reported[None, :] < bounds[queries, None]
+        )
+        has_period = known.any(axis=1)
+        # the last known row is the latest version of the latest period
+        last = len(rows) - 1 - known[:, ::-1].argmax(axis=1)
+        found.append(rows.iloc[last[has_period]].set_axis(queries[has_period], axis=0))
+
+    if not found:
+        return pd.DataFrame(index=np.arange(len(tickers)), columns=["Report Date", "Publish Date"])
+    return pd.concat(found).reindex(np.arange(len(tickers)))
+
+
+def _split_factors(
+    data_dir: str, tickers: List[str], report_dates: pd.Series
+) -> np.ndarray:
+    """
+    Product of the splits of each query's ticker reported after its report
+    date, which puts a share count of that date on the split-adjusted basis of
+    the price store. 1.0 where no later split is known.
+    """
+    factors = np.full(len(tickers), 1.0)
+    dates = pd.DatetimeIndex(pd.to_datetime(report_dates, utc=True)).values
+    tickers = np.asarray(tickers, dtype=object)
+
+    for ticker in pd.unique(tickers):
+        rows = load_simfin_statements(data_dir, "balance_sheet", "quarterly", ticker)
+        if rows is None or "Shares (Basic)" not in rows.columns:
+            continue
+        # the first published version of every quarter holds the count as reported then
+        history = (
+            rows.drop_duplicates("Report Date", keep="first")
+            .sort_values("Report Date", kind="stable")
+            .dropna(subset=["Shares (Basic)"])
+        )
+        history = history[history["Shares (Basic)"] > 0]
+        ratios = _split_ratios(_column(history, "Shares (Basic)"))
+        # after[i]: product of the splits from position i on
+        after = np.append(np.cumprod(ratios[::-1])[::-1], 1.0)
+
+        queries = np.flatnonzero((tickers == ticker) & ~np.isnat(dates))
+        positions = np.searchsorted(
+            history["Report Date"].to_numpy(dtype="datetime64[ns]"),
+            dates[queries],
+            side="right",
+        )
+        factors[queries] = after[positions]
+    return factors
+
+
+def _latest_closes(price_dir: str, tickers: List[str], dates: pd.DatetimeIndex) -> np.ndarray:
+    """Last close of each query's ticker on or before its date, NaN without price data."""
+    closes = np.full(len(tickers), np.nan)
+    days = dates.tz_localize(None).values.astype("datetime64[D]")
+    tickers = np.asarray(tickers, dtype=object)
+
+    for ticker in pd.unique(tickers):
+        try:
+            records = get_price_records(ticker, price_dir)
+        except FileNotFoundError:
+            continue
+        queries = np.flatnonzero(tickers == ticker)
+        positions = np.searchsorted(records["Date"], days[queries], side="right") - 1
+        found = positions >= 0
+        closes[queries[found]] = records["Close"][positions[found]]
+    return closes
+
+
+def compute_fundamental_ratios(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    tickers: Annotated[List[str], "ticker symbol of every query"],
+    dates: Annotated[List[str], "as-of date of every query, yyyy-mm-dd"],
+) -> pd.DataFrame:
+    """
+    Valuation, margin, growth, leverage and cash-flow ratios of every
+    (ticker, date) pair, as known on that date.
+
+    Returns one row per query, in query order and indexed by ("Ticker", "As Of"),
+    with the columns of ``RATIOS`` plus the fiscal year and publish date of the
+    annual statements used. Ratios whose inputs are missing are NaN.
+    """
+    tickers = list(tickers)
+    as_of = pd.DatetimeIndex(pd.to_datetime(list(dates), utc=True)).normalize()
+
+    # annual flows by reporting period, so a restatement neither replaces the
+    # latest period nor serves as the period before it
+    income = _annual_periods(data_dir, "income_statements", tickers, as_of)
+    cash_flow = _annual_periods(data_dir, "cash_flow", tickers, as_of)
+    balance = get_latest_simfin_statements_batch(
+        data_dir, "balance_sheet", "quarterly", tickers, as_of
+    )
+
+    # the annual statements of the period before, for growth
+    prev_income = _annual_periods(
+        data_dir, "income_statements", tickers, as_of, income["Report Date"]
+    )
+    prev_cash_flow = _annual_periods(
+        data_dir, "cash_flow", tickers, as_of, cash_flow["Report Date"]
+    )
+
+    revenue = _column(income, "Revenue")
+    gross_profit = _column(income, "Gross Profit")
+    operating_income = _column(income, "Operating Income (Loss)")
+    net_income = _column(income, "Net Income")
+    operating_cash_flow = _column(cash_flow, "Net Cash from Operating Activities")
+    # capital expenditure is reported as a negative change in fixed assets
+    free_cash_flow = _sum(
+        operating_cash_flow, _column(cash_flow, "Change in Fixed Assets & Intangibles")
+    )
+    dividends = -_column(cash_flow, "Dividends Paid")
+
+    # share counts as reported, scaled to the split-adjusted basis of the closes
+    shares = _column(balance, "Shares (Basic)") * _split_factors(
+        data_dir, tickers, balance["Report Date"]
+    )
+    income_shares = _column(income, "Shares (Basic)") * _split_factors(
+        data_dir, tickers, income["Report Date"]
+    )
+    shares = np.where(np.isnan(shares), income_shares, shares)
+    equity = _column(balance, "Total Equity")
+    debt = _sum(_column(balance, "Short Term Debt"), _column(balance, "Long Term Debt"))
+    cash = _column(balance, "Cash, Cash Equivalents & Short Term Investments")
+
+    price = _latest_closes(os.path.join(data_dir, "market_data", "price_data"), tickers, as_of)
+    market_cap = price * shares
+    enterprise_value = market_cap + _sum(debt, -cash)
+
+    ratios: Dict[str, np.ndarray] = {
+        "Price": price,
+        "Market Cap": market_cap,
+        "P/E": _ratio(market_cap, net_income),
+        "P/S": _ratio(market_cap, revenue),
+        "P/B": _ratio(market_cap, equity),
+        "P/FCF": _ratio(market_cap, free_cash_flow),
+        "EV/EBIT": _ratio(enterprise_value, operating_income),
+        "Earnings Yield": _ratio(net_income, market_cap),
+        "FCF Yield": _ratio(free_cash_flow, market_cap),
+        "Dividend Yield": _ratio(dividends, market_cap),
+        "Gross Margin": _ratio(gross_profit, revenue),
+        "Operating Margin": _ratio(operating_income, revenue),
+        "Net Margin": _ratio(net_income, revenue),
+        "FCF Margin": _ratio(free_cash_flow, revenue),
+        "Revenue Growth": _growth(revenue, _column(prev_income, "Revenue")),
+        "Net Income Growth": _growth(net_income, _column(prev_income, "Net Income")),
+        "Operating Cash Flow Growth": _growth(
+            operating_cash_flow,
+            _column(prev_cash_flow, "Net Cash from Operating Activities"),
+        ),
+        "Debt/Equity": _ratio(debt, equity),
+        "Net Debt/Equity": _ratio(_sum(debt, -cash), equity),
+        "Liabilities/Assets": _ratio(
+            _column(balance, "Total Liabilities"), _column(balance, "Total Assets")
+        ),
+        "Current Ratio": _ratio(
+            _column(balance, "Total Current Assets"),
+            _column(balance, "Total Current Liabilities"),
+        ),
+        "Operating Cash Flow": operating_cash_flow,
+        "Free Cash Flow": free_cash_flow,
+        "Cash Conversion": _ratio(operating_cash_flow, net_income),
+    }
+
+    result = pd.DataFrame(
+        ratios,
+        index=pd.MultiIndex.from_arrays([tickers, as_of], names=["Ticker", "As Of"]),
+    )
+    result["Fiscal Year"] = _column(income, "Fiscal Year")
+    result["Publish Date"] = pd.DatetimeIndex(pd.to_datetime(income["Publish Date"], utc=True))
+    return result
+
+
+def _format_value(ratio: str, value: float) -> str:
+    if np.isnan(value):
+        return "N/A"
+    if ratio in PERCENT_RATIOS:
+        return f"{value * 100:.2f}%"
+    if ratio in AMOUNT_RATIOS:
+        return f"{value / 1e6:,.1f}M"
+    return f"{value:.2f}"
+
+
+def format_fundamental_ratios(ratios: pd.Series) -> str:
+    """Markdown table of one row of ``compute_fundamental_ratios``, grouped by kind."""
+    lines = ["| Group | Ratio | Value |", "| --- | --- | --- |"]
+    for group, names in RATIO_GROUPS.items():
+        for name in names:
+            lines.append(f"| {group} | {name} | {_format_value(name, ratios[name])} |")
+    return "\n".join(lines)
@@ -0,0 +1,141 @@
+"""
+Compact multi-period view of SimFin line items for LLM prompts.
+
+``statement_trend`` turns the trailing reporting periods of one statement (as
+returned by ``get_simfin_statement_history``) into one row per period with the
+selected line items and their quarter-over-quarter and year-over-year changes,
+computed column-wise with NumPy. A change is only reported when the earlier
+period really is one quarter or one year before, so gaps in the filings do not
+produce misleading deltas.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# line items shown when the caller does not pick any
+DEFAULT_TREND_ITEMS = {
+    "balance_sheet": [
+        "Cash, Cash Equivalents & Short Term Investments",
+        "Total Current Assets",
+        "Total Assets",
+        "Total Current Liabilities",
+        "Long Term Debt",
+        "Total Liabilities",
+        "Total Equity",
+    ],
+    "cash_flow": [
+        "Net Cash from Operating Activities",
+        "Change in Fixed Assets & Intangibles",
+        "Net Cash from Investing Activities",
+        "Net Cash from Financing Activities",
+        "Dividends Paid",
+    ],
+    "income_statements": [
+        "Revenue",
+        "Gross Profit",
+        "Operating Income (Loss)",
+        "Net Income",
+        "Shares (Diluted)",
+    ],
+}
+
+# (label, expected spacing in days, tolerance in days) of the reported changes
+QOQ = ("QoQ", 91, 31)
+YOY = ("YoY", 365, 31)
+
+
+def _pct_change(values: np.ndarray, report_dates: np.ndarray, spacing: int, tolerance: int):
+    """
+    Change of every period against the one ``spacing`` days earlier (within
+    ``tolerance``), relative to its magnitude; NaN where there is no such period.
+    """
+    n = len(values)
+    if n == 0:
+        return np.full(0, np.nan)
+    target = report_dates - np.timedelta64(spacing, "D")
+    prev = np.searchsorted(report_dates, target, side="left")
+    # the closest earlier period to the target is either prev or prev - 1
+    prev_lower = np.clip(prev - 1, 0, n - 1)
+    prev = np.clip(prev, 0, n - 1)
+    closer = np.abs(report_dates[prev_lower] - target) < np.abs(report_dates[prev] - target)
+    prev = np.where(closer, prev_lower, prev)
+
+    valid = (np.abs(report_dates[prev] - target) <= np.timedelta64(tolerance, "D")) & (
+        prev < np.arange(n)
+    )
+    previous = values[prev]
+    out = np.full(n, np.nan)
+    np.divide(
+        values - previous,
+        np.abs(previous),
+        out=out,
+        where=valid & (previous != 0) & ~np.isnan(previous),
+    )
+    return out
+
+
+def statement_trend(
+    history: pd.DataFrame,
+    items: List[str],
+    freq: str,
+    periods: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    One row per reporting period (oldest first) with every item of ``items``
+    and its QoQ (quarterly statements only) and YoY changes. ``history`` may hold
+    earlier periods than the ``periods`` shown, they are used for the changes.
+    """
+    report_dates = history["Report Date"].to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    changes = (QOQ, YOY) if freq == "quarterly" else (YOY,)
+
+    columns = {}
+    for item in items:
+        values = (
+            pd.to_numeric(history[item], errors="coerce").to_numpy(dtype=np.float64)
+            if item in history.columns
+            else np.full(len(history), np.nan)
+        )
+        columns[item] = values
+        for label, spacing, tolerance in changes:
+            columns[f"{item} {label}"] = _pct_change(values, report_dates, spacing, tolerance)
+
+    if "Fiscal Period" in history.columns and freq == "quarterly":
+        labels = history["Fiscal Year"].astype(str) + " " + history["Fiscal Period"].astype(str)
+    elif "Fiscal Year" in history.columns:
+        labels = "FY" + history["Fiscal Year"].astype(str)
+    else:
+        labels = pd.Series(np.datetime_as_string(report_dates, unit="D"))
+
+    trend = pd.DataFrame(columns, index=pd.Index(labels.to_numpy(), name="Period"))
+    trend.insert(0, "Report Date", np.datetime_as_string(report_dates, unit="D"))
+    return trend if periods is None else trend.iloc[-periods:]
+
+
+def _fmt_amount(x: float) -> str:
+    return "N/A" if np.isnan(x) else f"{x / 1e6:,.1f}M"
+
+
+def _fmt_pct(x: float) -> str:
+    return "N/A" if np.isnan(x) else f"{x * 100:+.1f}%"
+
+
+def format_statement_trend(trend: pd.DataFrame, items: List[str]) -> str:
+    """Markdown table with one row per period and one cell per item: value (changes)."""
+    change_labels = [
+        label for label, _, _ in (QOQ, YOY) if f"{items[0]} {label}" in trend.columns
+    ]
+    lines = [
+        "| Period | Report Date | " + " | ".join(items) + " |",
+        "| --- | --- | " + " | ".join("---" for _ in items) + " |",
+    ]
+    for period, row in trend.iterrows():
+        cells = []
+        for item in items:
+            deltas = ", ".join(
+                f"{label} {_fmt_pct(row[f'{item} {label}'])}" for label in change_labels
+            )
+            cells.append(f"{_fmt_amount(row[item])} ({deltas})")
+        lines.append(f"| {period} | {row['Report Date']} | " + " | ".join(cells) + " |")
+    return "\n".join(lines)
@@ -0,0 +1,229 @@
+"""
+Precomputed ticker x date x indicator cube for backtests.
+
+``build_indicator_cube`` computes every indicator in ``best_ind_params`` for
+each ticker of the offline price data and stores the result under
+``data_cache_dir/indicator_cube``:
+
+- ``values.npy``  float64 array of shape (tickers, dates, indicators)
+- ``present.npy`` bool array of shape (tickers, dates), True where the ticker traded
+- ``dates.npy``   the shared, sorted datetime64[D] date axis
+- ``meta.json``   ticker and indicator axes plus the source file of every ticker
+
+The arrays are memory-mapped on load, so a window lookup is a single slice.
+Rebuilding is incremental: only tickers whose source CSV changed are recomputed.
+"""
+
+import json
+import os
+from typing import Annotated, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .data_manifest import PRICE_LAYOUT, get_data_manifest
+from .indicator_state import IndicatorState
+from .indicators import compute_indicators
+from .price_store import get_price_records, price_source
+from .trading_calendar import TradingCalendar
+
+CUBE_INDICATORS = IndicatorState.INDICATORS
+
+
+def get_indicator_cube_dir() -> str:
+    """Directory holding the precomputed indicator cube, created by ``build_indicator_cube``."""
+    config = get_config()
+    return os.path.join(config["data_cache_dir"], "indicator_cube")
+
+
+class IndicatorCube:
+    """Read-only view over a built cube."""
+
+    def __init__(self, meta: Dict, dates: np.ndarray, values: np.ndarray, present: np.ndarray):
+        self.tickers: List[str] = meta["tickers"]
+        self.indicators: List[str] = meta["indicators"]
+        self.sources: Dict[str, Dict] = meta["sources"]
+        self.dates = dates
+        self.values = values
+        self.present = present
+        self.calendar = TradingCalendar(dates)
+        self._ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._indicator_index = {ind: i for i, ind in enumerate(self.indicators)}
+
+    def covers(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicator: Annotated[str, "technical indicator"],
+        data_dir: Annotated[str, "directory where the YFin CSV files are stored"],
+    ) -> bool:
+        """Whether the cube holds ``indicator`` for ``symbol`` and its source is unchanged."""
+        if symbol not in self._ticker_index or indicator not in self._indicator_index:
+            return False
+        entry = get_data_manifest(data_dir, PRICE_LAYOUT).lookup(symbol, "price")
+        return entry is not None and self.sources.get(symbol) == price_source(entry.path)
+
+    def window(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicator: Annotated[str, "technical indicator"],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+    ) -> pd.Series:
+        """Indicator values on the ticker's trading days in [start_date, end_date]."""
+        lo, hi = self.calendar.slice_indices(start_date, end_date)
+        ticker = self._ticker_index[symbol]
+        values = np.asarray(self.values[ticker, lo:hi, self._indicator_index[indicator]])
+        traded = np.asarray(self.present[ticker, lo:hi])
+        dates = np.asarray(self.calendar.trading_days(start_date, end_date), dtype=object)
+        return pd.Series(values[traded], index=dates[traded], name=indicator)
+
+
+def _paths(cube_dir: str) -> Dict[str, str]:
+    return {
+        name: os.path.join(cube_dir, f"{name}.{ext}")
+        for name, ext in (("values", "npy"), ("present", "npy"), ("dates", "npy"), ("meta", "json"))
+    }
+
+
+_cubes: Dict[str, tuple] = {}
+
+
+def load_indicator_cube(cube_dir: Optional[str] = None) -> Optional[IndicatorCube]:
+    """Memory-map the cube, reusing the loaded one until it is rebuilt."""
+    cube_dir = cube_dir or get_indicator_cube_dir()
+    paths = _paths(cube_dir)
+    if not all(os.path.exists(path) for path in paths.values()):
+        return None
+
+    mtime = os.path.getmtime(paths["meta"])
+    cached = _cubes.get(cube_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(paths["meta"], "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    dates = np.load(paths["dates"])
+    values = np.load(paths["values"], mmap_mode="r")
+    present = np.load(paths["present"], mmap_mode="r")
+
+    shape = (len(meta["tickers"]), len(dates), len(meta["indicators"]))
+    if values.shape != shape or present.shape != shape[:2]:
+        # caught between the array files and the metadata of a rebuild
+        return None
+
+    cube = IndicatorCube(meta, dates, values, present)
+    _cubes[cube_dir] = (mtime, cube)
+    return cube
+
+
+def build_indicator_cube(
+    data_dir: Annotated[str, "directory where the YFin CSV files are stored"],
+    tickers: Annotated[
+        List[str], "tickers to build, defaults to every ticker with price data"
+    ] = None,
+    cube_dir: Annotated[str, "output directory, defaults to the data cache"] = None,
+) -> Dict[str, str]:
+    """
+    Build or incrementally refresh the cube. Tickers whose source CSV is
+    unchanged keep their stored values, tickers already in the cube but not
+    requested are kept as they are.
+
+    Returns the status of every requested ticker: "added", "updated",
+    "unchanged" or "missing".
+    """
+    cube_dir = cube_dir or get_indicator_cube_dir()
+    paths = _paths(cube_dir)
+    manifest = get_data_manifest(data_dir, PRICE_LAYOUT)
+    tickers = list(dict.fromkeys(tickers or manifest.tickers("price")))
+
+    old = load_indicator_cube(cube_dir)
+    if old is not None and tuple(old.indicators) != CUBE_INDICATORS:
+        # the indicator set changed: everything has to be recomputed
+        old = None
+
+    statuses, changed = {}, {}
+    for ticker in tickers:
+        entry = manifest.lookup(ticker, "price")
+        if entry is None:
+            statuses[ticker] = "missing"
+            continue
+        source = price_source(entry.path)
+        if old is not None and old.sources.get(ticker) == source:
+            statuses[ticker] = "unchanged"
+            continue
+
+        records = get_price_records(ticker, data_dir)
+        series = compute_indicators(
+            CUBE_INDICATORS,
+            records["Close"],
+            records["High"],
+            records["Low"],
+            records["Volume"],
+            records["Open"],
+        )
+        changed[ticker] = (
+            np.array(records["Date"], dtype="datetime64[D]"),
+            np.column_stack([series[ind] for ind in CUBE_INDICATORS]),
+            source,
+        )
+        statuses[ticker] = "updated" if old is not None and ticker in old.sources else "added"
+
+    if not changed:
+        return statuses
+    os.makedirs(cube_dir, exist_ok=True)
+
+    old_tickers = old.tickers if old is not None else []
+    all_tickers = old_tickers + [t for t in changed if t not in old_tickers]
+    old_dates = old.dates if old is not None else np.array([], dtype="datetime64[D]")
+    dates = old_dates
+    for ticker_dates, _, _ in changed.values():
+        dates = np.union1d(dates, ticker_dates)
+
+    shape = (len(all_tickers), len(dates), len(CUBE_INDICATORS))
+    if old is not None and old.values.shape == shape:
+        # same axes: overwrite the changed tickers in place
+        values = np.load(paths["values"], mmap_mode="r+")
+        present = np.load(paths["present"], mmap_mode="r+")
+        tmp = None
+    else:
+        tmp = {name: f"{path}.tmp.npy" for name, path in paths.items() if name in ("values", "present")}
+        values = np.lib.format.open_memmap(tmp["values"], mode="w+", dtype=np.float64, shape=shape)
+        present = np.lib.format.open_memmap(tmp["present"], mode="w+", dtype=bool, shape=shape[:2])
+        values[:] = np.nan
+        present[:] = False
+        if old is not None:
+            # carry over the kept tickers onto the widened date axis
+            positions = np.searchsorted(dates, old_dates)
+            for i in range(len(old_tickers)):
+                values[i, positions] = old.values[i]
+                present[i, positions] = old.present[i]
+
+    sources = dict(old.sources) if old is not None else {}
+    for ticker, (ticker_dates, matrix, source) in changed.items():
+        i = all_tickers.index(ticker)
+        positions = np.searchsorted(dates, ticker_dates)
+        values[i] = np.nan
+        present[i] = False
+        values[i, positions] = matrix
+        present[i, positions] = True
+        sources[ticker] = source
+
+    values.flush()
+    present.flush()
+    del values, present
+    if tmp is not None:
+        os.replace(tmp["values"], paths["values"])
+        os.replace(tmp["present"], paths["present"])
+    np.save(f"{paths['dates']}.tmp.npy", dates)
+    os.replace(f"{paths['dates']}.tmp.npy", paths["dates"])
+
+    # the metadata goes last, its mtime marks the cube as rebuilt
+    meta_tmp = f"{paths['meta']}.tmp"
+    with open(meta_tmp, "w", encoding="utf-8") as f:
+        json.dump(
+            {"tickers": all_tickers, "indicators": list(CUBE_INDICATORS), "sources": sources},
+            f,
+        )
+    os.replace(meta_tmp, paths["meta"])
+    return statuses
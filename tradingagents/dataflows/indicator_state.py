@@ -0,0 +1,380 @@
+"""
+Incremental indicator accumulators for appending daily bars.
+
+``IndicatorState`` carries the running state of every indicator in
+``best_ind_params`` so that a new bar updates all of them in O(1) instead of
+recomputing the whole history. The update rules mirror
+``tradingagents.dataflows.indicators`` and reproduce its values bar for bar.
+The state is persisted as JSON next to the ticker's price store file.
+"""
+
+import json
+import math
+import os
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .indicators import (
+    ATR_WINDOW,
+    BOLL_STD_TIMES,
+    BOLL_WINDOW,
+    MACD_WINDOWS,
+    MFI_WINDOW,
+    RSI_WINDOW,
+    VWMA_WINDOW,
+)
+
+
+def _isnan(x: float) -> bool:
+    return x != x
+
+
+class _EWM:
+    """Adjusted exponentially weighted mean, updated one value at a time."""
+
+    def __init__(self, alpha: float, num: float = 0.0, den: float = 0.0):
+        self.alpha = alpha
+        self.num = num
+        self.den = den
+
+    def update(self, x: float) -> float:
+        decay = 1.0 - self.alpha
+        self.num *= decay
+        self.den *= decay
+        if not _isnan(x):
+            self.num += x
+            self.den += 1.0
+        return self.num / self.den if self.den > 0 else math.nan
+
+    def to_dict(self) -> Dict:
+        return {"alpha": self.alpha, "num": self.num, "den": self.den}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "_EWM":
+        return cls(data["alpha"], data["num"], data["den"])
+
+
+class _Rolling:
+    """
+    Trailing-window sum and sum of squares, NaN-aware, updated in O(1).
+
+    Values are accumulated relative to ``shift`` to limit cancellation in the
+    variance, and the sums are recomputed from the buffer every ``window``
+    updates so rounding errors cannot drift (amortized O(1)).
+    """
+
+    def __init__(self, window: int, skip_nan: bool = True):
+        self.window = window
+        self.skip_nan = skip_nan
+        self.values = deque(maxlen=window)
+        self.shift = math.nan
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.count = 0
+        self.updates = 0
+
+    def _resync(self):
+        valid = [v for v in self.values if not _isnan(v)]
+        self.shift = valid[-1] if valid else math.nan
+        self.count = len(valid)
+        self.total = sum(v - self.shift for v in valid)
+        self.total_sq = sum((v - self.shift) ** 2 for v in valid)
+
+    def update(self, x: float):
+        if len(self.values) == self.window:
+            old = self.values[0]
+            if not _isnan(old):
+                self.total -= old - self.shift
+                self.total_sq -= (old - self.shift) ** 2
+                self.count -= 1
+        self.values.append(x)
+        if not _isnan(x):
+            if _isnan(self.shift):
+                self.shift = x
+            self.total += x - self.shift
+            self.total_sq += (x - self.shift) ** 2
+            self.count += 1
+
+        self.updates += 1
+        if self.updates % self.window == 0:
+            self._resync()
+
+    @property
+    def sum(self) -> float:
+        if not self.skip_nan and any(_isnan(v) for v in self.values):
+            return math.nan
+        if self.count == 0:
+            return math.nan if self.skip_nan else 0.0
+        return self.total + self.count * self.shift
+
+    @property
+    def mean(self) -> float:
+        if self.count == 0:
+            return math.nan
+        return self.shift + self.total / self.count
+
+    @property
+    def std(self) -> float:
+        if self.count < 2:
+            return math.nan
+        var = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(var, 0.0))
+
+    def to_dict(self) -> Dict:
+        return {
+            "window": self.window,
+            "skip_nan": self.skip_nan,
+            "values": list(self.values),
+            "updates": self.updates,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "_Rolling":
+        rolling = cls(data["window"], data["skip_nan"])
+        rolling.values.extend(data["values"])
+        rolling.updates = data["updates"]
+        rolling._resync()
+        return rolling
+
+
+class IndicatorState:
+    """Running state of the best_ind_params indicator set for one ticker."""
+
+    INDICATORS = (
+        "close_50_sma",
+        "close_200_sma",
+        "close_10_ema",
+        "macd",
+        "macds",
+        "macdh",
+        "rsi",
+        "boll",
+        "boll_ub",
+        "boll_lb",
+        "atr",
+        "vwma",
+        "mfi",
+    )
+
+    def __init__(self):
+        short_w, long_w, signal_w = MACD_WINDOWS
+        self.sma_50 = _Rolling(50)
+        self.sma_200 = _Rolling(200)
+        self.ema_10 = _EWM(2.0 / 11.0)
+        self.macd_short = _EWM(2.0 / (short_w + 1.0))
+        self.macd_long = _EWM(2.0 / (long_w + 1.0))
+        self.macd_signal = _EWM(2.0 / (signal_w + 1.0))
+        self.rsi_up = _EWM(1.0 / RSI_WINDOW)
+        self.rsi_down = _EWM(1.0 / RSI_WINDOW)
+        self.boll = _Rolling(BOLL_WINDOW)
+        self.atr = _EWM(1.0 / ATR_WINDOW)
+        self.vwma_tpv = _Rolling(VWMA_WINDOW)
+        self.vwma_volume = _Rolling(VWMA_WINDOW)
+        self.mfi_pos = _Rolling(MFI_WINDOW, skip_nan=False)
+        self.mfi_neg = _Rolling(MFI_WINDOW, skip_nan=False)
+
+        self.prev_close: Optional[float] = None
+        self.prev_tp: Optional[float] = None
+        self.n_bars = 0
+        self.last_date: Optional[str] = None
+        # (high, low, close, volume) of the last bar, to detect revised bars
+        self.last_bar: Optional[List[float]] = None
+        self.values: Dict[str, float] = {}
+
+    def update(
+        self,
+        date: str,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> Dict[str, float]:
+        """Feed one bar and return the indicator values as of that bar."""
+        high, low, close, volume = float(high), float(low), float(close), float(volume)
+        first = self.prev_close is None
+        prev_close = close if first else self.prev_close
+
+        values = {}
+
+        # moving averages
+        self.sma_50.update(close)
+        self.sma_200.update(close)
+        values["close_50_sma"] = self.sma_50.mean
+        values["close_200_sma"] = self.sma_200.mean
+        values["close_10_ema"] = self.ema_10.update(close)
+
+        # MACD
+        macd = self.macd_short.update(close) - self.macd_long.update(close)
+        macds = self.macd_signal.update(macd)
+        values["macd"] = macd
+        values["macds"] = macds
+        values["macdh"] = macd - macds
+
+        # RSI
+        diff = 0.0 if first else close - prev_close
+        up_sma = self.rsi_up.update(diff if diff > 0 else 0.0)
+        down_sma = self.rsi_down.update(-diff if diff < 0 else 0.0)
+        total = up_sma + down_sma
+        rsi = 100 * (up_sma / total) if total != 0 else 50.0
+        values["rsi"] = 50.0 if first else (0.0 if _isnan(rsi) else rsi)
+
+        # Bollinger bands
+        self.boll.update(close)
+        moving_avg = self.boll.mean
+        width = BOLL_STD_TIMES * self.boll.std
+        values["boll"] = moving_avg
+        values["boll_ub"] = moving_avg + width
+        values["boll_lb"] = moving_avg - width
+
+        # ATR
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        if _isnan(high - low) or _isnan(prev_close):
+            tr = 0.0
+        values["atr"] = self.atr.update(tr)
+
+        # VWMA
+        tp = (close + high + low) / 3.0
+        tp = 0.0 if _isnan(tp) else tp
+        self.vwma_tpv.update(volume * tp)
+        self.vwma_volume.update(volume)
+        rolling_tpv = self.vwma_tpv.sum
+        rolling_vol = self.vwma_volume.sum
+        values["vwma"] = rolling_tpv / rolling_vol if rolling_vol != 0 else 0.0
+
+        # MFI
+        raw_money_flow = tp * volume
+        tp_diff = 0.0 if first else tp - self.prev_tp
+        self.mfi_pos.update(raw_money_flow if tp_diff > 0 else 0.0)
+        self.mfi_neg.update(raw_money_flow if tp_diff < 0 else 0.0)
+        pos_sum = self.mfi_pos.sum
+        total_flow = pos_sum + self.mfi_neg.sum
+        mfi = pos_sum / total_flow if total_flow > 0 else 0.5
+        values["mfi"] = 0.5 if self.n_bars < MFI_WINDOW else (0.0 if _isnan(mfi) else mfi)
+
+        self.prev_close = close
+        self.prev_tp = tp
+        self.n_bars += 1
+        self.last_date = str(date)[:10]
+        self.last_bar = [high, low, close, volume]
+        self.values = values
+        return values
+
+    def update_records(self, records: np.ndarray) -> Dict[str, float]:
+        """Feed every bar of a structured price array (see price_store)."""
+        dates = np.datetime_as_string(records["Date"], unit="D")
+        for date, high, low, close, volume in zip(
+            dates,
+            records["High"].tolist(),
+            records["Low"].tolist(),
+            records["Close"].tolist(),
+            records["Volume"].tolist(),
+        ):
+            self.update(date, high, low, close, volume)
+        return self.values
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "IndicatorState":
+        state = cls()
+        state.update_records(records)
+        return state
+
+    _EWM_FIELDS = ("ema_10", "macd_short", "macd_long", "macd_signal", "rsi_up", "rsi_down", "atr")
+    _ROLLING_FIELDS = ("sma_50", "sma_200", "boll", "vwma_tpv", "vwma_volume", "mfi_pos", "mfi_neg")
+
+    def to_dict(self) -> Dict:
+        data = {name: getattr(self, name).to_dict() for name in self._EWM_FIELDS + self._ROLLING_FIELDS}
+        data.update(
+            prev_close=self.prev_close,
+            prev_tp=self.prev_tp,
+            n_bars=self.n_bars,
+            last_date=self.last_date,
+            last_bar=self.last_bar,
+            values=self.values,
+        )
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "IndicatorState":
+        state = cls()
+        for name in cls._EWM_FIELDS:
+            setattr(state, name, _EWM.from_dict(data[name]))
+        for name in cls._ROLLING_FIELDS:
+            setattr(state, name, _Rolling.from_dict(data[name]))
+        state.prev_close = data["prev_close"]
+        state.prev_tp = data["prev_tp"]
+        state.n_bars = data["n_bars"]
+        state.last_date = data["last_date"]
+        state.last_bar = data.get("last_bar")
+        state.values = data["values"]
+        return state
+
+
+def get_state_path(store_path: str) -> str:
+    """Location of the indicator state persisted alongside a price store file."""
+    return os.path.splitext(store_path)[0] + ".state.json"
+
+
+def load_indicator_state(path: str) -> Optional[IndicatorState]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return IndicatorState.from_dict(json.load(f))
+    except (ValueError, KeyError):
+        return None
+
+
+def save_indicator_state(path: str, state: IndicatorState) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state.to_dict(), f)
+    os.replace(tmp_path, path)
+
+
+def _same_value(a: float, b: float) -> bool:
+    return a == b or (_isnan(a) and _isnan(b))
+
+
+def _matches_last_bar(state: IndicatorState, records: np.ndarray) -> bool:
+    """Whether the bar the state consumed last is still the same in ``records``."""
+    if state.n_bars == 0 or state.n_bars > len(records) or state.last_bar is None:
+        return False
+    bar = records[state.n_bars - 1]
+    if str(bar["Date"]) != state.last_date:
+        return False
+    current = (bar["High"], bar["Low"], bar["Close"], bar["Volume"])
+    return all(_same_value(float(a), b) for a, b in zip(current, state.last_bar))
+
+
+def refresh_indicator_state(
+    store_path: str,
+    records: np.ndarray,
+    changed_from: Optional[int] = None,
+) -> IndicatorState:
+    """
+    Bring the persisted state of a price store up to date with ``records``.
+
+    Only bars after the state's last bar are fed. If the stored history no
+    longer lines up with the state (e.g. the store was rebuilt, or its last
+    consumed bar was revised), or if ``changed_from`` (the first position of
+    ``records`` that was modified) falls among the consumed bars, the state is
+    reseeded from the full history.
+    """
+    path = get_state_path(store_path)
+    state = load_indicator_state(path)
+
+    if (
+        state is None
+        or not _matches_last_bar(state, records)
+        or (changed_from is not None and changed_from < state.n_bars)
+    ):
+        state = IndicatorState.from_records(records)
+    elif state.n_bars == len(records):
+        return state
+    else:
+        state.update_records(records[state.n_bars :])
+
+    save_indicator_state(path, state)
+    return state
@@ -0,0 +1,276 @@
+"""
+Vectorized technical indicators computed directly from float64 price arrays.
+
+The definitions follow stockstats (rolling windows with ``min_periods=1``,
+adjusted exponential means, sample standard deviation) so the values agree
+with ``stockstats.wrap(df)[indicator]`` while avoiding any DataFrame copies.
+"""
+
+import re
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Callable, Dict, Iterable
+
+# stockstats default windows
+MACD_WINDOWS = (12, 26, 9)
+RSI_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+ATR_WINDOW = 14
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+
+_MOVING_AVERAGE = re.compile(r"^(open|high|low|close|volume)_(\d+)_(sma|ema)$")
+
+
+def _decayed_cumsum(x: np.ndarray, decay: float) -> np.ndarray:
+    """
+    Solve y[t] = decay * y[t-1] + x[t] without a Python-level loop per element.
+
+    Inside a block, y[s+k] = decay**k * (decay * y[s-1] + sum_j x[s+j] * decay**-j),
+    which is a plain cumulative sum. Blocks are sized so that decay**-j stays far
+    from overflow, and the last value of each block is carried into the next.
+    """
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    if decay <= 0.0:
+        out[:] = x
+        return out
+
+    block = max(1, int(150.0 / -np.log10(decay))) if decay < 1.0 else n
+    powers = decay ** -np.arange(min(block, n), dtype=np.float64)
+
+    carry = 0.0
+    for start in range(0, n, block):
+        chunk = x[start : start + block]
+        scale = powers[: len(chunk)]
+        out[start : start + len(chunk)] = (decay * carry + np.cumsum(chunk * scale)) / scale
+        carry = out[start + len(chunk) - 1]
+    return out
+
+
+def ewm_mean(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Adjusted exponentially weighted mean (pandas ``ewm(alpha=..., adjust=True)``)."""
+    valid = ~np.isnan(x)
+    decay = 1.0 - alpha
+    num = _decayed_cumsum(np.where(valid, x, 0.0), decay)
+    den = _decayed_cumsum(valid.astype(np.float64), decay)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return num / den
+
+
+def ema(x: np.ndarray, window: int) -> np.ndarray:
+    """Exponential moving average with span ``window``."""
+    return ewm_mean(x, 2.0 / (window + 1.0))
+
+
+def smma(x: np.ndarray, window: int) -> np.ndarray:
+    """Smoothed (Wilder) moving average."""
+    return ewm_mean(x, 1.0 / window)
+
+
+def _rolling_sum_count(x: np.ndarray, window: int):
+    valid = ~np.isnan(x)
+    sums = np.cumsum(np.where(valid, x, 0.0))
+    counts = np.cumsum(valid, dtype=np.int64)
+    sums[window:] = sums[window:] - sums[:-window]
+    counts[window:] = counts[window:] - counts[:-window]
+    return sums, counts
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum over the trailing ``window`` values (partial windows allowed)."""
+    sums, counts = _rolling_sum_count(x, window)
+    return np.where(counts > 0, sums, np.nan)
+
+
+def sma(x: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average over the trailing ``window`` values (partial windows allowed)."""
+    sums, counts = _rolling_sum_count(x, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation (ddof=1, partial windows allowed)."""
+    padded = np.concatenate([np.full(window - 1, np.nan), x])
+    view = sliding_window_view(padded, window)
+    valid = ~np.isnan(view)
+    counts = valid.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(valid, view, 0.0).sum(axis=1) / counts
+        deviations = np.where(valid, view - mean[:, None], 0.0)
+        var = (deviations * deviations).sum(axis=1) / (counts - 1)
+    return np.where(counts > 1, np.sqrt(var), np.nan)
+
+
+def _shift_prev(x: np.ndarray) -> np.ndarray:
+    """Previous value of each element, with the first element repeated."""
+    out = np.empty_like(x)
+    if len(x):
+        out[0] = x[0]
+        out[1:] = x[:-1]
+    return out
+
+
+def _diff(x: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(x)
+    out[1:] = np.diff(x)
+    return out
+
+
+def typical_price(close, high, low) -> np.ndarray:
+    # stockstats fills missing typical prices with 0
+    return np.nan_to_num((close + high + low) / 3.0, nan=0.0)
+
+
+def macd_lines(close: np.ndarray, windows=MACD_WINDOWS) -> Dict[str, np.ndarray]:
+    short_w, long_w, signal_w = windows
+    macd = ema(close, short_w) - ema(close, long_w)
+    macds = ema(macd, signal_w)
+    return {"macd": macd, "macds": macds, "macdh": macd - macds}
+
+
+def rsi(close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+    diff = _diff(close)
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+    up_sma = smma(up, window)
+    down_sma = smma(down, window)
+
+    total = up_sma + down_sma
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up_sma / total), 50.0)
+    if len(out):
+        out[0] = 50.0
+    return np.nan_to_num(out, nan=0.0)
+
+
+def bollinger_bands(close: np.ndarray, window: int = BOLL_WINDOW) -> Dict[str, np.ndarray]:
+    moving_avg = sma(close, window)
+    width = BOLL_STD_TIMES * rolling_std(close, window)
+    return {
+        "boll": moving_avg,
+        "boll_ub": moving_avg + width,
+        "boll_lb": moving_avg - width,
+    }
+
+
+def true_range(close, high, low) -> np.ndarray:
+    prev_close = _shift_prev(close)
+    tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return np.nan_to_num(tr, nan=0.0)
+
+
+def atr(close, high, low, window: int = ATR_WINDOW) -> np.ndarray:
+    return smma(true_range(close, high, low), window)
+
+
+def vwma(close, high, low, volume, window: int = VWMA_WINDOW) -> np.ndarray:
+    tpv = volume * typical_price(close, high, low)
+    rolling_tpv = rolling_sum(tpv, window)
+    rolling_vol = rolling_sum(volume, window)
+    return np.divide(
+        rolling_tpv,
+        rolling_vol,
+        out=np.zeros_like(rolling_tpv),
+        where=rolling_vol != 0,
+    )
+
+
+def mfi(close, high, low, volume, window: int = MFI_WINDOW) -> np.ndarray:
+    tp = typical_price(close, high, low)
+    raw_money_flow = tp * volume
+    tp_diff = _diff(tp)
+
+    pos_flow = np.where(tp_diff > 0, raw_money_flow, 0.0)
+    neg_flow = np.where(tp_diff < 0, raw_money_flow, 0.0)
+
+    # stockstats uses a plain cumulative-sum rolling window here
+    pos_sum = np.cumsum(pos_flow)
+    neg_sum = np.cumsum(neg_flow)
+    pos_sum[window:] = pos_sum[window:] - pos_sum[:-window]
+    neg_sum[window:] = neg_sum[window:] - neg_sum[:-window]
+
+    total_flow = pos_sum + neg_sum
+    out = np.divide(pos_sum, total_flow, out=np.full_like(pos_sum, 0.5), where=total_flow > 0)
+    out[:window] = 0.5
+    return np.nan_to_num(out, nan=0.0)
+
+
+def _moving_average(name: str, prices: Dict[str, np.ndarray]) -> np.ndarray:
+    column, window, kind = _MOVING_AVERAGE.match(name).groups()
+    func = sma if kind == "sma" else ema
+    return func(prices[column], int(window))
+
+
+# indicator group -> function of the price arrays returning {indicator: values}
+_INDICATOR_GROUPS: Dict[str, Callable[[Dict[str, np.ndarray]], Dict[str, np.ndarray]]] = {
+    "macd": lambda p: macd_lines(p["close"]),
+    "boll": lambda p: bollinger_bands(p["close"]),
+    "rsi": lambda p: {"rsi": rsi(p["close"])},
+    "atr": lambda p: {"atr": atr(p["close"], p["high"], p["low"])},
+    "vwma": lambda p: {"vwma": vwma(p["close"], p["high"], p["low"], p["volume"])},
+    "mfi": lambda p: {"mfi": mfi(p["close"], p["high"], p["low"], p["volume"])},
+}
+
+_GROUP_OF = {
+    "macd": "macd",
+    "macds": "macd",
+    "macdh": "macd",
+    "boll": "boll",
+    "boll_ub": "boll",
+    "boll_lb": "boll",
+    "rsi": "rsi",
+    "atr": "atr",
+    "vwma": "vwma",
+    "mfi": "mfi",
+}
+
+
+def is_supported(indicator: str) -> bool:
+    """Whether ``indicator`` can be computed by this engine."""
+    return indicator in _GROUP_OF or _MOVING_AVERAGE.match(indicator) is not None
+
+
+def compute_indicators(
+    indicators: Iterable[str],
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    open_price: np.ndarray = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute several indicators in one pass over the price arrays. Indicators
+    that share intermediate series (e.g. macd/macds/macdh) are computed once.
+    """
+    prices = {
+        "close": np.ascontiguousarray(close, dtype=np.float64),
+        "high": np.ascontiguousarray(high, dtype=np.float64),
+        "low": np.ascontiguousarray(low, dtype=np.float64),
+        "volume": np.ascontiguousarray(volume, dtype=np.float64),
+    }
+    if open_price is not None:
+        prices["open"] = np.ascontiguousarray(open_price, dtype=np.float64)
+
+    computed: Dict[str, Dict[str, np.ndarray]] = {}
+    results: Dict[str, np.ndarray] = {}
+    for indicator in indicators:
+        if indicator in _GROUP_OF:
+            group = _GROUP_OF[indicator]
+            if group not in computed:
+                computed[group] = _INDICATOR_GROUPS[group](prices)
+            results[indicator] = computed[group][indicator]
+        elif _MOVING_AVERAGE.match(indicator):
+            results[indicator] = _moving_average(indicator, prices)
+        else:
+            raise ValueError(f"Indicator {indicator} is not supported by the NumPy engine.")
+    return results
+
+
+def compute_indicator(indicator: str, close, high, low, volume, open_price=None) -> np.ndarray:
+    """Compute a single indicator series."""
+    return compute_indicators([indicator], close, high, low, volume, open_price)[indicator]
@@ -0,0 +1,81 @@
+"""
+Aggregated numeric view of Finnhub insider data for LLM prompts.
+
+The per-filing listings of the insider tools grow with the look-back window;
+these summaries reduce them to a few grouped totals (net shares and traded
+value by insider and by transaction code, monthly sentiment statistics),
+computed with pandas group-bys over the deduplicated entries.
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+
+def _numeric(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame.columns:
+        return pd.Series(np.nan, index=frame.index)
+    return pd.to_numeric(frame[column], errors="coerce")
+
+
+def _table(frame: pd.DataFrame) -> str:
+    return frame.to_string(float_format=lambda x: f"{x:,.2f}")
+
+
+def summarize_insider_transactions(entries: List[dict]) -> str:
+    """Net shares, traded value and filing counts by insider and by transaction code."""
+    if not entries:
+        return "No insider transactions to summarize."
+
+    frame = pd.DataFrame(entries)
+    data = pd.DataFrame(
+        {
+            "Insider": frame["name"] if "name" in frame.columns else "N/A",
+            "Code": frame["transactionCode"] if "transactionCode" in frame.columns else "N/A",
+            "Net Shares": _numeric(frame, "change"),
+        }
+    )
+    # value of the change at the transaction price, negative for net sales
+    data["Net Value"] = data["Net Shares"] * _numeric(frame, "transactionPrice")
+    data["Filings"] = 1
+
+    totals = data[["Net Shares", "Net Value", "Filings"]].sum()
+    lines = [
+        f"- Total: {len(data)} filings, net shares {totals['Net Shares']:+,.0f}, "
+        f"net value {totals['Net Value']:+,.2f}",
+        "",
+        "By insider:",
+        _table(
+            data.groupby("Insider", sort=False)[["Net Shares", "Net Value", "Filings"]]
+            .sum()
+            .sort_values("Net Value", key=np.abs, ascending=False)
+        ),
+        "",
+        "By transaction code:",
+        _table(data.groupby("Code")[["Net Shares", "Net Value", "Filings"]].sum()),
+    ]
+    return "\n".join(lines)
+
+
+def summarize_insider_sentiment(entries: List[dict]) -> str:
+    """Total net change and the mean, minimum and maximum monthly share purchase ratio."""
+    if not entries:
+        return "No insider sentiment to summarize."
+
+    frame = pd.DataFrame(entries)
+    change = _numeric(frame, "change")
+    mspr = _numeric(frame, "mspr")
+    months = (
+        frame["year"].astype(str) + "-" + frame["month"].astype(str)
+        if {"year", "month"} <= set(frame.columns)
+        else pd.Series("N/A", index=frame.index)
+    )
+    lines = [
+        f"- Months: {len(frame)} ({months.iloc[0]} to {months.iloc[-1]})",
+        f"- Net change: {change.sum():+,.0f} ({int((change > 0).sum())} months net buying, "
+        f"{int((change < 0).sum())} months net selling)",
+        f"- MSPR: mean {mspr.mean():+.2f}, min {mspr.min():+.2f}, max {mspr.max():+.2f}, "
+        f"latest {mspr.iloc[-1]:+.2f}",
+    ]
+    return "\n".join(lines)
@@ -1,9 +1,28 @@
-from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category
+from typing import Annotated, Dict, List
+from .reddit_utils import fetch_top_from_category, fetch_top_from_category_window
 from .yfin_utils import *
 from .stockstats_utils import *
+from .price_summary import summarize_price_frame
+from .simfin_store import (
+    get_latest_simfin_statement,
+    get_latest_simfin_statements,
+    get_simfin_statement_history,
+)
+from .fundamentals_trend import DEFAULT_TREND_ITEMS, format_statement_trend, statement_trend
+from .fundamental_ratios import compute_fundamental_ratios, format_fundamental_ratios
+from .price_store import (
+    ensure_price_store,
+    frame_with_date_column,
+    get_price_frame,
+    load_price_frame,
+    slice_price_frame,
+)
+from .yfin_cache import get_cached_price_records, get_online_store_path, prefetch_prices
+from .data_manifest import get_data_manifest
+from .indicator_cube import load_indicator_cube
 from .googlenews_utils import *
-from .finnhub_utils import get_data_in_range
+from .finnhub_utils import get_data_in_range, unique_entries
+from .insider_summary import summarize_insider_sentiment, summarize_insider_transactions
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
@@ -65,12 +84,14 @@ def get_finnhub_company_insider_sentiment(
         "current date of you are trading at, yyyy-mm-dd",
     ],
     look_back_days: Annotated[int, "number of days to look back"],
+    summary: Annotated[bool, "append an aggregated numeric summary"] = False,
 ):
     """
     Retrieve insider sentiment about a company (retrieved from public SEC information) for the past 15 days
     Args:
         ticker (str): ticker symbol of the company
         curr_date (str): current date you are trading on, yyyy-mm-dd
+        summary (bool): whether to append an aggregated numeric summary
     Returns:
         str: a report of the sentiment in the past 15 days starting at curr_date
     """
@@ -84,13 +105,14 @@ def get_finnhub_company_insider_sentiment(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    # repeated entries are dropped by hashing, not by scanning the ones already seen
+    entries = unique_entries(data)
+    result_str = "".join(
+        f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
+        for entry in entries
+    )
+    if summary:
+        result_str += f"### Summary:\n{summarize_insider_sentiment(entries)}\n\n"
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -106,12 +128,14 @@ def get_finnhub_company_insider_transactions(
         "current date you are trading at, yyyy-mm-dd",
     ],
     look_back_days: Annotated[int, "how many days to look back"],
+    summary: Annotated[bool, "append an aggregated numeric summary"] = False,
 ):
     """
     Retrieve insider transcaction information about a company (retrieved from public SEC information) for the past 15 days
     Args:
         ticker (str): ticker symbol of the company
         curr_date (str): current date you are trading at, yyyy-mm-dd
+        summary (bool): whether to append net shares and value by insider and by transaction code
     Returns:
         str: a report of the company's insider transaction/trading informtaion in the past 15 days
     """
@@ -125,14 +149,14 @@ def get_finnhub_company_insider_transactions(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    # repeated entries are dropped by hashing, not by scanning the ones already seen
+    entries = unique_entries(data)
+    result_str = "".join(
+        f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+        for entry in entries
+    )
+    if summary:
+        result_str += f"### Summary:\n{summarize_insider_transactions(entries)}\n\n"
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -141,54 +165,43 @@ def get_finnhub_company_insider_transactions(
     )
 
 
-def get_simfin_balance_sheet(
-    ticker: Annotated[str, "ticker symbol"],
-    freq: Annotated[
-        str,
-        "reporting frequency of the company's financial history: annual / quarterly",
-    ],
-    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
-):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+# statement -> (name in the reports, description appended to the report)
+SIMFIN_REPORTS = {
+    "balance_sheet": (
+        "balance sheet",
+        "This includes metadata like reporting dates and currency, share details, and a breakdown of assets, liabilities, and equity. Assets are grouped as current (liquid items like cash and receivables) and noncurrent (long-term investments and property). Liabilities are split between short-term obligations and long-term debts, while equity reflects shareholder funds such as paid-in capital and retained earnings. Together, these components ensure that total assets equal the sum of liabilities and equity.",
+    ),
+    "cash_flow": (
+        "cash flow statement",
+        "This includes metadata like reporting dates and currency, share details, and a breakdown of cash movements. Operating activities show cash generated from core business operations, including net income adjustments for non-cash items and working capital changes. Investing activities cover asset acquisitions/disposals and investments. Financing activities include debt transactions, equity issuances/repurchases, and dividend payments. The net change in cash represents the overall increase or decrease in the company's cash position during the reporting period.",
+    ),
+    "income_statements": (
+        "income statement",
+        "This includes metadata like reporting dates and currency, share details, and a comprehensive breakdown of the company's financial performance. Starting with Revenue, it shows Cost of Revenue and resulting Gross Profit. Operating Expenses are detailed, including SG&A, R&D, and Depreciation. The statement then shows Operating Income, followed by non-operating items and Interest Expense, leading to Pretax Income. After accounting for Income Tax and any Extraordinary items, it concludes with Net Income, representing the company's bottom-line profit or loss for the period.",
+    ),
+}
 
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+def _format_simfin_statement(statement, latest, ticker, freq):
+    name, description = SIMFIN_REPORTS[statement]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No balance sheet available before the given current date.")
+    if latest is None:
+        print(f"No {name} available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
-    latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
+    latest = latest.drop("SimFinId")
 
     return (
-        f"## {freq} balance sheet for {ticker} released on {str(latest_balance_sheet['Publish Date'])[0:10]}: \n"
-        + str(latest_balance_sheet)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a breakdown of assets, liabilities, and equity. Assets are grouped as current (liquid items like cash and receivables) and noncurrent (long-term investments and property). Liabilities are split between short-term obligations and long-term debts, while equity reflects shareholder funds such as paid-in capital and retained earnings. Together, these components ensure that total assets equal the sum of liabilities and equity."
+        f"## {freq} {name} for {ticker} released on {str(latest['Publish Date'])[0:10]}: \n"
+        + str(latest)
+        + "\n\n"
+        + description
     )
 
 
-def get_simfin_cashflow(
+def get_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
         str,
@@ -196,43 +209,26 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
+    # read only this ticker's rows from the per-ticker SimFin store
+    latest_balance_sheet = get_latest_simfin_statement(
+        DATA_DIR, "balance_sheet", freq, ticker, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
+    return _format_simfin_statement("balance_sheet", latest_balance_sheet, ticker, freq)
 
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
-
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No cash flow statement available before the given current date.")
-        return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
-    # drop the SimFinID column
-    latest_cash_flow = latest_cash_flow.drop("SimFinId")
-
-    return (
-        f"## {freq} cash flow statement for {ticker} released on {str(latest_cash_flow['Publish Date'])[0:10]}: \n"
-        + str(latest_cash_flow)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a breakdown of cash movements. Operating activities show cash generated from core business operations, including net income adjustments for non-cash items and working capital changes. Investing activities cover asset acquisitions/disposals and investments. Financing activities include debt transactions, equity issuances/repurchases, and dividend payments. The net change in cash represents the overall increase or decrease in the company's cash position during the reporting period."
+def get_simfin_cashflow(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    # read only this ticker's rows from the per-ticker SimFin store
+    latest_cash_flow = get_latest_simfin_statement(
+        DATA_DIR, "cash_flow", freq, ticker, curr_date
     )
+    return _format_simfin_statement("cash_flow", latest_cash_flow, ticker, freq)
 
 
 def get_simfin_income_statements(
@@ -243,42 +239,88 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
+    # read only this ticker's rows from the per-ticker SimFin store
+    latest_income = get_latest_simfin_statement(
+        DATA_DIR, "income_statements", freq, ticker, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
+    return _format_simfin_statement("income_statements", latest_income, ticker, freq)
 
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
 
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+def get_simfin_financial_statements(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    """
+    Balance sheet, cash flow statement and income statement of a company in one
+    report, in the format of the single-statement tools.
+    """
+    latest = get_latest_simfin_statements(DATA_DIR, freq, ticker, curr_date)
+    reports = [
+        _format_simfin_statement(statement, row, ticker, freq)
+        for statement, row in latest.items()
+    ]
+    return "\n\n".join(report for report in reports if report)
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No income statement available before the given current date.")
+def get_simfin_statement_trend(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    periods: Annotated[int, "number of trailing reporting periods"] = 8,
+    items: Annotated[List[str], "line items, defaults to the key items of the statement"] = None,
+):
+    if statement not in SIMFIN_REPORTS:
+        return f"Unknown statement '{statement}', use one of: {', '.join(SIMFIN_REPORTS)}."
+
+    # one year of extra history so the oldest periods shown have their YoY change
+    extra = 4 if freq == "quarterly" else 1
+    history = get_simfin_statement_history(
+        DATA_DIR, statement, freq, ticker, curr_date, periods + extra
+    )
+
+    name = SIMFIN_REPORTS[statement][0]
+    if history is None:
+        print(f"No {name} available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+    if not items:
+        # the default items this dataset actually reports
+        items = [item for item in DEFAULT_TREND_ITEMS[statement] if item in history.columns]
+    if not items:
+        return f"No matching line items in the {freq} {name} of {ticker}."
+    trend = statement_trend(history, list(items), freq, periods)
+    return (
+        f"## {freq} {name} trend for {ticker}, last {len(trend)} periods released by {curr_date}:\n\n"
+        + format_statement_trend(trend, items)
+    )
 
-    # drop the SimFinID column
-    latest_income = latest_income.drop("SimFinId")
+
+def get_fundamental_ratios(
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    # computed from the local SimFin statements and price store, no network access
+    try:
+        ratios = compute_fundamental_ratios(DATA_DIR, [ticker], [curr_date]).iloc[0]
+    except FileNotFoundError as e:
+        return f"No local fundamental data available to compute ratios: {e}"
+
+    if pd.isna(ratios["Publish Date"]):
+        return f"No financial statements available for {ticker} before {curr_date}."
 
     return (
-        f"## {freq} income statement for {ticker} released on {str(latest_income['Publish Date'])[0:10]}: \n"
-        + str(latest_income)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a comprehensive breakdown of the company's financial performance. Starting with Revenue, it shows Cost of Revenue and resulting Gross Profit. Operating Expenses are detailed, including SG&A, R&D, and Depreciation. The statement then shows Operating Income, followed by non-operating items and Interest Expense, leading to Pretax Income. After accounting for Income Tax and any Extraordinary items, it concludes with Net Income, representing the company's bottom-line profit or loss for the period."
+        f"## Fundamental ratios for {ticker} on {curr_date} (fiscal year {int(ratios['Fiscal Year'])}, "
+        f"released on {str(ratios['Publish Date'])[0:10]}):\n\n"
+        + format_fundamental_ratios(ratios)
+        + "\n\nValuation ratios use the last close on or before the current date and the latest quarterly share count, adjusted for share splits reported since. Earnings, revenue and cash flow figures come from the latest annual statements, and growth compares them with the previous annual statements. Leverage ratios use the latest quarterly balance sheet."
     )
 
 
@@ -326,26 +368,18 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
+    curr_date = start_date.strftime("%Y-%m-%d")
 
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # one pass over each subreddit file for the whole window, day by day
+    posts_by_day = fetch_top_from_category_window(
+        "global_news",
+        before,
+        curr_date,
+        max_limit_per_day,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+        workers=get_config().get("reddit_scan_workers", 1),
+    )
+    posts = [post for day_posts in posts_by_day.values() for post in day_posts]
 
     if len(posts) == 0:
         return ""
@@ -380,31 +414,19 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    curr_date = start_date.strftime("%Y-%m-%d")
+
+    # one pass over each subreddit file for the whole window, day by day
+    posts_by_day = fetch_top_from_category_window(
+        "company_news",
+        before,
+        curr_date,
+        max_limit_per_day,
+        ticker,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+        workers=get_config().get("reddit_scan_workers", 1),
     )
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
+    posts = [post for day_posts in posts_by_day.values() for post in day_posts]
 
     if len(posts) == 0:
         return ""
@@ -419,6 +441,80 @@ def get_reddit_company_news(
     return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
 
 
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -429,132 +525,100 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in BEST_IND_PARAMS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
         )
 
     end_date = curr_date
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
+    # offline backtests read a single slice of the precomputed indicator cube
+    # when it is up to date, otherwise the series is computed once for the window
+    cube = None if online else load_indicator_cube()
+    if cube is not None and cube.covers(
+        symbol, indicator, os.path.join(DATA_DIR, "market_data", "price_data")
+    ):
+        ind_values = cube.window(
+            symbol, indicator, before.strftime("%Y-%m-%d"), end_date
         )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
-
-        ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
     else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
-
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+        ind_values = get_stockstats_indicator_window(
+            symbol, indicator, before.strftime("%Y-%m-%d"), end_date, online
+        )
 
-            curr_date = curr_date - relativedelta(days=1)
+    # the series only holds trading days, so weekends and holidays cost nothing
+    ind_string = "".join(
+        f"{date}: {value}\n" for date, value in ind_values[::-1].items()
+    )
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS.get(indicator, "No description available.")
     )
 
     return result_str
 
 
+def get_stock_stats_indicators_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> str:
+
+    unsupported = [ind for ind in indicators if ind not in BEST_IND_PARAMS]
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+        )
+
+    # keep the caller's order but compute each indicator only once
+    indicators = list(dict.fromkeys(indicators))
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = (curr_date_dt - relativedelta(days=look_back_days)).strftime("%Y-%m-%d")
+
+    try:
+        table = StockstatsUtils.get_stock_stats_batch(
+            symbol,
+            indicators,
+            before,
+            curr_date,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
+        )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicators {indicators} from {before} to {curr_date}: {e}"
+        )
+        return ""
+
+    if table.empty:
+        table_str = "No trading days in this window."
+    else:
+        table_str = table.to_string(float_format=lambda value: f"{value:.4f}")
+
+    descriptions = "\n".join(
+        f"- {indicator}: {BEST_IND_PARAMS[indicator]}" for indicator in indicators
+    )
+
+    return (
+        f"## {', '.join(indicators)} values for {symbol} from {before} to {curr_date}:\n\n"
+        + table_str
+        + "\n\n"
+        + descriptions
+    )
+
+
 def get_stockstats_indicator(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -584,6 +648,32 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+def get_stockstats_indicator_window(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> pd.Series:
+
+    try:
+        indicator_values = StockstatsUtils.get_stock_stats_window(
+            symbol,
+            indicator,
+            start_date,
+            end_date,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
+        )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicator {indicator} from {start_date} to {end_date}: {e}"
+        )
+        return pd.Series(dtype=object)
+
+    return indicator_values
+
+
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -594,25 +684,14 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
+    # read the data between the start and end dates (inclusive) from the price store
+    filtered_data = get_price_frame(
+        symbol,
+        os.path.join(DATA_DIR, "market_data", "price_data"),
+        start_date,
+        curr_date,
     )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
-
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
         "display.max_rows", None, "display.max_columns", None, "display.width", None
@@ -632,24 +711,25 @@ def get_YFin_data_online(
 ):
 
     datetime.strptime(start_date, "%Y-%m-%d")
-    datetime.strptime(end_date, "%Y-%m-%d")
-
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    end_inclusive = datetime.strptime(end_date, "%Y-%m-%d") - relativedelta(days=1)
+    end_inclusive = end_inclusive.strftime("%Y-%m-%d")
+
+    # Fetch historical data for the specified date range (end exclusive) from the
+    # range-aware cache, downloading only the bars it does not cover yet
+    records = None
+    if end_inclusive >= start_date:
+        records = get_cached_price_records(symbol.upper(), start_date, end_inclusive)
+    if records is not None:
+        data = load_price_frame(get_online_store_path(symbol.upper()))
+        data = frame_with_date_column(slice_price_frame(data, start_date, end_inclusive))
+        data = data.set_index("Date")
 
     # Check if data is empty
-    if data.empty:
+    if records is None or data.empty:
         return (
             f"No data found for symbol '{symbol}' between {start_date} and {end_date}"
         )
 
-    # Remove timezone info from index for cleaner output
-    if data.index.tz is not None:
-        data.index = data.index.tz_localize(None)
-
     # Round numerical values to 2 decimal places for cleaner display
     numeric_columns = ["Open", "High", "Low", "Close", "Adj Close"]
     for col in numeric_columns:
@@ -667,37 +747,57 @@ def get_YFin_data_online(
     return header + csv_string
 
 
-def get_YFin_data(
+def get_YFin_data_summary(
     symbol: Annotated[str, "ticker symbol of the company"],
-    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
-    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "how many days to look back"],
+    online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
+    # calculate past days
+    date_obj = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = date_obj - relativedelta(days=look_back_days)
+    start_date = before.strftime("%Y-%m-%d")
 
-    if end_date > "2025-03-25":
-        raise Exception(
-            f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
+    if online:
+        records = get_cached_price_records(symbol.upper(), start_date, curr_date)
+        if records is None:
+            return f"No data found for symbol '{symbol}' between {start_date} and {curr_date}"
+        store_path = get_online_store_path(symbol.upper())
+    else:
+        store_path = ensure_price_store(
+            symbol, os.path.join(DATA_DIR, "market_data", "price_data")
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
+    data = slice_price_frame(load_price_frame(store_path), start_date, curr_date)
+
+    return (
+        f"## Price summary for {symbol.upper()} from {start_date} to {curr_date}:\n\n"
+        + summarize_price_frame(data)
+    )
 
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
 
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+def get_YFin_data(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+) -> str:
+    # the covered range comes from the data manifest rather than a fixed file name
+    entry = get_data_manifest(DATA_DIR).lookup(symbol, "price")
+    if entry is None:
+        raise Exception(f"Get_YFin_Data: no price data found for {symbol}")
+    data_start, data_end = entry.covered_range()
+    if data_end is not None and end_date > data_end:
+        raise Exception(
+            f"Get_YFin_Data: {end_date} is outside of the data range of {data_start} to {data_end}"
+        )
 
-    # remove the index from the dataframe
-    filtered_data = filtered_data.reset_index(drop=True)
+    # read the data between the start and end dates (inclusive) from the price store
+    filtered_data = get_price_frame(
+        symbol,
+        os.path.join(DATA_DIR, "market_data", "price_data"),
+        start_date,
+        end_date,
+    )
 
     return filtered_data
 
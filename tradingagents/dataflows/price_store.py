@@ -0,0 +1,268 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Annotated, Dict, Optional
+from .config import get_config
+from .data_manifest import PRICE_LAYOUT, get_data_manifest
+from .frame_cache import get_frame_cache
+from .indicator_state import refresh_indicator_state
+
+
+def get_price_store_dir() -> str:
+    """Directory holding the per-ticker columnar price files."""
+    config = get_config()
+    store_dir = os.path.join(config["data_cache_dir"], "price_store")
+    os.makedirs(store_dir, exist_ok=True)
+    return store_dir
+
+
+def get_price_store_path(symbol: Annotated[str, "ticker symbol of the company"]) -> str:
+    """Columnar price file of ``symbol`` inside the price store."""
+    return os.path.join(get_price_store_dir(), f"{symbol}.npy")
+
+
+def records_from_frame(data: pd.DataFrame) -> np.ndarray:
+    """
+    Convert a price DataFrame (as read from a YFin CSV) into a structured array
+    with a day-resolution "Date" field followed by one numeric field per column,
+    sorted by date with one bar per day.
+    """
+    if "Date" in data.columns:
+        dates = data["Date"]
+    else:
+        dates = data.index.to_series()
+    dates = pd.to_datetime(dates.astype(str).str[:10]).values.astype("datetime64[D]")
+
+    columns = [col for col in data.columns if col != "Date"]
+    dtype = [("Date", "datetime64[D]")] + [
+        (str(col), "i8" if pd.api.types.is_integer_dtype(data[col]) else "f8")
+        for col in columns
+    ]
+
+    records = np.empty(len(data), dtype=dtype)
+    records["Date"] = dates
+    for col in columns:
+        records[str(col)] = data[col].to_numpy()
+
+    records = records[np.argsort(records["Date"], kind="stable")]
+
+    # keep the last bar of any duplicated date
+    last = np.append(records["Date"][1:] != records["Date"][:-1], True)
+    return records[last]
+
+
+def write_price_records(path: str, records: np.ndarray) -> None:
+    """Atomically write a structured price array to ``path``."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, records, allow_pickle=False)
+    os.replace(tmp_path, path)
+
+
+def open_price_records(path: str) -> np.ndarray:
+    """Memory-map a structured price array written by ``write_price_records``."""
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+def price_source(path: Annotated[str, "path of a source file"]) -> Dict:
+    """Path, modification time and size of a source file, to tell when it changed."""
+    stat = os.stat(path)
+    return {"path": path, "mtime": stat.st_mtime, "size": stat.st_size}
+
+
+def _source_meta_path(store_path: str) -> str:
+    return os.path.splitext(store_path)[0] + ".source.json"
+
+
+def load_price_source(store_path: Annotated[str, "path of a columnar price file"]) -> Optional[Dict]:
+    """The ``price_source`` of the CSV a price file was built from, if recorded."""
+    meta_path = _source_meta_path(store_path)
+    if not os.path.exists(store_path) or not os.path.exists(meta_path):
+        return None
+    with open(meta_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_price_store(
+    csv_path: Annotated[str, "path of the YFin CSV to convert"],
+    store_path: Annotated[str, "path of the columnar file to write"],
+) -> None:
+    """Parse a YFin CSV once and persist it as a columnar price file."""
+    source = price_source(csv_path)
+    write_price_records(store_path, records_from_frame(pd.read_csv(csv_path)))
+
+    meta_path = _source_meta_path(store_path)
+    tmp_path = f"{meta_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(source, f)
+    os.replace(tmp_path, meta_path)
+
+
+def ensure_price_store(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_dir: Annotated[str, "directory where the YFin CSV files are stored"],
+) -> str:
+    """
+    Return the path of the columnar price file of ``symbol``. The file is
+    built from the YFin CSV on first use and rebuilt whenever the CSV it was
+    built from is replaced or changes (path, mtime or size).
+    """
+    csv_path = get_data_manifest(data_dir, PRICE_LAYOUT).path(symbol, "price")
+    store_path = get_price_store_path(symbol)
+
+    if csv_path is None:
+        if not os.path.exists(store_path):
+            raise FileNotFoundError(f"No price data found for {symbol} in {data_dir}")
+    elif load_price_source(store_path) != price_source(csv_path):
+        build_price_store(csv_path, store_path)
+
+    return store_path
+
+
+def get_price_records(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_dir: Annotated[str, "directory where the YFin CSV files are stored"],
+) -> np.ndarray:
+    """Return the memory-mapped price history of ``symbol``."""
+    return open_price_records(ensure_price_store(symbol, data_dir))
+
+
+def merge_price_records(existing: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """
+    Merge ``new`` bars into ``existing`` (new values win on duplicate dates),
+    keeping the layout of ``existing``. Fields missing from ``new`` are NaN.
+    """
+    if existing is None or len(existing) == 0:
+        return new[np.argsort(new["Date"], kind="stable")]
+
+    aligned = np.zeros(len(new), dtype=existing.dtype)
+    for name in existing.dtype.names:
+        if name in new.dtype.names:
+            aligned[name] = new[name]
+        elif aligned[name].dtype.kind == "f":
+            aligned[name] = np.nan
+
+    keep = ~np.isin(existing["Date"], aligned["Date"])
+    merged = np.concatenate([existing[keep], aligned])
+    return merged[np.argsort(merged["Date"], kind="stable")]
+
+
+def first_changed_position(old: np.ndarray, new: np.ndarray) -> int:
+    """
+    First position at which two price arrays of the same layout differ, NaN
+    equal to NaN; ``min(len(old), len(new))`` if one is a prefix of the other.
+    """
+    n = min(len(old), len(new))
+    changed = np.zeros(n, dtype=bool)
+    for name in old.dtype.names:
+        a, b = np.asarray(old[name][:n]), np.asarray(new[name][:n])
+        differs = a != b
+        if a.dtype.kind == "f":
+            differs &= ~(np.isnan(a) & np.isnan(b))
+        changed |= differs
+    return int(np.argmax(changed)) if changed.any() else n
+
+
+def append_price_records(
+    store_path: Annotated[str, "path of the columnar price file"],
+    new_records: Annotated[np.ndarray, "bars to append, as from records_from_frame"],
+) -> np.ndarray:
+    """
+    Merge newly arrived bars into a price store file and advance its persisted
+    indicator state by the appended bars only. If the merge revised or
+    inserted bars the state already consumed, the state is reseeded.
+    """
+    existing = open_price_records(store_path) if os.path.exists(store_path) else None
+    merged = merge_price_records(existing, new_records)
+    changed_from = 0 if existing is None else first_changed_position(existing, merged)
+    write_price_records(store_path, merged)
+
+    records = open_price_records(store_path)
+    refresh_indicator_state(store_path, records, changed_from)
+    return records
+
+
+def _date_bounds(
+    dates: np.ndarray,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+):
+    """Half-open positions of [start_date, end_date] in sorted datetime64 ``dates``."""
+    lo = 0
+    hi = len(dates)
+    if start_date is not None:
+        lo = np.searchsorted(dates, np.datetime64(start_date[:10], "D"), side="left")
+    if end_date is not None:
+        # first position past the end day, so intraday stamps on it are kept
+        end = np.datetime64(end_date[:10], "D") + np.timedelta64(1, "D")
+        hi = np.searchsorted(dates, end, side="left")
+    return lo, max(lo, hi)
+
+
+def slice_price_records(
+    records: np.ndarray,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> np.ndarray:
+    """Select the rows between ``start_date`` and ``end_date`` (inclusive)."""
+    lo, hi = _date_bounds(records["Date"], start_date, end_date)
+    return records[lo:hi]
+
+
+def slice_price_frame(
+    frame: pd.DataFrame,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Select the rows of a frame with a sorted DatetimeIndex between
+    ``start_date`` and ``end_date`` (inclusive) by binary search.
+    """
+    lo, hi = _date_bounds(frame.index.values, start_date, end_date)
+    return frame.iloc[lo:hi]
+
+
+def records_to_frame(records: np.ndarray) -> pd.DataFrame:
+    """Materialize a structured price array as a DataFrame with a YYYY-mm-dd Date column."""
+    frame = pd.DataFrame(
+        {name: np.asarray(records[name]) for name in records.dtype.names[1:]}
+    )
+    frame.insert(0, "Date", np.datetime_as_string(records["Date"], unit="D"))
+    return frame
+
+
+def _read_price_frame(path: str) -> pd.DataFrame:
+    records = open_price_records(path)
+    return pd.DataFrame(
+        {name: np.array(records[name]) for name in records.dtype.names[1:]},
+        index=pd.DatetimeIndex(records["Date"], name="Date"),
+    )
+
+
+def load_price_frame(
+    store_path: Annotated[str, "path of a columnar price file"],
+) -> pd.DataFrame:
+    """
+    Date-indexed frame of a price file, served from the process-wide frame
+    cache. The frame is shared and must not be modified.
+    """
+    return get_frame_cache().get(store_path, _read_price_frame)
+
+
+def frame_with_date_column(frame: pd.DataFrame) -> pd.DataFrame:
+    """Copy of a date-indexed frame with the dates as a YYYY-mm-dd "Date" column."""
+    out = frame.reset_index(drop=True)
+    out.insert(0, "Date", np.datetime_as_string(frame.index.values, unit="D"))
+    return out
+
+
+def get_price_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_dir: Annotated[str, "directory where the YFin CSV files are stored"],
+    start_date: Annotated[Optional[str], "Start date in yyyy-mm-dd format"] = None,
+    end_date: Annotated[Optional[str], "End date in yyyy-mm-dd format"] = None,
+) -> pd.DataFrame:
+    """Read the (optionally date-bounded) price history of ``symbol`` from the store."""
+    frame = load_price_frame(ensure_price_store(symbol, data_dir))
+    return frame_with_date_column(slice_price_frame(frame, start_date, end_date))
@@ -0,0 +1,133 @@
+"""
+Compact, aggregated description of a price window for LLM prompts.
+
+Instead of every daily bar, ``summarize_price_frame`` reports period returns,
+realized volatility, max drawdown, overnight gaps, volume z-scores and an OHLC
+table downsampled to a handful of rows, all computed with NumPy over the
+date-indexed frames of the price store.
+"""
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS_PER_YEAR = 252
+# trailing returns reported when the window is long enough, in bars
+RETURN_HORIZONS = ((5, "1w"), (21, "1m"), (63, "3m"))
+GAP_THRESHOLD = 0.01
+VOLUME_Z_THRESHOLD = 2.0
+
+
+def _fmt_pct(x: float) -> str:
+    return "N/A" if np.isnan(x) else f"{x * 100:+.2f}%"
+
+
+def _label(dates: np.ndarray, i: int) -> str:
+    return str(dates[i])[:10]
+
+
+def downsample_ohlc(frame: pd.DataFrame, max_rows: int = 12) -> pd.DataFrame:
+    """Aggregate consecutive bars into at most ``max_rows`` OHLCV rows."""
+    n = len(frame)
+    if n == 0:
+        return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+
+    starts = np.unique(np.linspace(0, n, min(max_rows, n) + 1).astype(np.int64))[:-1]
+    ends = np.append(starts[1:], n) - 1
+    dates = frame.index.values
+
+    return pd.DataFrame(
+        {
+            "Open": frame["Open"].to_numpy()[starts],
+            "High": np.fmax.reduceat(frame["High"].to_numpy(dtype=np.float64), starts),
+            "Low": np.fmin.reduceat(frame["Low"].to_numpy(dtype=np.float64), starts),
+            "Close": frame["Close"].to_numpy()[ends],
+            "Volume": np.add.reduceat(
+                np.nan_to_num(frame["Volume"].to_numpy(dtype=np.float64)), starts
+            ),
+        },
+        index=pd.Index(
+            [
+                _label(dates, s) if s == e else f"{_label(dates, s)}..{_label(dates, e)}"
+                for s, e in zip(starts, ends)
+            ],
+            name="Period",
+        ),
+    )
+
+
+def summarize_price_frame(frame: pd.DataFrame, max_rows: int = 12) -> str:
+    """
+    Summarize a date-indexed OHLCV frame (as served by the price store) in a
+    few lines of text.
+    """
+    if frame.empty:
+        return "No price data in the requested window."
+
+    dates = frame.index.values
+    open_ = frame["Open"].to_numpy(dtype=np.float64)
+    high = frame["High"].to_numpy(dtype=np.float64)
+    low = frame["Low"].to_numpy(dtype=np.float64)
+    close = frame["Close"].to_numpy(dtype=np.float64)
+    volume = frame["Volume"].to_numpy(dtype=np.float64)
+    n = len(close)
+
+    lines = [f"Bars: {n} ({_label(dates, 0)} to {_label(dates, n - 1)})"]
+
+    # returns
+    returns = [f"period {_fmt_pct(close[-1] / close[0] - 1)}"]
+    for bars, name in RETURN_HORIZONS:
+        if n > bars:
+            returns.append(f"{name} {_fmt_pct(close[-1] / close[-1 - bars] - 1)}")
+    lines.append(
+        f"Close: {close[-1]:.2f} (range {np.nanmin(low):.2f} - {np.nanmax(high):.2f}); "
+        "returns: " + ", ".join(returns)
+    )
+
+    # realized volatility of daily log returns
+    log_returns = np.diff(np.log(close))
+    if np.count_nonzero(~np.isnan(log_returns)) > 1:
+        daily_vol = np.nanstd(log_returns, ddof=1)
+        lines.append(
+            f"Realized volatility: {daily_vol * 100:.2f}% daily, "
+            f"{daily_vol * np.sqrt(TRADING_DAYS_PER_YEAR) * 100:.2f}% annualized"
+        )
+
+    # max drawdown from the running peak
+    running_peak = np.fmax.accumulate(close)
+    drawdown = close / running_peak - 1
+    trough = int(np.nanargmin(drawdown))
+    peak = int(np.nanargmax(close[: trough + 1]))
+    lines.append(
+        f"Max drawdown: {_fmt_pct(drawdown[trough])} "
+        f"(peak {_label(dates, peak)}, trough {_label(dates, trough)}); "
+        f"current drawdown {_fmt_pct(drawdown[-1])}"
+    )
+
+    # overnight gaps between the previous close and the open
+    if n > 1:
+        gaps = open_[1:] / close[:-1] - 1
+        up = int(np.count_nonzero(gaps > GAP_THRESHOLD))
+        down = int(np.count_nonzero(gaps < -GAP_THRESHOLD))
+        largest = int(np.nanargmax(np.abs(gaps))) if up or down else None
+        gap_line = f"Gaps over {GAP_THRESHOLD * 100:.0f}%: {up} up, {down} down"
+        if largest is not None:
+            gap_line += f"; largest {_fmt_pct(gaps[largest])} on {_label(dates, largest + 1)}"
+        lines.append(gap_line)
+
+    # volume z-scores against the window
+    volume_std = np.nanstd(volume, ddof=1) if n > 1 else np.nan
+    if volume_std and not np.isnan(volume_std):
+        z = (volume - np.nanmean(volume)) / volume_std
+        spike = int(np.nanargmax(z))
+        lines.append(
+            f"Volume z-score: latest {z[-1]:+.2f}, max {z[spike]:+.2f} on {_label(dates, spike)}, "
+            f"{int(np.count_nonzero(z > VOLUME_Z_THRESHOLD))} days above {VOLUME_Z_THRESHOLD:.0f}"
+        )
+
+    table = downsample_ohlc(frame, max_rows)
+    table["Volume"] = table["Volume"].astype(np.int64)
+    return (
+        "\n".join(f"- {line}" for line in lines)
+        + "\n\nOHLCV by period:\n"
+        + table.to_string(float_format=lambda x: f"{x:.2f}")
+    )
@@ -0,0 +1,186 @@
+"""
+Date and ticker index of the Reddit JSONL dumps.
+
+Every ``reddit_data/<category>/<subreddit>.jsonl`` file gets a sidecar index
+under ``data_cache_dir/reddit_index/<category>`` mapping each posting date
+(UTC, YYYY-mm-dd) to the byte ranges of its lines and, for company news, each
+ticker to the byte ranges of the posts that mention one of its aliases. The
+index is built with one pass over the file and rebuilt when the file's mtime or
+size (or the alias table) changes, so fetching the posts of one day, or of one
+company, seeks straight to them and only parses those lines.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .config import get_config
+from .ticker_matcher import AliasMatcher
+
+Ranges = Dict[str, List[Tuple[int, int]]]
+
+
+class RedditIndex:
+    """
+    Date -> byte ranges of the lines of one JSONL file and, when built with an
+    ``AliasMatcher``, ticker -> date -> byte ranges of the posts mentioning it.
+    """
+
+    def __init__(
+        self,
+        dates: Ranges,
+        tickers: Optional[Dict[str, Ranges]] = None,
+        fingerprint: Optional[str] = None,
+    ):
+        self.dates = dates
+        self.tickers = tickers
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_json(cls, index: Dict) -> "RedditIndex":
+        def ranges(runs_by_date):
+            return {date: [tuple(run) for run in runs] for date, runs in runs_by_date.items()}
+
+        tickers = index.get("tickers")
+        return cls(
+            ranges(index["dates"]),
+            {ticker: ranges(by_date) for ticker, by_date in tickers.items()}
+            if tickers is not None
+            else None,
+            index.get("fingerprint"),
+        )
+
+
+# path -> (mtime, size, index), the loaded sidecar indexes
+_indexes: Dict[str, Tuple[float, int, RedditIndex]] = {}
+
+
+def post_date(parsed_line: dict) -> str:
+    """Posting date of a Reddit post, YYYY-mm-dd in UTC."""
+    return datetime.utcfromtimestamp(parsed_line["created_utc"]).strftime("%Y-%m-%d")
+
+
+def get_reddit_index_path(data_file: str) -> str:
+    """Sidecar index of a JSONL file, inside the data cache."""
+    config = get_config()
+    category = os.path.basename(os.path.dirname(os.path.abspath(data_file)))
+    return os.path.join(
+        config["data_cache_dir"],
+        "reddit_index",
+        category,
+        os.path.basename(data_file) + ".index.json",
+    )
+
+
+def _add_line(runs_by_date: Dict[str, List[List[int]]], date: str, start: int, end: int):
+    runs = runs_by_date.setdefault(date, [])
+    if runs and runs[-1][1] == start:
+        runs[-1][1] = end
+    else:
+        runs.append([start, end])
+
+
+def build_reddit_index(data_file: str, matcher: Optional[AliasMatcher] = None) -> RedditIndex:
+    """
+    Scan ``data_file`` once and write its sidecar index. Consecutive lines of
+    the same date are merged into one [start, end) byte range. With a
+    ``matcher``, the posts mentioning each ticker are indexed as well.
+    """
+    ranges: Dict[str, List[List[int]]] = {}
+    tickers: Optional[Dict[str, Dict[str, List[List[int]]]]] = {} if matcher else None
+    stat = os.stat(data_file)
+
+    with open(data_file, "rb") as f:
+        offset = 0
+        for line in f:
+            start, offset = offset, offset + len(line)
+            # skip empty lines
+            if not line.strip():
+                continue
+            parsed_line = json.loads(line)
+            date = post_date(parsed_line)
+            _add_line(ranges, date, start, offset)
+            if matcher is not None:
+                for ticker in matcher.tickers_in(parsed_line["title"], parsed_line["selftext"]):
+                    _add_line(tickers.setdefault(ticker, {}), date, start, offset)
+
+    index = {
+        "source": os.path.abspath(data_file),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "fingerprint": matcher.fingerprint if matcher else None,
+        "dates": ranges,
+        "tickers": tickers,
+    }
+    index_path = get_reddit_index_path(data_file)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path)
+
+    loaded = RedditIndex.from_json(index)
+    _indexes[os.path.abspath(data_file)] = (stat.st_mtime, stat.st_size, loaded)
+    return loaded
+
+
+def load_reddit_index(data_file: str, matcher: Optional[AliasMatcher] = None) -> RedditIndex:
+    """
+    Index of ``data_file``, (re)building the sidecar when the file changed or,
+    if a ``matcher`` is given, when it was not built with the same alias table.
+    """
+    path = os.path.abspath(data_file)
+    stat = os.stat(path)
+
+    def usable(index: RedditIndex) -> bool:
+        return matcher is None or index.fingerprint == matcher.fingerprint
+
+    cached = _indexes.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size) and usable(cached[2]):
+        return cached[2]
+
+    index_path = get_reddit_index_path(path)
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if (index["source"], index["mtime"], index["size"]) == (
+            path,
+            stat.st_mtime,
+            stat.st_size,
+        ) and (matcher is None or index.get("fingerprint") == matcher.fingerprint):
+            loaded = RedditIndex.from_json(index)
+            _indexes[path] = (stat.st_mtime, stat.st_size, loaded)
+            return loaded
+    return build_reddit_index(path, matcher)
+
+
+def iter_posts_between(
+    data_file: str,
+    dates: List[str],
+    ticker: Optional[str] = None,
+    matcher: Optional[AliasMatcher] = None,
+) -> Iterator[Tuple[str, dict]]:
+    """
+    (date, parsed post) of every post of ``data_file`` created on one of
+    ``dates``, date by date and in file order within a date. The file is opened
+    once and only the lines of those dates are read. With a ``ticker`` (and the
+    ``matcher`` of its alias table) only the posts mentioning it are read.
+    """
+    index = load_reddit_index(data_file, matcher)
+    ranges = index.dates if ticker is None else index.tickers.get(ticker, {})
+    if not any(date in ranges for date in dates):
+        return
+    with open(data_file, "rb") as f:
+        for date in dates:
+            for start, end in ranges.get(date, ()):
+                f.seek(start)
+                for line in f.read(end - start).split(b"\n"):
+                    if line.strip():
+                        yield date, json.loads(line)
+
+
+def iter_posts_on(data_file: str, date: str) -> Iterator[dict]:
+    """Parsed posts of ``data_file`` created on ``date``, in file order."""
+    for _, post in iter_posts_between(data_file, [date]):
+        yield post
@@ -3,9 +3,18 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from typing import Annotated, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import atexit
+import multiprocessing
 import os
 import re
+import heapq
+
+from .config import get_config, set_config
+from .reddit_index import iter_posts_between
+from .ticker_matcher import AliasMatcher, aliases_from_company_names, load_ticker_aliases
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,87 +58,182 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
+_matchers: Dict[str, AliasMatcher] = {}
+
+
+def get_ticker_matcher(data_path: str) -> AliasMatcher:
+    """
+    Matcher of the alias table of a data folder: ``ticker_to_company`` plus its
+    optional ``ticker_aliases.json``. Rebuilt when that table changes.
+    """
+    aliases = load_ticker_aliases(data_path, aliases_from_company_names(ticker_to_company))
+    matcher = _matchers.get(data_path)
+    if matcher is None or matcher.aliases != aliases:
+        matcher = _matchers[data_path] = AliasMatcher(aliases)
+    return matcher
+
+
+def _top_posts_in_file(
+    data_file: str,
+    dates: List[str],
+    limit_per_subreddit: int,
+    ticker: Optional[str],
+    base_path: str,
+    config: Optional[dict] = None,
+) -> Dict[str, List[dict]]:
+    """
+    Top posts of every date of one subreddit file. Runs in pool workers too,
+    which are handed the caller's ``config`` with every file.
+    """
+    if config is not None:
+        set_config(config)
+    matcher = get_ticker_matcher(base_path) if ticker is not None else None
+    unlisted = None
+    if matcher is not None and ticker not in matcher.aliases:
+        # a ticker outside the alias table is its own alias, matched while reading
+        # so the shared index does not have to be rebuilt for it
+        unlisted = AliasMatcher({ticker: [ticker]})
+        ticker, matcher = None, None
+
+    # (upvotes, -position, post) min-heaps: on equal upvotes the earlier post wins
+    heaps = {date: [] for date in dates}
+    posts = iter_posts_between(data_file, dates, ticker, matcher)
+    if unlisted is not None:
+        posts = (
+            (date, parsed_line)
+            for date, parsed_line in posts
+            if unlisted.tickers_in(parsed_line["title"], parsed_line["selftext"])
+        )
+    for position, (date, parsed_line) in enumerate(posts):
+        item = (parsed_line["ups"], -position, parsed_line)
+        heap = heaps[date]
+        if len(heap) < limit_per_subreddit:
+            heapq.heappush(heap, item)
+        elif limit_per_subreddit and item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    top_posts = {}
+    for date, heap in heaps.items():
+        # sorted by upvotes in descending order
+        top_posts[date] = [
+            {
+                "title": parsed_line["title"],
+                "content": parsed_line["selftext"],
+                "url": parsed_line["url"],
+                "upvotes": parsed_line["ups"],
+                "posted_date": date,
+            }
+            for _, _, parsed_line in sorted(heap, key=lambda item: item[:2], reverse=True)
+        ]
+    return top_posts
+
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Shared process pool. Its workers are spawned rather than forked, since
+    this process may already run other threads (LLM clients, the graph).
+    Spawned workers re-import the main module, so the calling script must
+    keep its entry point under ``if __name__ == "__main__":``.
+    """
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return pool
+
+
+@atexit.register
+def _shutdown_pools():
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+
+def fetch_top_from_category_window(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
     ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
     query: Annotated[str, "Optional query to search for in the subreddit."] = None,
     data_path: Annotated[
         str,
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
-):
+    workers: Annotated[
+        int, "Processes scanning the subreddit files, 1 scans them in this process."
+    ] = 1,
+) -> Dict[str, List[dict]]:
+    """
+    Top posts of every day in [start_date, end_date], as fetch_top_from_category
+    returns them for that day. Each subreddit file is read once for the whole
+    window, and every (day, subreddit) keeps only its top posts in a bounded heap.
+    With several ``workers`` the files are spread over a process pool and their
+    top posts merged in file order, so the result does not depend on ``workers``.
+    """
     base_path = data_path
+    data_files = os.listdir(os.path.join(base_path, category))
 
-    all_content = []
-
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    if max_limit < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
-
-    for data_file in os.listdir(os.path.join(base_path, category)):
-        # check if data_file is a .jsonl file
-        if not data_file.endswith(".jsonl"):
-            continue
-
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
-
-                all_content_curr_subreddit.append(post)
+    limit_per_subreddit = max_limit // len(data_files)
+
+    first = datetime.strptime(start_date, "%Y-%m-%d")
+    dates = [
+        (first + timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range((datetime.strptime(end_date, "%Y-%m-%d") - first).days + 1)
+    ]
+
+    # if is company_news, only read the posts whose title or content mention the company (query),
+    # as found by the ticker index of each file
+    ticker = query if "company" in category and query else None
+
+    # check if data_file is a .jsonl file
+    paths = [
+        os.path.join(base_path, category, data_file)
+        for data_file in data_files
+        if data_file.endswith(".jsonl")
+    ]
+    args = (dates, limit_per_subreddit, ticker, base_path)
+    if workers > 1 and len(paths) > 1:
+        # the config goes with every file, so later set_config calls reach the workers
+        pool = _get_pool(workers)
+        per_file = list(
+            pool.map(_top_posts_in_file, paths, *(repeat(arg) for arg in args + (get_config(),)))
+        )
+    else:
+        per_file = [_top_posts_in_file(path, *args) for path in paths]
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    all_content = {date: [] for date in dates}
+    for top_posts in per_file:
+        for date, posts in top_posts.items():
+            all_content[date].extend(posts)
+    return all_content
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
-    return all_content
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+    workers: Annotated[
+        int, "Processes scanning the subreddit files, 1 scans them in this process."
+    ] = 1,
+):
+    return fetch_top_from_category_window(
+        category, date, date, max_limit, query, data_path, workers
+    )[date]
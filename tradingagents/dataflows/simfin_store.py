@@ -0,0 +1,316 @@
+"""
+Per-ticker store of the SimFin fundamentals.
+
+The SimFin bulk files (``us-{balance,cashflow,income}-{freq}.csv``) hold every
+US company, so reading one of them to answer a question about a single ticker
+is expensive. ``build_simfin_store`` converts a bulk file once into one pickle
+per ticker under ``data_cache_dir/simfin_store/{statement}-{freq}``, with the
+report and publish dates already parsed and the rows sorted by publish date.
+The bulk file is only read again when it changes, and each store is validated
+once per process. Point-in-time lookups then read only that ticker's rows, and
+``get_latest_simfin_statements_batch`` answers many (ticker, date) lookups with
+a single as-of merge.
+"""
+
+import json
+import os
+import re
+import shutil
+from typing import Annotated, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .frame_cache import get_frame_cache
+
+# statement directory -> file name stem of the SimFin bulk download
+SIMFIN_STATEMENTS = {
+    "balance_sheet": "balance",
+    "cash_flow": "cashflow",
+    "income_statements": "income",
+}
+
+
+def get_simfin_csv_path(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+) -> str:
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        statement,
+        "companies",
+        "us",
+        f"us-{SIMFIN_STATEMENTS[statement]}-{freq}.csv",
+    )
+
+
+def get_simfin_store_dir(statement: str, freq: str) -> str:
+    """Directory holding the per-ticker partitions of one statement file."""
+    config = get_config()
+    return os.path.join(config["data_cache_dir"], "simfin_store", f"{statement}-{freq}")
+
+
+def _partition_path(store_dir: str, ticker: str) -> str:
+    # keep ticker symbols such as BRK.B, but nothing that could escape the directory
+    return os.path.join(store_dir, re.sub(r"[^\w.\-]", "_", ticker) + ".pkl")
+
+
+def _index_path(store_dir: str) -> str:
+    return os.path.join(store_dir, "index.json")
+
+
+def build_simfin_store(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+) -> str:
+    """Split a SimFin bulk file into per-ticker partitions. Returns the store directory."""
+    csv_path = get_simfin_csv_path(data_dir, statement, freq)
+    store_dir = get_simfin_store_dir(statement, freq)
+
+    df = pd.read_csv(csv_path, sep=";")
+
+    # Convert date strings to datetime objects and remove any time components, once
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+    shutil.rmtree(store_dir, ignore_errors=True)
+    os.makedirs(store_dir)
+
+    tickers = []
+    for ticker, rows in df.groupby("Ticker", sort=False):
+        # the original row labels are kept so lookups match the bulk file
+        rows.sort_values("Publish Date", kind="stable").to_pickle(
+            _partition_path(store_dir, ticker)
+        )
+        tickers.append(ticker)
+
+    # the index is written last: it marks the partitions as complete
+    with open(_index_path(store_dir), "w", encoding="utf-8") as f:
+        json.dump(
+            {"source": csv_path, "mtime": os.path.getmtime(csv_path), "tickers": tickers}, f
+        )
+    return store_dir
+
+
+# store directory -> (source CSV, mtime) already validated in this process
+_checked_stores: Dict[str, Tuple[str, Optional[float]]] = {}
+
+
+def _ensure_simfin_store(data_dir: str, statement: str, freq: str) -> str:
+    csv_path = get_simfin_csv_path(data_dir, statement, freq)
+    store_dir = get_simfin_store_dir(statement, freq)
+    mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else None
+    if _checked_stores.get(store_dir) == (csv_path, mtime):
+        return store_dir
+
+    index_path = _index_path(store_dir)
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index["source"] != csv_path or (mtime is not None and mtime != index["mtime"]):
+            build_simfin_store(data_dir, statement, freq)
+    else:
+        build_simfin_store(data_dir, statement, freq)
+
+    _checked_stores[store_dir] = (csv_path, mtime)
+    return store_dir
+
+
+def load_simfin_statements(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    ticker: Annotated[str, "ticker symbol"],
+) -> Optional[pd.DataFrame]:
+    """All statements of ``ticker``, sorted by publish date, or None if it has none."""
+    return _load_partition(_ensure_simfin_store(data_dir, statement, freq), ticker)
+
+
+def _load_partition(store_dir: str, ticker: str) -> Optional[pd.DataFrame]:
+    path = _partition_path(store_dir, ticker)
+    if not os.path.exists(path):
+        return None
+    # partitions are shared through the frame cache and must not be modified
+    return get_frame_cache().get(path, pd.read_pickle)
+
+
+def get_latest_simfin_statement(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> Optional[pd.Series]:
+    """
+    The most recent statement of ``ticker`` published on or before ``curr_date``,
+    or None if there is none.
+    """
+    rows = load_simfin_statements(data_dir, statement, freq, ticker)
+    if rows is None:
+        return None
+
+    publish_dates = rows["Publish Date"].to_numpy(dtype="datetime64[ns]")
+    end = _published_until(publish_dates, curr_date)
+    if end == 0:
+        return None
+    # first row with the latest publish date, as idxmax would pick
+    first = np.searchsorted(publish_dates, publish_dates[end - 1], side="left")
+    return rows.iloc[first]
+
+
+def _published_until(publish_dates: np.ndarray, curr_date: str) -> int:
+    """Number of leading rows published on or before ``curr_date``."""
+    # Convert the current date to datetime and normalize
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    return int(np.searchsorted(publish_dates, curr_date_dt.to_datetime64(), side="right"))
+
+
+def get_simfin_statement_history(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    periods: Annotated[int, "number of trailing reporting periods"],
+) -> Optional[pd.DataFrame]:
+    """
+    The last ``periods`` reporting periods of ``ticker`` known on ``curr_date``,
+    oldest first: one row per report date, in its latest version published by
+    then. None if nothing was published yet.
+    """
+    rows = load_simfin_statements(data_dir, statement, freq, ticker)
+    if rows is None:
+        return None
+
+    end = _published_until(rows["Publish Date"].to_numpy(dtype="datetime64[ns]"), curr_date)
+    if end == 0:
+        return None
+    # rows are sorted by publish date, so the last one of a report date is its latest restatement
+    known = rows.iloc[:end].drop_duplicates("Report Date", keep="last")
+    return known.sort_values("Report Date", kind="stable").iloc[-periods:]
+
+
+def get_latest_simfin_statements(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    statements: Annotated[Tuple[str, ...], "statements to fetch"] = tuple(SIMFIN_STATEMENTS),
+) -> Dict[str, Optional[pd.Series]]:
+    """``get_latest_simfin_statement`` for several statements of one ticker, by statement."""
+    return {
+        statement: get_latest_simfin_statement(data_dir, statement, freq, ticker, curr_date)
+        for statement in statements
+    }
+
+
+def _normalize_dates(dates: Iterable) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(pd.to_datetime(list(dates), utc=True)).normalize()
+
+
+def _asof_positions(
+    statements: pd.DataFrame,
+    tickers: List[str],
+    dates: pd.DatetimeIndex,
+) -> np.ndarray:
+    """
+    Row position in ``statements`` of the latest statement of each query's
+    ticker published on or before its date (-1 if there is none), found with
+    one as-of merge.
+    """
+    positions = np.full(len(tickers), -1, dtype=np.int64)
+    if statements.empty or not len(tickers):
+        return positions
+
+    # on equal publish dates keep the first row, as idxmax does in the per-call path
+    published = (
+        pd.DataFrame(
+            {
+                "Ticker": statements["Ticker"].to_numpy(),
+                "Publish Date": statements["Publish Date"].array,
+                "_row": np.arange(len(statements)),
+            }
+        )
+        .dropna(subset=["Publish Date"])
+        .drop_duplicates(["Ticker", "Publish Date"], keep="first")
+        .sort_values("Publish Date", kind="stable")
+    )
+    queries = pd.DataFrame(
+        {"Ticker": tickers, "As Of": dates, "_query": np.arange(len(tickers))}
+    ).sort_values("As Of", kind="stable")
+
+    merged = pd.merge_asof(
+        queries,
+        published,
+        left_on="As Of",
+        right_on="Publish Date",
+        by="Ticker",
+        direction="backward",
+    )
+    positions[merged["_query"].to_numpy()] = merged["_row"].fillna(-1).to_numpy(dtype=np.int64)
+    return positions
+
+
+def get_latest_simfin_statements_batch(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    tickers: Annotated[List[str], "ticker symbol of every query"],
+    dates: Annotated[List[str], "as-of date of every query, yyyy-mm-dd"],
+) -> pd.DataFrame:
+    """
+    Point-in-time lookup for many (ticker, date) pairs at once.
+
+    Returns one row per query, in query order and indexed by
+    ("Query Ticker", "As Of"), holding the most recent statement published on or
+    before that date; queries without one get an all-NaN row.
+    """
+    tickers = list(tickers)
+    dates = _normalize_dates(dates)
+    if len(tickers) != len(dates):
+        raise ValueError("tickers and dates must have the same length")
+
+    store_dir = _ensure_simfin_store(data_dir, statement, freq)
+    partitions = [_load_partition(store_dir, ticker) for ticker in dict.fromkeys(tickers)]
+    partitions = [rows for rows in partitions if rows is not None]
+    statements = (
+        pd.concat(partitions) if partitions else pd.DataFrame(columns=["Ticker", "Publish Date"])
+    )
+
+    positions = _asof_positions(statements, tickers, dates)
+    matched = np.flatnonzero(positions >= 0)
+    result = (
+        statements.iloc[positions[matched]]
+        .set_axis(matched, axis=0)
+        .reindex(np.arange(len(tickers)))
+    )
+    result.index = pd.MultiIndex.from_arrays([tickers, dates], names=["Query Ticker", "As Of"])
+    return result
+
+
+def prefetch_simfin_statements(
+    data_dir: Annotated[str, "directory where the data is stored"],
+    tickers: Annotated[List[str], "ticker symbol of every query"],
+    dates: Annotated[List[str], "as-of date of every query, yyyy-mm-dd"],
+    statements: Annotated[Tuple[str, ...], "statements to fetch"] = tuple(SIMFIN_STATEMENTS),
+    freqs: Annotated[Tuple[str, ...], "reporting frequencies to fetch"] = ("annual", "quarterly"),
+) -> Dict[Tuple[str, str], pd.DataFrame]:
+    """
+    Resolve every (ticker, date) pair of a backtest up front for each statement
+    and frequency. The partitions read stay in the frame cache, so the per-call
+    SimFin tools served during the run do not touch the disk again. Statements
+    whose bulk file is not in ``data_dir`` are skipped.
+    """
+    return {
+        (statement, freq): get_latest_simfin_statements_batch(
+            data_dir, statement, freq, tickers, dates
+        )
+        for statement in statements
+        for freq in freqs
+        if os.path.exists(get_simfin_csv_path(data_dir, statement, freq))
+    }
@@ -1,12 +1,107 @@
+import numpy as np
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
-from typing import Annotated
-import os
-from .config import get_config
+from typing import Annotated, List
+from .indicators import compute_indicator, compute_indicators, is_supported
+from .indicator_state import IndicatorState, refresh_indicator_state
+from .price_store import (
+    frame_with_date_column,
+    get_price_records,
+    get_price_store_path,
+    load_price_frame,
+    records_to_frame,
+)
+from .trading_calendar import TradingCalendar, get_trading_calendar
+from .yfin_cache import (
+    get_cached_price_records,
+    get_online_history_range,
+    get_online_store_path,
+)
 
 
 class StockstatsUtils:
+    @staticmethod
+    def load_price_records(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> np.ndarray:
+        """Load the price history of a ticker as a date-sorted structured array."""
+        if not online:
+            try:
+                return get_price_records(symbol, data_dir)
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+
+        # Serve from the range-aware cache; only bars it does not cover yet are downloaded
+        start_date, end_date = get_online_history_range()
+        records = get_cached_price_records(symbol, start_date, end_date)
+        if records is None:
+            raise Exception(f"Stockstats fail: no Yahoo Finance data found for {symbol}")
+        return records
+
+    @staticmethod
+    def get_store_path(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        online: Annotated[bool, "whether the online cache or the offline store is used"] = False,
+    ) -> str:
+        return get_online_store_path(symbol) if online else get_price_store_path(symbol)
+
+    @staticmethod
+    def get_trading_calendar(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+        records: Annotated[np.ndarray, "already loaded price history"] = None,
+    ) -> TradingCalendar:
+        """Trading calendar built from the dates of the ticker's price store."""
+        if records is None:
+            records = StockstatsUtils.load_price_records(symbol, data_dir, online)
+        return get_trading_calendar(
+            StockstatsUtils.get_store_path(symbol, online), records
+        )
+
+    @staticmethod
+    def compute_indicator(
+        records: Annotated[np.ndarray, "price history from load_price_records"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        store_path: Annotated[
+            str, "price file ``records`` was read from, lets the fallback reuse its cached frame"
+        ] = None,
+    ) -> np.ndarray:
+        """Compute the full indicator series aligned with ``records``."""
+        if is_supported(indicator):
+            return compute_indicator(
+                indicator,
+                records["Close"],
+                records["High"],
+                records["Low"],
+                records["Volume"],
+                records["Open"],
+            )
+
+        # fall back to stockstats for indicators the NumPy engine does not cover;
+        # wrap() modifies its input, so it gets a copy of the shared cached frame
+        if store_path is not None:
+            df = wrap(frame_with_date_column(load_price_frame(store_path)))
+        else:
+            df = wrap(records_to_frame(records))
+        return df[indicator].values
+
     @staticmethod
     def get_stock_stats(
         symbol: Annotated[str, "ticker symbol for the company"],
@@ -25,63 +120,118 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
+        records = StockstatsUtils.load_price_records(symbol, data_dir, online)
+        calendar = StockstatsUtils.get_trading_calendar(
+            symbol, data_dir, online, records
+        )
 
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
+        idx = calendar.index_of(pd.to_datetime(curr_date).strftime("%Y-%m-%d"))
+        if idx is None:
+            return "N/A: Not a trading day (weekend or holiday)"
+
+        if idx == len(calendar) - 1 and indicator in IndicatorState.INDICATORS:
+            # the latest bar is served from the incrementally maintained state
+            state = refresh_indicator_state(
+                StockstatsUtils.get_store_path(symbol, online), records
             )
+            return state.values[indicator]
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
+        values = StockstatsUtils.compute_indicator(
+            records, indicator, StockstatsUtils.get_store_path(symbol, online)
+        )
+        indicator_value = values[idx]
+        return indicator_value
 
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.Series:
+        """
+        Compute the indicator series once and return its values for every trading
+        day between start_date and end_date (inclusive), indexed by YYYY-mm-dd.
+        """
+        records = StockstatsUtils.load_price_records(symbol, data_dir, online)
+        calendar = StockstatsUtils.get_trading_calendar(
+            symbol, data_dir, online, records
+        )
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        lo, hi = calendar.slice_indices(start_date, end_date)
+        if lo == hi:
+            # no trading days in the window: nothing to compute
+            return pd.Series(dtype=np.float64, name=indicator)
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
-            return indicator_value
-        else:
-            return "N/A: Not a trading day (weekend or holiday)"
+        values = StockstatsUtils.compute_indicator(
+            records, indicator, StockstatsUtils.get_store_path(symbol, online)
+        )
+        return pd.Series(
+            values[lo:hi],
+            index=calendar.trading_days(start_date, end_date),
+            name=indicator,
+        )
+
+    @staticmethod
+    def get_stock_stats_batch(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            List[str],
+            "quantitative indicators based off of the stock data for the company",
+        ],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """
+        Compute several indicators in one pass over the price data and return a
+        date-by-indicator frame for the trading days between start_date and end_date.
+        """
+        records = StockstatsUtils.load_price_records(symbol, data_dir, online)
+        calendar = StockstatsUtils.get_trading_calendar(
+            symbol, data_dir, online, records
+        )
+
+        lo, hi = calendar.slice_indices(start_date, end_date)
+        if lo == hi:
+            # no trading days in the window: nothing to compute
+            return pd.DataFrame(
+                columns=list(indicators), index=pd.Index([], name="Date"), dtype=np.float64
+            )
+
+        native = [ind for ind in indicators if is_supported(ind)]
+        values = compute_indicators(
+            native,
+            records["Close"],
+            records["High"],
+            records["Low"],
+            records["Volume"],
+            records["Open"],
+        )
+        for indicator in indicators:
+            if indicator not in values:
+                values[indicator] = StockstatsUtils.compute_indicator(
+                    records, indicator, StockstatsUtils.get_store_path(symbol, online)
+                )
+
+        return pd.DataFrame(
+            {indicator: values[indicator][lo:hi] for indicator in indicators},
+            index=pd.Index(calendar.trading_days(start_date, end_date), name="Date"),
+        )
@@ -0,0 +1,123 @@
+"""
+Multi-pattern matching of company aliases in free text.
+
+``AliasMatcher`` finds every ticker whose aliases occur in a text, in a few
+passes of compiled regular expressions instead of one ``re.search`` per alias.
+The aliases are split into prefix-free layers, and each layer is compiled into
+a single trie-shaped pattern scanned with a zero-width lookahead. Every
+occurrence of every alias is therefore reported, including aliases that
+overlap or are prefixes of one another (e.g. "Square" and "Squarespace"), like
+an Aho-Corasick automaton would, while the scanning runs inside the regex
+engine. Aliases too short to be told apart from ordinary words (tickers such
+as V or X) only match as whole cashtags, e.g. "$V" but not "$VOO".
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Set
+
+ALIAS_FILE = "ticker_aliases.json"
+
+# shorter aliases are only matched as cashtags
+MIN_ALIAS_LENGTH = 3
+
+
+def aliases_from_company_names(ticker_to_company: Dict[str, str]) -> Dict[str, List[str]]:
+    """Alias table of a ticker -> "Name OR Other Name" map, the ticker included."""
+    return {
+        ticker: names.split(" OR ") + [ticker] if "OR" in names else [names, ticker]
+        for ticker, names in ticker_to_company.items()
+    }
+
+
+def load_ticker_aliases(
+    data_path: str, defaults: Dict[str, List[str]]
+) -> Dict[str, List[str]]:
+    """
+    ``defaults`` extended with the optional ``ticker_aliases.json`` of a data
+    folder, a {ticker: [alias, ...]} map that can cover the whole universe.
+    """
+    aliases = {ticker: list(names) for ticker, names in defaults.items()}
+    path = os.path.join(data_path, ALIAS_FILE)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for ticker, names in json.load(f).items():
+                known = aliases.setdefault(ticker, [ticker])
+                known.extend(name for name in names if name not in known)
+    return aliases
+
+
+def _search_term(alias: str) -> str:
+    """The text an alias is searched as: itself, or its cashtag if it is too short."""
+    if len(alias.strip()) < MIN_ALIAS_LENGTH and not alias.startswith("$"):
+        return "$" + alias.strip()
+    return alias
+
+
+def _prefix_free_layers(terms: Iterable[str]) -> List[Set[str]]:
+    """Split ``terms`` into layers in which no term is a prefix of another."""
+    layers: List[Set[str]] = []
+    for term in sorted(set(terms), key=len):
+        for layer in layers:
+            # shorter terms are placed first, so only they can be prefixes of this one
+            if not any(term[:i] in layer for i in range(1, len(term) + 1)):
+                layer.add(term)
+                break
+        else:
+            layers.append({term})
+    return layers
+
+
+def _trie_pattern(terms: Set[str]) -> str:
+    """Regex matching exactly the prefix-free ``terms``, factored along their trie."""
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+
+    def pattern(node: Dict) -> str:
+        branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items())]
+        if len(branches) <= 1:
+            return "".join(branches)
+        return "(?:" + "|".join(branches) + ")"
+
+    return pattern(trie)
+
+
+class AliasMatcher:
+    """Tickers mentioned in a text, by case-insensitive substring match of their aliases."""
+
+    def __init__(self, aliases: Dict[str, List[str]]):
+        self.aliases = aliases
+        self._owners: Dict[str, Set[str]] = {}
+        for ticker, names in aliases.items():
+            for name in names:
+                if name.strip():
+                    self._owners.setdefault(_search_term(name).lower(), set()).add(ticker)
+
+        self._patterns = [
+            re.compile(f"(?=({_trie_pattern(layer)}))", re.IGNORECASE)
+            for layer in _prefix_free_layers(self._owners)
+        ]
+        # identifies the searched terms, so indexes built with other ones are rebuilt
+        self.fingerprint = hashlib.sha1(
+            json.dumps(
+                {term: sorted(owners) for term, owners in self._owners.items()},
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def tickers_in(self, *texts: str) -> Set[str]:
+        found: Set[str] = set()
+        for pattern in self._patterns:
+            for text in texts:
+                for match in pattern.finditer(text):
+                    term = match.group(1)
+                    # a cashtag ends the symbol: "$V" is not a mention in "$VOO"
+                    if term.startswith("$") and text[match.end(1) : match.end(1) + 1].isalpha():
+                        continue
+                    found |= self._owners.get(term.lower(), set())
+        return found
@@ -0,0 +1,81 @@
+import os
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .price_store import open_price_records
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+_EPOCH = date(1970, 1, 1).toordinal()
+
+
+def _to_day(value: DateLike) -> int:
+    """Days since 1970-01-01 for a YYYY-mm-dd string or date-like value."""
+    if isinstance(value, np.datetime64):
+        return int(value.astype("datetime64[D]").astype(np.int64))
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return value.toordinal() - _EPOCH
+
+
+class TradingCalendar:
+    """
+    Sorted index of the days a ticker actually traded, as recorded in its price
+    store. All lookups are bisects over a precomputed list of day numbers.
+    """
+
+    def __init__(self, dates: np.ndarray):
+        # price store dates are already sorted with one bar per day, so
+        # calendar positions line up with record positions
+        days = np.asarray(dates, dtype="datetime64[D]")
+        self._days: List[int] = days.astype(np.int64).tolist()
+        self._labels: List[str] = np.datetime_as_string(days, unit="D").tolist()
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def index_of(self, value: DateLike) -> Optional[int]:
+        """Position of ``value`` in the calendar, or None if it is not a trading day."""
+        day = _to_day(value)
+        idx = bisect_left(self._days, day)
+        if idx < len(self._days) and self._days[idx] == day:
+            return idx
+        return None
+
+    def slice_indices(self, start: DateLike, end: DateLike) -> Tuple[int, int]:
+        """Half-open index range of the trading days between start and end (inclusive)."""
+        lo = bisect_left(self._days, _to_day(start))
+        hi = bisect_right(self._days, _to_day(end))
+        return lo, max(lo, hi)
+
+    def trading_days(self, start: DateLike, end: DateLike) -> List[str]:
+        """Trading days between start and end (inclusive), as YYYY-mm-dd strings."""
+        lo, hi = self.slice_indices(start, end)
+        return self._labels[lo:hi]
+
+
+_calendars: Dict[str, Tuple[float, TradingCalendar]] = {}
+
+
+def get_trading_calendar(
+    store_path: str, records: Optional[np.ndarray] = None
+) -> TradingCalendar:
+    """
+    Calendar of a price store file, built once per file version (mtime) and
+    shared across calls.
+    """
+    mtime = os.path.getmtime(store_path)
+    cached = _calendars.get(store_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    if records is None:
+        records = open_price_records(store_path)
+    calendar = TradingCalendar(records["Date"])
+    _calendars[store_path] = (mtime, calendar)
+    return calendar
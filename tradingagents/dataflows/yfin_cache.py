@@ -0,0 +1,373 @@
+import glob
+import json
+import os
+import time
+from typing import Annotated, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .data_manifest import PRICE_LAYOUT, get_data_manifest
+from .indicator_state import get_state_path
+from .price_store import (
+    append_price_records,
+    open_price_records,
+    records_from_frame,
+    slice_price_frame,
+)
+
+# (symbols, start_date, end_date inclusive) -> {symbol: daily bars}
+PriceDownloader = Callable[[List[str], str, str], Dict[str, pd.DataFrame]]
+
+# the online stockstats tools look back this many years
+ONLINE_HISTORY_YEARS = 15
+
+# hour (New York time) after which the day's bar is taken as final, leaving a
+# margin after the 16:00 close for the provider to settle it
+SESSION_FINAL_HOUR = 18
+
+# relative tolerance when comparing a re-downloaded bar with the cached one
+BAR_RTOL = 1e-4
+
+# seconds during which a range that reaches into the open session is served
+# from the cache before its partial bar is downloaded again
+PARTIAL_BAR_TTL = 300
+
+# (symbol, start_date, end_date) -> monotonic time of its last download
+_partial_refreshed: Dict[Tuple[str, str, str], float] = {}
+
+
+def get_online_store_dir() -> str:
+    """Directory holding the per-ticker online (yfinance) price cache."""
+    config = get_config()
+    store_dir = os.path.join(config["data_cache_dir"], "online_price_store")
+    os.makedirs(store_dir, exist_ok=True)
+    return store_dir
+
+
+def get_online_store_path(symbol: Annotated[str, "ticker symbol of the company"]) -> str:
+    return os.path.join(get_online_store_dir(), f"{symbol.upper()}.npy")
+
+
+def _meta_path(store_path: str) -> str:
+    return os.path.splitext(store_path)[0] + ".meta.json"
+
+
+def load_covered_range(store_path: str) -> Optional[dict]:
+    """Return the {"start", "end"} date range (inclusive) a cache file covers."""
+    meta_path = _meta_path(store_path)
+    if not os.path.exists(store_path) or not os.path.exists(meta_path):
+        return None
+    with open(meta_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_covered_range(store_path: str, start_date: str, end_date: str) -> None:
+    meta_path = _meta_path(store_path)
+    tmp_path = f"{meta_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"start": start_date, "end": end_date}, f)
+    os.replace(tmp_path, meta_path)
+
+
+def last_completed_session() -> str:
+    """Latest date whose daily bar can no longer change intraday."""
+    now = pd.Timestamp.now(tz="America/New_York")
+    day = now.normalize()
+    if now.hour < SESSION_FINAL_HOUR:
+        day -= pd.Timedelta(days=1)
+    return day.strftime("%Y-%m-%d")
+
+
+def _shift_date(value: str, days: int) -> str:
+    return (pd.Timestamp(value) + pd.Timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def missing_price_ranges(
+    store_path: Annotated[str, "path of a cache file"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> List[Tuple[str, str]]:
+    """
+    The (start, end) ranges to download so the cache file covers
+    [start_date, end_date]. A range next to the covered one reaches into it up
+    to the nearest cached bar, so every download overlaps the cache by one bar
+    and ``agrees_with_cache`` can tell whether the adjustment basis moved.
+    """
+    covered = load_covered_range(store_path)
+    if covered is None:
+        return [(start_date, end_date)]
+
+    dates = np.datetime_as_string(open_price_records(store_path)["Date"], unit="D")
+    inside = dates[(dates >= covered["start"]) & (dates <= covered["end"])]
+
+    ranges = []
+    if start_date < covered["start"]:
+        head_end = inside[0] if len(inside) else _shift_date(covered["start"], -1)
+        ranges.append((start_date, str(head_end)))
+    if end_date > covered["end"]:
+        tail_start = inside[-1] if len(inside) else _shift_date(covered["end"], 1)
+        ranges.append((str(tail_start), end_date))
+    return ranges
+
+
+def agrees_with_cache(
+    store_path: Annotated[str, "path of a cache file"],
+    data: Annotated[Optional[pd.DataFrame], "downloaded bars"],
+) -> bool:
+    """
+    Whether the downloaded bars that fall in the covered range match the
+    cached ones. They stop matching when a split or dividend moved the
+    adjustment basis of the whole history since it was cached.
+    """
+    covered = load_covered_range(store_path)
+    if covered is None or data is None or data.empty:
+        return True
+
+    cached = open_price_records(store_path)
+    new = records_from_frame(data)
+    new_dates = np.datetime_as_string(new["Date"], unit="D")
+    new = new[(new_dates >= covered["start"]) & (new_dates <= covered["end"])]
+    _, cached_pos, new_pos = np.intersect1d(
+        cached["Date"], new["Date"], assume_unique=True, return_indices=True
+    )
+
+    for name in ("Open", "High", "Low", "Close", "Volume"):
+        if name not in cached.dtype.names or name not in new.dtype.names:
+            continue
+        old_values = np.asarray(cached[name][cached_pos], dtype=np.float64)
+        new_values = np.asarray(new[name][new_pos], dtype=np.float64)
+        if not np.allclose(old_values, new_values, rtol=BAR_RTOL, equal_nan=True):
+            return False
+    return True
+
+
+def drop_cached_prices(symbol: Annotated[str, "ticker symbol of the company"]) -> None:
+    """Remove the cache file of ``symbol`` with its covered range and indicator state."""
+    store_path = get_online_store_path(symbol)
+    for path in (store_path, _meta_path(store_path), get_state_path(store_path)):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _remove_legacy_cache_files(symbol: str) -> None:
+    """Drop the per-day ``{symbol}-YFin-data-{start}-{end}.csv`` files of the old cache."""
+    config = get_config()
+    pattern = os.path.join(config["data_cache_dir"], f"{symbol}-YFin-data-*-*.csv")
+    for path in glob.glob(pattern):
+        os.remove(path)
+
+
+def download_price_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> pd.DataFrame:
+    """Download daily bars for [start_date, end_date] from Yahoo Finance."""
+    # yfinance treats end as exclusive
+    end_exclusive = (pd.Timestamp(end_date) + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_exclusive,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    return data.reset_index()
+
+
+def store_price_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data: Annotated[pd.DataFrame, "downloaded bars with a Date column or index"],
+    start_date: Annotated[str, "first date the download covered, yyyy-mm-dd"],
+    end_date: Annotated[str, "last date the download covered, yyyy-mm-dd"],
+) -> Optional[np.ndarray]:
+    """
+    Merge downloaded bars into the ticker's cache file and widen the covered
+    range to include [start_date, end_date]. The covered range never extends
+    past the last completed session, so a partial intraday bar is fetched again.
+    An empty download leaves the covered range alone. Returns None when
+    nothing is cached for ``symbol``.
+    """
+    store_path = get_online_store_path(symbol)
+    covered = load_covered_range(store_path)
+    end_date = min(end_date, last_completed_session())
+
+    if data is None or data.empty:
+        # a failed request or a ticker missing from a batch looks the same as
+        # a range without bars, so the range is not marked as covered
+        return open_price_records(store_path) if os.path.exists(store_path) else None
+
+    records = append_price_records(store_path, records_from_frame(data))
+
+    if covered is not None:
+        start_date = min(start_date, covered["start"])
+        end_date = max(end_date, covered["end"])
+    if start_date <= end_date:
+        _save_covered_range(store_path, start_date, end_date)
+    return records
+
+
+def get_cached_price_records(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> Optional[np.ndarray]:
+    """
+    Return the cached price history of ``symbol`` covering [start_date, end_date],
+    or None when nothing could be downloaded for it. Only the bars outside the range already covered by the cache are
+    downloaded, plus one overlapping bar. If that bar changed, the history was
+    re-adjusted upstream and the whole range is downloaded again.
+    """
+    store_path = get_online_store_path(symbol)
+    covered = load_covered_range(store_path)
+    if covered is None:
+        _remove_legacy_cache_files(symbol)
+
+    key = (symbol.upper(), start_date, end_date)
+    refreshed = _partial_refreshed.get(key)
+    if refreshed is not None and time.monotonic() - refreshed < PARTIAL_BAR_TTL:
+        return open_price_records(store_path) if os.path.exists(store_path) else None
+    if end_date > last_completed_session():
+        _partial_refreshed[key] = time.monotonic()
+
+    records = None
+    for fetch_start, fetch_end in missing_price_ranges(store_path, start_date, end_date):
+        data = download_price_frame(symbol, fetch_start, fetch_end)
+        if not agrees_with_cache(store_path, data):
+            full_start = min(start_date, covered["start"])
+            full_end = max(end_date, covered["end"])
+            drop_cached_prices(symbol)
+            return store_price_frame(
+                symbol, download_price_frame(symbol, full_start, full_end), full_start, full_end
+            )
+        records = store_price_frame(symbol, data, fetch_start, fetch_end)
+
+    if records is None and os.path.exists(store_path):
+        records = open_price_records(store_path)
+    return records
+
+
+def get_online_history_range() -> tuple:
+    """The (start, end) range the online indicator tools read, ending today."""
+    today = pd.Timestamp.today()
+    start_date = today - pd.DateOffset(years=ONLINE_HISTORY_YEARS)
+    return start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+
+
+def download_price_frames(
+    symbols: Annotated[List[str], "ticker symbols to download together"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> Dict[str, pd.DataFrame]:
+    """Download daily bars for several tickers with a single Yahoo Finance request."""
+    end_exclusive = (pd.Timestamp(end_date) + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    data = yf.download(
+        symbols,
+        start=start_date,
+        end=end_exclusive,
+        group_by="ticker",
+        progress=False,
+        auto_adjust=True,
+        threads=True,
+    )
+
+    frames = {}
+    for symbol in symbols:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            frame = data[symbol]
+        else:
+            # a single ticker comes back with flat columns
+            frame = data
+        frames[symbol] = frame.dropna(how="all").reset_index()
+    return frames
+
+
+def make_csv_downloader(
+    price_data_dir: Annotated[str, "directory holding the offline YFin CSV files"],
+) -> PriceDownloader:
+    """
+    Stand-in for ``download_price_frames`` that reads the offline CSV files
+    instead of calling Yahoo Finance, so prefetching works without network access.
+    """
+
+    def download(symbols, start_date, end_date):
+        manifest = get_data_manifest(price_data_dir, PRICE_LAYOUT)
+        frames = {}
+        for symbol in symbols:
+            path = manifest.path(symbol, "price")
+            if path is None:
+                continue
+            data = pd.read_csv(path, index_col="Date", parse_dates=True).sort_index()
+            frames[symbol] = slice_price_frame(data, start_date, end_date).reset_index()
+        return frames
+
+    return download
+
+
+def prefetch_prices(
+    tickers: Annotated[List[str], "ticker symbols to warm the cache for"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"] = None,
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"] = None,
+    downloader: Annotated[
+        PriceDownloader, "batched downloader, defaults to download_price_frames"
+    ] = None,
+) -> Dict[str, int]:
+    """
+    Warm the online price cache for a watchlist with one batched download.
+
+    Tickers whose cache already covers [start_date, end_date] are skipped; the
+    rest are fetched together over the union of their missing ranges, and the
+    result is split into the per-ticker cache files. Later get_YFin_data_online
+    and online stockstats calls are then served from the cache. The range
+    defaults to the history the online indicator tools read.
+
+    Returns the number of cached bars per ticker.
+    """
+    if start_date is None or end_date is None:
+        default_start, default_end = get_online_history_range()
+        start_date = start_date or default_start
+        end_date = end_date or default_end
+    downloader = downloader or download_price_frames
+
+    symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+
+    # only the part of the range each ticker is missing needs downloading, by
+    # the same rule as get_cached_price_records, overlap bar included
+    fetch_start, fetch_end, pending = None, None, []
+    for symbol in symbols:
+        store_path = get_online_store_path(symbol)
+        if load_covered_range(store_path) is None:
+            _remove_legacy_cache_files(symbol)
+        missing = missing_price_ranges(store_path, start_date, end_date)
+        if not missing:
+            continue
+        pending.append(symbol)
+        # the ranges are ordered: head before tail
+        fetch_start = min(fetch_start or missing[0][0], missing[0][0])
+        fetch_end = max(fetch_end or missing[-1][1], missing[-1][1])
+
+    frames = downloader(pending, fetch_start, fetch_end) if pending else {}
+
+    cached = {}
+    for symbol in symbols:
+        store_path = get_online_store_path(symbol)
+        if symbol not in pending:
+            records = open_price_records(store_path)
+        elif agrees_with_cache(store_path, frames.get(symbol)):
+            records = store_price_frame(symbol, frames.get(symbol), fetch_start, fetch_end)
+        else:
+            # re-adjusted upstream since it was cached: download its whole range again
+            covered = load_covered_range(store_path)
+            full_start = min(start_date, covered["start"])
+            full_end = max(end_date, covered["end"])
+            drop_cached_prices(symbol)
+            data = downloader([symbol], full_start, full_end).get(symbol)
+            records = store_price_frame(symbol, data, full_start, full_end)
+        cached[symbol] = 0 if records is None else len(records)
+    return cached
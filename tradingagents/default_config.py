@@ -8,6 +8,12 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # size budget of the in-process cache of parsed price frames
+    "price_frame_cache_bytes": 256 * 1024 * 1024,
+    # processes scanning the Reddit subreddit files, 1 scans them in-process.
+    # The workers are spawned and re-import the main module, so with more than
+    # one the entry script must guard its code with `if __name__ == "__main__":`
+    "reddit_scan_workers": 1,
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "o4-mini",
@@ -6,6 +6,7 @@ import json
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
+import pandas as pd
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -20,7 +21,8 @@ from tradingagents.agents.utils.agent_states import (
     InvestDebateState,
     RiskDebateState,
 )
-from tradingagents.dataflows.interface import set_config
+from tradingagents.dataflows.interface import set_config, prefetch_prices
+from tradingagents.dataflows.simfin_store import prefetch_simfin_statements
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
@@ -116,10 +118,14 @@ class TradingAgentsGraph:
                 [
                     # online tools
                     self.toolkit.get_YFin_data_online,
+                    self.toolkit.get_YFin_data_summary_online,
                     self.toolkit.get_stockstats_indicators_report_online,
+                    self.toolkit.get_stockstats_indicators_batch_report_online,
                     # offline tools
                     self.toolkit.get_YFin_data,
+                    self.toolkit.get_YFin_data_summary,
                     self.toolkit.get_stockstats_indicators_report,
+                    self.toolkit.get_stockstats_indicators_batch_report,
                 ]
             ),
             "social": ToolNode(
@@ -145,8 +151,11 @@ class TradingAgentsGraph:
                     # online tools
                     self.toolkit.get_fundamentals_openai,
                     # offline tools
+                    self.toolkit.get_fundamental_ratios,
                     self.toolkit.get_finnhub_company_insider_sentiment,
                     self.toolkit.get_finnhub_company_insider_transactions,
+                    self.toolkit.get_simfin_financial_statements,
+                    self.toolkit.get_simfin_statement_trend,
                     self.toolkit.get_simfin_balance_sheet,
                     self.toolkit.get_simfin_cashflow,
                     self.toolkit.get_simfin_income_stmt,
@@ -154,6 +163,30 @@ class TradingAgentsGraph:
             ),
         }
 
+    def prefetch(self, company_names, start_date=None, end_date=None):
+        """Warm the data caches for a watchlist before propagating each ticker.
+
+        Online, the price cache is filled with one batched download. Offline,
+        the SimFin statements of every ticker are resolved for each business
+        day of the run, which keeps their store partitions in the frame cache.
+
+        Args:
+            company_names: Tickers that will be propagated
+            start_date: First date to cache, defaults to the online indicator
+                look-back (online) or to end_date (offline)
+            end_date: Last date to cache, defaults to today
+        """
+        if self.config["online_tools"]:
+            return prefetch_prices(company_names, start_date, end_date)
+
+        end_date = end_date or date.today().strftime("%Y-%m-%d")
+        trade_dates = pd.bdate_range(start_date or end_date, end_date).strftime("%Y-%m-%d")
+        return prefetch_simfin_statements(
+            self.config["data_dir"],
+            [ticker for ticker in company_names for _ in trade_dates],
+            [trade_date for _ in company_names for trade_date in trade_dates],
+        )
+
     def propagate(self, company_name, trade_date):
         """Run the trading agents graph for a company on a specific date."""
 